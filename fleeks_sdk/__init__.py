@@ -21,152 +21,310 @@ __version__ = "0.7.2"
 __author__ = "Fleeks Inc"
 __email__ = "support@fleeks.com"
 
-# Core client and utilities
-from .client import FleeksClient, create_client
-from .config import Config
-from .auth import APIKeyAuth
+import importlib
+from typing import TYPE_CHECKING
 
-# Service managers
-from .workspaces import WorkspaceManager
-from .agents import AgentManager
-from .files import FileManager
-from .terminal import TerminalManager
-from .containers import ContainerManager
-from .streaming import StreamingClient
-from .embeds import EmbedManager
-from .deploy import DeployManager
-from .schedules import ScheduleManager
-from .channels import ChannelManager
-from .automations import AutomationManager
-from .previews import PreviewManager
+# Public names are resolved lazily (PEP 562) so ``import fleeks_sdk`` does not
+# pull in httpx, socketio and every manager module up front. The imports
+# below are what static analyzers and IDEs see; ``_LAZY`` is what runs.
 
-# AI Keys (BYOK)
-from .ai_keys import AIKeysManager
+if TYPE_CHECKING:
+    # Core client and utilities
+    from .client import FleeksClient, create_client
+    from .config import Config
+    from .auth import APIKeyAuth
+    from .retry import RetryPolicy
 
-# Voice
-from .voice import VoiceManager, VoiceSession
+    # Service managers
+    from .workspaces import WorkspaceManager
+    from .agents import AgentManager
+    from .files import FileManager
+    from .terminal import TerminalManager
+    from .containers import ContainerManager
+    from .streaming import StreamingClient
+    from .embeds import EmbedManager
+    from .deploy import DeployManager
+    from .schedules import ScheduleManager
+    from .channels import ChannelManager
+    from .automations import AutomationManager
+    from .previews import PreviewManager
 
-# Lifecycle management
-from .lifecycle import (
-    IdleAction,
-    LifecycleState,
-    LifecycleConfig,
-    HeartbeatResponse,
-    TimeoutExtensionResponse,
-    KeepAliveResponse,
-    HibernationResponse,
-    LifecycleStatus,
-    TIER_LIMITS
-)
+    # AI Keys (BYOK)
+    from .ai_keys import AIKeysManager
 
-# Embed types and models
-from .embeds import (
-    EmbedTemplate,
-    DisplayMode,
-    EmbedLayoutPreset,
-    EmbedTheme,
-    EmbedStatus,
-    EmbedSettings,
-    EmbedFile,
-    EmbedInfo,
-    EmbedSession,
-    EmbedAnalytics,
-    Embed
-)
+    # Voice
+    from .voice import VoiceManager, VoiceSession
 
-# Exceptions
-from .exceptions import (
-    FleeksException,
-    FleeksAPIError,
-    FleeksRateLimitError,
-    FleeksAuthenticationError,
-    FleeksPermissionError,
-    FleeksResourceNotFoundError,
-    FleeksValidationError,
-    FleeksFeatureUnsupportedError,
-    FleeksConnectionError,
-    FleeksStreamingError,
-    FleeksTimeoutError,
-    WorkspaceNotReadyError,
-)
+    # Lifecycle management
+    from .lifecycle import (
+        IdleAction,
+        LifecycleState,
+        LifecycleConfig,
+        HeartbeatResponse,
+        TimeoutExtensionResponse,
+        KeepAliveResponse,
+        HibernationResponse,
+        LifecycleStatus,
+        TierLimit,
+        TIER_LIMITS
+    )
+
+    # Embed types and models
+    from .embeds import (
+        EmbedTemplate,
+        DisplayMode,
+        EmbedLayoutPreset,
+        EmbedTheme,
+        EmbedStatus,
+        EmbedSettings,
+        EmbedFile,
+        EmbedInfo,
+        EmbedSession,
+        EmbedAnalytics,
+        Embed,
+        validate_template,
+        validate_display_mode
+    )
+
+    # Exceptions
+    from .exceptions import (
+        FleeksException,
+        FleeksAPIError,
+        FleeksRateLimitError,
+        FleeksAuthenticationError,
+        FleeksPermissionError,
+        FleeksResourceNotFoundError,
+        FleeksValidationError,
+        FleeksFeatureUnsupportedError,
+        FleeksConnectionError,
+        FleeksStreamingError,
+        FleeksTimeoutError,
+        WorkspaceNotReadyError,
+    )
+
+    # Data models
+    from .models import (
+        WorkspaceInfo,
+        PreviewURLInfo,
+        AgentMode,
+        AgentType,  # backward-compat alias for AgentMode
+        AgentStatus,
+        AgentExecution,
+        AgentHandoff,
+        AgentStopResponse,
+        AgentStatusInfo,
+        AgentOutput,
+        AgentList,
+        SubAgentResult,
+        SubAgentUsage,
+        DeploymentStatusEnum,
+        DeployResponse,
+        DeployStatus,
+        DeployListItem,
+        DeployLogEvent,
+        DeployLogs,
+        ProvisionDbResult,
+        MobileDistributeResult,
+        DesktopDistributeResult,
+        DiagnoseResult,
+        HealthCheckResult,
+        RuntimeLogEntry,
+        RuntimeLogsResult,
+        LatencyMetrics,
+        MetricsResult,
+        MultiServiceDeployResult,
+        MultiDeployResult,
+        # Schedule / Always-On
+        ScheduleType,
+        DaemonStatus,
+        ProjectType,
+        Schedule,
+        ScheduleList,
+        ScheduleStartResult,
+        DaemonStatusInfo,
+        DaemonLogs,
+        QuotaMetric,
+        QuotaCounter,
+        QuotaUsage,
+        # Always-On dashboards (backend release 2026-04-28)
+        Message,
+        MessageSource,
+        MessageStatus,
+        # Channels
+        ChannelType,
+        ChannelTypeInfo,
+        Channel,
+        ChannelList,
+        AuthFlowResult,
+        # Automations
+        TriggerType,
+        Automation,
+        AutomationList,
+        AutomationTestResult,
+        # Preview sessions (new — 2026-03-10)
+        PreviewStatus,
+        PreviewFramework,
+        PreviewSession,
+        PreviewSessionList,
+        PreviewHealth,
+        PreviewDetectResult,
+        # Voice
+        VoiceSessionState,
+        VoiceEventType,
+        VoiceSessionConfig,
+        VoiceSessionInfo,
+        VoiceAudioResponse,
+        VoiceTranscript,
+        VoiceToolExecution,
+        VoiceUsage,
+        VoiceEvent,
+    )
+
+
+# Public name -> submodule that defines it.
+_LAZY = {
+    'FleeksClient': 'client',
+    'create_client': 'client',
+    'Config': 'config',
+    'APIKeyAuth': 'auth',
+    'RetryPolicy': 'retry',
+    'WorkspaceManager': 'workspaces',
+    'AgentManager': 'agents',
+    'FileManager': 'files',
+    'TerminalManager': 'terminal',
+    'ContainerManager': 'containers',
+    'StreamingClient': 'streaming',
+    'EmbedManager': 'embeds',
+    'EmbedTemplate': 'embeds',
+    'DisplayMode': 'embeds',
+    'EmbedLayoutPreset': 'embeds',
+    'EmbedTheme': 'embeds',
+    'EmbedStatus': 'embeds',
+    'EmbedSettings': 'embeds',
+    'EmbedFile': 'embeds',
+    'EmbedInfo': 'embeds',
+    'EmbedSession': 'embeds',
+    'EmbedAnalytics': 'embeds',
+    'Embed': 'embeds',
+    'validate_template': 'embeds',
+    'validate_display_mode': 'embeds',
+    'DeployManager': 'deploy',
+    'ScheduleManager': 'schedules',
+    'ChannelManager': 'channels',
+    'AutomationManager': 'automations',
+    'PreviewManager': 'previews',
+    'AIKeysManager': 'ai_keys',
+    'VoiceManager': 'voice',
+    'VoiceSession': 'voice',
+    'IdleAction': 'lifecycle',
+    'LifecycleState': 'lifecycle',
+    'LifecycleConfig': 'lifecycle',
+    'HeartbeatResponse': 'lifecycle',
+    'TimeoutExtensionResponse': 'lifecycle',
+    'KeepAliveResponse': 'lifecycle',
+    'HibernationResponse': 'lifecycle',
+    'LifecycleStatus': 'lifecycle',
+    'TierLimit': 'lifecycle',
+    'TIER_LIMITS': 'lifecycle',
+    'FleeksException': 'exceptions',
+    'FleeksAPIError': 'exceptions',
+    'FleeksRateLimitError': 'exceptions',
+    'FleeksAuthenticationError': 'exceptions',
+    'FleeksPermissionError': 'exceptions',
+    'FleeksResourceNotFoundError': 'exceptions',
+    'FleeksValidationError': 'exceptions',
+    'FleeksFeatureUnsupportedError': 'exceptions',
+    'FleeksConnectionError': 'exceptions',
+    'FleeksStreamingError': 'exceptions',
+    'FleeksTimeoutError': 'exceptions',
+    'WorkspaceNotReadyError': 'exceptions',
+    'WorkspaceInfo': 'models',
+    'PreviewURLInfo': 'models',
+    'AgentMode': 'models',
+    'AgentType': 'models',
+    'AgentStatus': 'models',
+    'AgentExecution': 'models',
+    'AgentHandoff': 'models',
+    'AgentStopResponse': 'models',
+    'AgentStatusInfo': 'models',
+    'AgentOutput': 'models',
+    'AgentList': 'models',
+    'SubAgentResult': 'models',
+    'SubAgentUsage': 'models',
+    'DeploymentStatusEnum': 'models',
+    'DeployResponse': 'models',
+    'DeployStatus': 'models',
+    'DeployListItem': 'models',
+    'DeployLogEvent': 'models',
+    'DeployLogs': 'models',
+    'ProvisionDbResult': 'models',
+    'MobileDistributeResult': 'models',
+    'DesktopDistributeResult': 'models',
+    'DiagnoseResult': 'models',
+    'HealthCheckResult': 'models',
+    'RuntimeLogEntry': 'models',
+    'RuntimeLogsResult': 'models',
+    'LatencyMetrics': 'models',
+    'MetricsResult': 'models',
+    'MultiServiceDeployResult': 'models',
+    'MultiDeployResult': 'models',
+    'ScheduleType': 'models',
+    'DaemonStatus': 'models',
+    'ProjectType': 'models',
+    'Schedule': 'models',
+    'ScheduleList': 'models',
+    'ScheduleStartResult': 'models',
+    'DaemonStatusInfo': 'models',
+    'DaemonLogs': 'models',
+    'QuotaMetric': 'models',
+    'QuotaCounter': 'models',
+    'QuotaUsage': 'models',
+    'Message': 'models',
+    'MessageSource': 'models',
+    'MessageStatus': 'models',
+    'ChannelType': 'models',
+    'ChannelTypeInfo': 'models',
+    'Channel': 'models',
+    'ChannelList': 'models',
+    'AuthFlowResult': 'models',
+    'TriggerType': 'models',
+    'Automation': 'models',
+    'AutomationList': 'models',
+    'AutomationTestResult': 'models',
+    'PreviewStatus': 'models',
+    'PreviewFramework': 'models',
+    'PreviewSession': 'models',
+    'PreviewSessionList': 'models',
+    'PreviewHealth': 'models',
+    'PreviewDetectResult': 'models',
+    'VoiceSessionState': 'models',
+    'VoiceEventType': 'models',
+    'VoiceSessionConfig': 'models',
+    'VoiceSessionInfo': 'models',
+    'VoiceAudioResponse': 'models',
+    'VoiceTranscript': 'models',
+    'VoiceToolExecution': 'models',
+    'VoiceUsage': 'models',
+    'VoiceEvent': 'models',
+}
+
+_SUBMODULES = frozenset(_LAZY.values())
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        if name in _SUBMODULES:
+            return importlib.import_module(f'.{name}', __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-# Data models
-from .models import (
-    WorkspaceInfo,
-    PreviewURLInfo,
-    AgentMode,
-    AgentType,  # backward-compat alias for AgentMode
-    AgentStatus,
-    AgentExecution,
-    AgentHandoff,
-    AgentStopResponse,
-    AgentStatusInfo,
-    AgentOutput,
-    AgentList,
-    SubAgentResult,
-    SubAgentUsage,
-    DeploymentStatusEnum,
-    DeployResponse,
-    DeployStatus,
-    DeployListItem,
-    DeployLogEvent,
-    DeployLogs,
-    ProvisionDbResult,
-    MobileDistributeResult,
-    DesktopDistributeResult,
-    DiagnoseResult,
-    HealthCheckResult,
-    RuntimeLogEntry,
-    RuntimeLogsResult,
-    LatencyMetrics,
-    MetricsResult,
-    MultiServiceDeployResult,
-    MultiDeployResult,
-    # Schedule / Always-On
-    ScheduleType,
-    DaemonStatus,
-    ProjectType,
-    Schedule,
-    ScheduleList,
-    ScheduleStartResult,
-    DaemonStatusInfo,
-    DaemonLogs,
-    QuotaMetric,
-    QuotaCounter,
-    QuotaUsage,
-    # Always-On dashboards (backend release 2026-04-28)
-    Message,
-    MessageSource,
-    MessageStatus,
-    # Channels
-    ChannelType,
-    ChannelTypeInfo,
-    Channel,
-    ChannelList,
-    AuthFlowResult,
-    # Automations
-    TriggerType,
-    Automation,
-    AutomationList,
-    AutomationTestResult,
-    # Preview sessions (new — 2026-03-10)
-    PreviewStatus,
-    PreviewFramework,
-    PreviewSession,
-    PreviewSessionList,
-    PreviewHealth,
-    PreviewDetectResult,
-    # Voice
-    VoiceSessionState,
-    VoiceEventType,
-    VoiceSessionConfig,
-    VoiceSessionInfo,
-    VoiceAudioResponse,
-    VoiceTranscript,
-    VoiceToolExecution,
-    VoiceUsage,
-    VoiceEvent,
-)
 
 __all__ = [
     # Core
@@ -174,6 +332,7 @@ __all__ = [
     "create_client",
     "Config",
     "APIKeyAuth",
+    "RetryPolicy",
     
     # Service managers
     "WorkspaceManager",
@@ -200,6 +359,7 @@ __all__ = [
     "KeepAliveResponse",
     "HibernationResponse",
     "LifecycleStatus",
+    "TierLimit",
     "TIER_LIMITS",
     
     # Embeds
@@ -214,6 +374,8 @@ __all__ = [
     "EmbedSession",
     "EmbedAnalytics",
     "Embed",
+    "validate_template",
+    "validate_display_mode",
     
     # Data models
     "WorkspaceInfo",
@@ -0,0 +1,102 @@
+"""
+In-process caching helpers for the Fleeks SDK.
+
+- ``SingleFlight`` coalesces concurrent calls for the same key so that N
+  tasks polling the same resource share one HTTP request.
+- ``TTLCache`` keeps parsed responses for a short, monotonic-clock TTL, and
+  optionally a grace period during which they can still be served as stale.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it is in flight await the same task. Cancelling one waiter does not
+    cancel the shared request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, 'asyncio.Future[Any]'] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory()`` for ``key`` unless a call for it is already in flight."""
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(factory())
+            self._inflight[key] = fut
+            fut.add_done_callback(functools.partial(self._done, key))
+        return await asyncio.shield(fut)
+
+    def _done(self, key: Hashable, fut: 'asyncio.Future[Any]') -> None:
+        if self._inflight.get(key) is fut:
+            del self._inflight[key]
+        if not fut.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled.
+            fut.exception()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+
+class TTLCache:
+    """
+    Minimal TTL cache keyed by hashable values, using ``time.monotonic``.
+
+    Entries may outlive their TTL by a ``grace`` period: ``get`` no longer
+    returns them, but ``get_stale`` does, so callers can fall back to the
+    last good value when a refresh fails.
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[Hashable, Tuple[float, Any, float]] = {}
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for ``key`` if it has not expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        now = time.monotonic()
+        if entry[0] <= now:
+            if entry[2] <= now:
+                del self._data[key]
+            return default
+        return entry[1]
+
+    def get_stale(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the value for ``key`` if it is fresh or within its grace period."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[2] <= time.monotonic():
+            del self._data[key]
+            return default
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float, grace: float = 0.0) -> None:
+        """Cache ``value`` under ``key`` for ``ttl`` seconds (plus ``grace`` for ``get_stale``)."""
+        fresh_until = time.monotonic() + ttl
+        self._data[key] = (fresh_until, value, fresh_until + grace)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key, or everything when ``key`` is None."""
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every key for which ``predicate(key)`` is true."""
+        for key in [k for k in self._data if predicate(k)]:
+            del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
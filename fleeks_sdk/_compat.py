@@ -0,0 +1,40 @@
+"""
+Compatibility shims for the Python versions the SDK supports (3.9+),
+plus small helpers shared across the managers.
+"""
+
+import sys
+from enum import Enum
+
+try:
+    from enum import StrEnum
+except ImportError:  # pragma: no cover - Python < 3.11
+    class StrEnum(str, Enum):
+        """Backport of :class:`enum.StrEnum`: members are ``str`` and print as their value."""
+
+        def __str__(self) -> str:
+            return self.value
+
+
+# ``@dataclass(**DATACLASS_SLOTS)`` gives slotted records where supported
+# (``slots=`` was added to ``dataclass`` in Python 3.10).
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def enum_lookup(enum_cls, value):
+    """
+    Coerce ``value`` to a member of ``enum_cls``.
+
+    Tries the enum's value map directly before falling back to the regular
+    (slower) ``enum_cls(value)`` call, which also raises ``ValueError`` for
+    unknown values.
+    """
+    member = enum_cls._value2member_map_.get(value)
+    if member is not None:
+        return member
+    return enum_cls(value)
+
+
+def clamp(value, lo, hi):
+    """``value`` limited to ``[lo, hi]``; plain comparisons, no min()/max() calls."""
+    return lo if value < lo else hi if value > hi else value
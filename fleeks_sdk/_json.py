@@ -0,0 +1,76 @@
+"""
+JSON helpers for the Fleeks SDK.
+
+Uses ``orjson`` when it is installed (``pip install fleeks-sdk[speedups]``)
+and falls back to the standard library otherwise. Both ``loads`` variants
+accept ``bytes``/``bytearray`` directly, so callers can parse raw response
+bodies without decoding them to ``str`` first, and ``dumps`` always returns
+compact UTF-8 ``bytes`` ready to send as a request body (``content=``).
+Dataclass instances and enums are encoded directly (field name -> value),
+so request records need no ``to_dict()`` intermediate.
+
+``decode`` validates a raw body straight into a pydantic model (or any type
+pydantic accepts) without building the intermediate dict. Bodies that do not
+match raise ``FleeksValidationError`` rather than pydantic's
+``ValidationError``, so ``except FleeksException`` still catches them.
+"""
+
+import dataclasses
+import functools
+import json
+from enum import Enum
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from .exceptions import FleeksValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps = orjson.dumps
+    JSONDecodeError = orjson.JSONDecodeError
+else:  # pragma: no cover - exercised only without orjson installed
+    loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+    def _default(obj):
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+        if isinstance(obj, Enum):
+            return obj.value
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(obj) -> bytes:
+        return json.dumps(
+            obj, separators=(',', ':'), ensure_ascii=False, default=_default
+        ).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _type_adapter(typ: Any) -> TypeAdapter:
+    """One pydantic TypeAdapter per response type, built on first use."""
+    return TypeAdapter(typ)
+
+
+def decode(raw: bytes, typ: Any) -> Any:
+    """
+    Parse and validate ``raw`` JSON into ``typ`` in a single pydantic-core
+    pass, e.g. ``decode(body, ContainerStats)`` or
+    ``decode(body, List[DeployListItem])``. Empty bodies validate as ``{}``.
+    """
+    try:
+        return _type_adapter(typ).validate_json(raw or b'{}')
+    except ValidationError as e:
+        raise invalid_response(typ, e) from e
+
+
+def invalid_response(typ: Any, error: ValidationError) -> FleeksValidationError:
+    """SDK exception for a response body that failed validation as ``typ``."""
+    name = getattr(typ, '__name__', None) or str(typ)
+    return FleeksValidationError(f"Unexpected {name} response: {error}", status_code=None)
@@ -0,0 +1,120 @@
+"""
+Client-side adaptive rate limiting for the Fleeks SDK.
+
+Container lifecycle calls (heartbeat, extend-timeout, keep-alive) are often
+issued from tight loops by several tasks at once. Left uncoordinated they
+trip the backend's per-workspace quota and produce bursts of 429s. The
+limiter keeps one token bucket per ``(endpoint, resource)`` pair and adapts
+its refill rate with AIMD: every success adds a little rate back, every 429
+halves it and blocks the bucket until ``Retry-After`` (plus jitter) passes.
+"""
+
+import asyncio
+import random
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class _Bucket:
+    """Token bucket state for a single ``(endpoint, resource)`` key."""
+
+    __slots__ = ('rate', 'tokens', 'updated', 'blocked_until')
+
+    def __init__(self, rate: float, tokens: float, now: float):
+        self.rate = rate
+        self.tokens = tokens
+        self.updated = now
+        self.blocked_until = 0.0
+
+
+class AdaptiveLimiter:
+    """
+    AIMD token-bucket limiter keyed by endpoint and resource ID.
+
+    Args:
+        rate: Initial and maximum refill rate in requests per second.
+        burst: Bucket capacity (requests allowed back-to-back).
+        min_rate: Floor the rate never decreases below.
+        increase: Requests/second added back after each success.
+        decrease: Multiplier applied to the rate after each 429.
+        jitter: Upper bound (seconds) of random delay added to ``Retry-After``.
+        enabled: When False, ``acquire`` never waits.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 10,
+        min_rate: float = 1 / 60,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        jitter: float = 1.0,
+        enabled: bool = True,
+    ):
+        self.max_rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.jitter = jitter
+        self.enabled = enabled
+        self._buckets: Dict[Tuple[str, Hashable], _Bucket] = {}
+
+    def _bucket(self, key: Tuple[str, Hashable], now: float) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.max_rate, float(self.burst), now)
+        return bucket
+
+    async def acquire(self, endpoint: str, resource: Hashable = None) -> None:
+        """Wait until a request to ``endpoint`` for ``resource`` may be sent."""
+        if not self.enabled:
+            return
+        key = (endpoint, resource)
+        while True:
+            now = time.monotonic()
+            bucket = self._bucket(key, now)
+            if bucket.blocked_until > now:
+                await asyncio.sleep(bucket.blocked_until - now)
+                continue
+            bucket.tokens = min(
+                float(self.burst), bucket.tokens + (now - bucket.updated) * bucket.rate
+            )
+            bucket.updated = now
+            if bucket.tokens >= 1.0:
+                bucket.tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - bucket.tokens) / bucket.rate)
+
+    def on_success(self, endpoint: str, resource: Hashable = None) -> None:
+        """Additive increase: recover rate after a successful request."""
+        bucket = self._buckets.get((endpoint, resource))
+        if bucket is not None:
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def on_rate_limited(
+        self,
+        endpoint: str,
+        resource: Hashable = None,
+        retry_after: Optional[float] = None,
+        min_delay: float = 0.0,
+    ) -> None:
+        """
+        Multiplicative decrease: back off after a 429 response.
+
+        The bucket is blocked for ``max(retry_after, min_delay)`` plus
+        jitter; ``min_delay`` lets callers supply a telemetry-derived floor
+        (e.g. smoothed RTT stretched by the endpoint's 429 ratio).
+        """
+        now = time.monotonic()
+        bucket = self._bucket((endpoint, resource), now)
+        bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+        bucket.tokens = 0.0
+        bucket.updated = now
+        delay = max(retry_after or 0.0, min_delay) + random.uniform(0.0, self.jitter)
+        bucket.blocked_until = max(bucket.blocked_until, now + delay)
+
+    def get_rate(self, endpoint: str, resource: Hashable = None) -> float:
+        """Current refill rate (requests/second) for a key."""
+        bucket = self._buckets.get((endpoint, resource))
+        return bucket.rate if bucket is not None else self.max_rate
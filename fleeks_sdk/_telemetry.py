@@ -0,0 +1,107 @@
+"""
+Per-endpoint request telemetry for the Fleeks SDK.
+
+``FleeksClient`` records the round-trip time and outcome of every request
+here. The aggregates (EWMA RTT and 429 rate) are exposed through
+``FleeksClient.get_stats()`` and give the adaptive limiter a better backoff
+floor than ``Retry-After`` alone when an endpoint is under contention.
+
+Endpoints are keyed by path with ID-like segments (any segment containing a
+digit) collapsed to ``{id}``, so ``containers/ctr_1a/heartbeat`` and
+``containers/ctr_2b/heartbeat`` share one entry.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def endpoint_key(path: str) -> str:
+    """Normalize a request path (with or without ``/api/v1/sdk``) to a stats key."""
+    path = path.split('?', 1)[0].strip('/')
+    if path.startswith('api/v1/sdk/'):
+        path = path[len('api/v1/sdk/'):]
+    return '/'.join(
+        '{id}' if any(c.isdigit() for c in segment) else segment
+        for segment in path.split('/')
+    )
+
+
+class EndpointStats:
+    """Smoothed RTT and outcome counters for one endpoint."""
+
+    __slots__ = ('ewma_rtt', 'requests', 'rate_limited', 'errors')
+
+    def __init__(self) -> None:
+        self.ewma_rtt = 0.0
+        self.requests = 0
+        self.rate_limited = 0
+        self.errors = 0
+
+    @property
+    def rate_limited_ratio(self) -> float:
+        """Fraction of requests answered with 429."""
+        return self.rate_limited / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'ewma_rtt': self.ewma_rtt,
+            'requests': self.requests,
+            'rate_limited': self.rate_limited,
+            'errors': self.errors,
+            'rate_limited_ratio': self.rate_limited_ratio,
+        }
+
+
+class Telemetry:
+    """
+    Aggregates request outcomes per endpoint.
+
+    Args:
+        alpha: EWMA smoothing factor for RTT (weight of the newest sample).
+        contention_factor: Scales how strongly the 429 ratio stretches the
+            suggested backoff in ``backoff_floor``.
+    """
+
+    def __init__(self, alpha: float = 0.1, contention_factor: float = 10.0):
+        self.alpha = alpha
+        self.contention_factor = contention_factor
+        self._stats: Dict[str, EndpointStats] = {}
+
+    def _entry(self, path: str) -> EndpointStats:
+        key = endpoint_key(path)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = EndpointStats()
+        return stats
+
+    def record(self, path: str, rtt: float, status_code: Optional[int]) -> None:
+        """Record one request; ``status_code`` is None for transport errors."""
+        stats = self._entry(path)
+        stats.requests += 1
+        if status_code is None:
+            stats.errors += 1
+            return
+        if status_code == 429:
+            stats.rate_limited += 1
+        if stats.ewma_rtt:
+            stats.ewma_rtt += self.alpha * (rtt - stats.ewma_rtt)
+        else:
+            stats.ewma_rtt = rtt
+
+    def get(self, path: str) -> Optional[EndpointStats]:
+        return self._stats.get(endpoint_key(path))
+
+    def backoff_floor(self, path: str) -> float:
+        """
+        Minimum sensible wait before retrying ``path`` after a 429.
+
+        ``ewma_rtt * (1 + rate_limited_ratio * contention_factor)``: roughly
+        one round trip when the endpoint is healthy, stretched as the share
+        of throttled requests grows.
+        """
+        stats = self.get(path)
+        if stats is None:
+            return 0.0
+        return stats.ewma_rtt * (1.0 + stats.rate_limited_ratio * self.contention_factor)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {key: stats.to_dict() for key, stats in self._stats.items()}
@@ -2,23 +2,78 @@
 Async client for the Fleeks SDK.
 """
 
-import asyncio
+import gzip
+import importlib.util
 import os
-from typing import Dict, Any, Optional, List, Union, AsyncContextManager
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, Union, AsyncContextManager, AsyncIterator
 from contextlib import asynccontextmanager
+from urllib.parse import urlencode
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 from pydantic import BaseModel
 
 from .config import Config
-from .exceptions import FleeksAPIError, FleeksException, FleeksRateLimitError
+from .exceptions import (
+    FleeksAPIError,
+    FleeksConnectionError,
+    FleeksRateLimitError,
+    FleeksTimeoutError,
+)
+from . import _json
+from ._limiter import AdaptiveLimiter
+from ._telemetry import Telemetry
+from .retry import RetryPolicy, parse_retry_after
 
 
-def _is_transient_error(exc: BaseException) -> bool:
-    """Retry only on rate-limits and network-level errors, never on 4xx API errors."""
-    import asyncio
-    return isinstance(exc, (FleeksRateLimitError, httpx.RequestError, asyncio.CancelledError))
+# Upper bound on remembered ETag'd responses for conditional GETs.
+_ETAG_CACHE_SIZE = 256
+
+# ``FleeksRateLimitError.retry_after`` reported when a 429 that carried no
+# ``Retry-After`` header is finally raised.
+_DEFAULT_RETRY_AFTER = 60.0
+
+# JSON bodies at least this large are gzipped when ``compress_requests=True``;
+# below it the compression overhead outweighs the bytes saved.
+_GZIP_MIN_BYTES = 1024
+
+
+def _http2_available() -> bool:
+    """httpx only speaks HTTP/2 when the optional ``h2`` package is installed."""
+    return importlib.util.find_spec('h2') is not None
+
+
+class _AsyncByteReader:
+    """Minimal async file-like wrapper over an httpx byte stream, for ijson."""
+
+    __slots__ = ('_chunks',)
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes the stream type with read(0)
+            return b''
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b''
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _accept_encoding() -> str:
+    """
+    Encodings httpx can decode here: gzip/deflate always, brotli only when
+    ``brotli`` (or ``brotlicffi``) is installed.
+    """
+    if importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi'):
+        return 'gzip, deflate, br'
+    return 'gzip, deflate'
 from .auth import APIKeyAuth
 from .workspaces import WorkspaceManager
 from .agents import AgentManager
@@ -47,6 +102,12 @@ class FleeksClient:
     - Socket.IO streaming support
     - Comprehensive error handling
     - Type hints throughout
+
+    One client owns one pooled ``httpx.AsyncClient`` (keep-alive, HTTP/2
+    when available) that every manager and stream shares. Clients and the
+    managers they hand out are safe to share between tasks on the same
+    event loop; create one per process and close it with ``aclose()`` or
+    ``async with``.
     """
 
     def __init__(
@@ -74,9 +135,24 @@ class FleeksClient:
 
         # Initialize HTTP client
         self._client: Optional[httpx.AsyncClient] = None
+        self._prewarmed = False
         
         # Initialize auth handler
         self.auth = APIKeyAuth(self.api_key)
+
+        # Client-side adaptive throttling for rate-limited container endpoints
+        self._limiter = AdaptiveLimiter(enabled=config.respect_rate_limits)
+
+        # Per-endpoint EWMA RTT / 429 counters (see get_stats())
+        self._telemetry = Telemetry()
+
+        # Shared retry/backoff policy for every request
+        self.retry_policy: RetryPolicy = config.retry_policy or RetryPolicy(
+            max_retries=config.max_retries
+        )
+
+        # URL -> (ETag, parsed body) for conditional GETs (LRU-bounded)
+        self._etags: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
         
         # Initialize service managers (lazy loaded)
         self._workspaces: Optional[WorkspaceManager] = None
@@ -95,8 +171,10 @@ class FleeksClient:
         self._ai_keys: Optional[AIKeysManager] = None
 
     async def __aenter__(self) -> "FleeksClient":
-        """Async context manager entry."""
+        """Async context manager entry (prewarms when ``prewarm=True``)."""
         await self._ensure_client()
+        if self.config.prewarm:
+            await self.prewarm()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -114,16 +192,30 @@ class FleeksClient:
                     'Authorization': f'Bearer {self.api_key}',
                     'Content-Type': 'application/json',
                     'User-Agent': f'fleeks-python-sdk/{self.config.version}',
-                    'Accept': 'application/json'
+                    'Accept': 'application/json',
+                    'Accept-Encoding': _accept_encoding(),
                 },
-                follow_redirects=True
+                follow_redirects=True,
+                transport=self.config.transport or self._build_transport(),
             )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception(_is_transient_error),
-    )
+    def _build_transport(self) -> httpx.AsyncHTTPTransport:
+        """
+        Pooled transport shared by every request this client makes.
+
+        Transport-level retries are off; retrying is handled in
+        ``_make_request`` so it can take rate limits into account.
+        """
+        return httpx.AsyncHTTPTransport(
+            http2=self.config.http2 and _http2_available(),
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+            retries=0,
+        )
+
     async def _make_request(
         self,
         method: str,
@@ -132,11 +224,22 @@ class FleeksClient:
     ) -> Dict[str, Any]:
         """
         Make an HTTP request to the Fleeks API with retry logic.
+
+        Retries follow ``self.retry_policy``: 429s honour ``Retry-After``,
+        and transport errors / 502-504 are retried only for idempotent
+        methods or requests carrying an ``Idempotency-Key`` header.
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint
-            **kwargs: Additional request parameters
+            **kwargs: Additional request parameters. Private options:
+                ``_url_prefix`` overrides the ``/api/v1/sdk`` prefix;
+                ``_conditional=True`` revalidates with ``If-None-Match``
+                and returns the previously parsed body (the same object)
+                when the server answers 304 Not Modified;
+                ``_raw=True`` returns the undecoded response body (bytes);
+                ``_on_rate_limited`` is called with every
+                ``FleeksRateLimitError``, including those that are retried.
             
         Returns:
             Response data as dictionary
@@ -144,36 +247,75 @@ class FleeksClient:
         Raises:
             FleeksAPIError: For API-specific errors
             FleeksRateLimitError: For rate limit exceeded
-            FleeksException: For general errors
+            FleeksConnectionError: For network errors
+            FleeksTimeoutError: For request timeouts
         """
-        await self._ensure_client()
-        
+        return await self._with_retries(self._send, method, endpoint, kwargs)
+
+    async def _with_retries(self, send, method: str, endpoint: str, kwargs: Dict[str, Any]):
+        """Run ``send(method, endpoint, **kwargs)`` under ``self.retry_policy``."""
+        on_rate_limited = kwargs.pop('_on_rate_limited', None)
+        try:
+            async for attempt in self.retry_policy.retrying(method, kwargs.get('headers')):
+                with attempt:
+                    try:
+                        return await send(method, endpoint, **kwargs)
+                    except FleeksRateLimitError as e:
+                        if on_rate_limited is not None:
+                            on_rate_limited(e)
+                        raise
+        except FleeksRateLimitError as e:
+            if e.retry_after is None:
+                e.retry_after = _DEFAULT_RETRY_AFTER
+            raise
+
+    @staticmethod
+    def _url(endpoint: str, prefix: str = '/api/v1/sdk') -> str:
         # Strip leading slash only; preserve any trailing slash the caller explicitly adds
         # (collection routes like /sdk/schedules/ require it when redirect_slashes=False).
-        normalized_endpoint = endpoint.lstrip('/')
-        prefix = kwargs.pop('_url_prefix', '/api/v1/sdk')
-        url = f"{prefix}/{normalized_endpoint}"
+        return f"{prefix}/{endpoint.lstrip('/')}"
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send a single request attempt; see ``_make_request``."""
+        await self._ensure_client()
+        url = self._url(endpoint, kwargs.pop('_url_prefix', '/api/v1/sdk'))
+
+        raw = kwargs.pop('_raw', False)
+        conditional = kwargs.pop('_conditional', False)
+        cached = None
+        cache_key = url
+        if conditional:
+            params = kwargs.get('params')
+            if params:
+                # Key by query too, so e.g. analytics periods revalidate separately.
+                cache_key = f"{url}?{urlencode(sorted(params.items()))}"
+            cached = self._etags.get(cache_key)
+            if cached is not None:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), 'If-None-Match': cached[0]}
         
         try:
-            response = await self._client.request(method, url, **kwargs)
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = response.headers.get('Retry-After', '60')
-                # Preserve actual error detail from the API response
-                detail = None
-                try:
-                    body = response.json()
-                    detail = body.get('detail')
-                except Exception:
-                    pass
-                msg = detail or f"Rate limit exceeded. Retry after {retry_after} seconds."
-                raise FleeksRateLimitError(
-                    msg,
-                    retry_after=int(retry_after)
-                )
+            started = time.monotonic()
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except httpx.RequestError:
+                self._telemetry.record(url, time.monotonic() - started, None)
+                raise
+            self._telemetry.record(url, time.monotonic() - started, response.status_code)
+
+            if response.status_code == 304 and cached is not None:
+                self._etags.move_to_end(cache_key)
+                return cached[1]
             
-            response.raise_for_status()
+            if not response.is_success:
+                self._raise_for_status(response)
+
+            if raw:
+                return response.content
             
             # Handle empty bodies (e.g. 204 No Content from PUT/DELETE)
             if not response.content:
@@ -182,10 +324,46 @@ class FleeksClient:
             # Handle different content types
             content_type = response.headers.get('content-type', '')
             if 'application/json' in content_type:
-                return response.json()
+                data = _json.loads(response.content)
+                etag = response.headers.get('etag') if conditional else None
+                if etag:
+                    self._etags[cache_key] = (etag, data)
+                    self._etags.move_to_end(cache_key)
+                    if len(self._etags) > _ETAG_CACHE_SIZE:
+                        self._etags.popitem(last=False)
+                return data
             else:
                 return {'data': response.text, 'content_type': content_type}
-                
+        except httpx.RequestError as e:
+            raise self._transport_error(e) from e
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Raise the SDK exception for a non-2xx ``response`` (body already read)."""
+        # Handle rate limiting
+        if response.status_code == 429:
+            # Without Retry-After the retry policy uses exponential backoff;
+            # the 60s default is applied once retries are exhausted.
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            # Preserve actual error detail from the API response
+            detail = None
+            try:
+                body = response.json()
+                detail = body.get('detail')
+            except Exception:
+                pass
+            msg = detail or (
+                f"Rate limit exceeded. Retry after "
+                f"{_DEFAULT_RETRY_AFTER if retry_after is None else retry_after:g} seconds."
+            )
+            raise FleeksRateLimitError(
+                msg,
+                retry_after=retry_after,
+                response=response
+            )
+
+        try:
+            response.raise_for_status()
         except httpx.HTTPStatusError as e:
             error_detail = "Unknown error"
             try:
@@ -199,17 +377,109 @@ class FleeksClient:
                 status_code=e.response.status_code,
                 response=e.response
             )
+
+    @staticmethod
+    def _transport_error(e: httpx.RequestError) -> Exception:
+        """SDK exception for an httpx transport error."""
+        if isinstance(e, httpx.TimeoutException):
+            return FleeksTimeoutError(f"Request timed out: {str(e)}")
+        return FleeksConnectionError(f"Request failed: {str(e)}")
+
+    @asynccontextmanager
+    async def _stream(self, method: str, endpoint: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        Streamed counterpart of ``_make_request``.
+
+        Yields the response with its body unread. Opening the stream goes
+        through the same URL building, telemetry, error mapping and retry
+        policy; transport errors while reading the body surface as
+        ``FleeksTimeoutError``/``FleeksConnectionError`` but are not retried.
+        """
+        response = await self._with_retries(self._open_stream, method, endpoint, kwargs)
+        try:
+            yield response
         except httpx.RequestError as e:
-            raise FleeksException(f"Request failed: {str(e)}")
+            raise self._transport_error(e) from e
+        finally:
+            await response.aclose()
+
+    async def _open_stream(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send one streamed request attempt; see ``_stream``."""
+        await self._ensure_client()
+        url = self._url(endpoint, kwargs.pop('_url_prefix', '/api/v1/sdk'))
+        request = self._client.build_request(method, url, **kwargs)
+        started = time.monotonic()
+        try:
+            response = await self._client.send(request, stream=True)
+        except httpx.RequestError as e:
+            self._telemetry.record(url, time.monotonic() - started, None)
+            raise self._transport_error(e) from e
+        self._telemetry.record(url, time.monotonic() - started, response.status_code)
+        if not response.is_success:
+            try:
+                await response.aread()
+            except httpx.RequestError as e:
+                raise self._transport_error(e) from e
+            finally:
+                await response.aclose()
+            self._raise_for_status(response)
+        return response
+
+    async def _stream_items(self, method: str, endpoint: str, **kwargs) -> AsyncIterator[tuple]:
+        """
+        Top-level ``(key, value)`` pairs of a streamed JSON object response.
+
+        With ``ijson`` installed (``pip install fleeks-sdk[streaming]``) the
+        body is parsed incrementally as it arrives, so a consumer that stops
+        early (``aclose()``) never downloads the rest; otherwise the body is
+        read in full and decoded with ``_json``.
+        """
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        async with self._stream(method, endpoint, **kwargs) as response:
+            if ijson is not None:
+                items = ijson.kvitems_async(
+                    _AsyncByteReader(response.aiter_bytes()), '', use_float=True
+                )
+            else:
+                items = _aiter(_json.loads(await response.aread() or b'{}').items())
+            async for item in items:
+                yield item
 
     async def get(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        conditional: bool = False,
     ) -> Dict[str, Any]:
-        """Make a GET request."""
+        """
+        Make a GET request.
+
+        With ``conditional=True`` the response ETag is remembered per URL and
+        query; later calls send ``If-None-Match`` and a 304 returns the
+        previously parsed body without transferring or parsing it again.
+        """
         kwargs: Dict[str, Any] = {}
+        if params is not None:
+            kwargs['params'] = params
+        if headers:
+            kwargs['headers'] = headers
+        if conditional:
+            kwargs['_conditional'] = True
+        return await self._make_request('GET', endpoint, **kwargs)
+
+    async def get_bytes(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """Make a GET request and return the raw response body, undecoded."""
+        kwargs: Dict[str, Any] = {'_raw': True}
         if params is not None:
             kwargs['params'] = params
         if headers:
@@ -223,10 +493,13 @@ class FleeksClient:
         json: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
-        """Make a POST request."""
+        """Make a POST request; ``content`` sends an already-encoded JSON body."""
         kwargs: Dict[str, Any] = {}
-        if json is not None:
+        if content is not None:
+            kwargs['content'] = content
+        elif json is not None:
             kwargs['json'] = json
         elif data is not None:
             kwargs['data'] = data
@@ -234,6 +507,8 @@ class FleeksClient:
             kwargs['files'] = files
         if headers:
             kwargs['headers'] = headers
+        if self.config.compress_requests:
+            self._gzip_body(kwargs)
         return await self._make_request('POST', endpoint, **kwargs)
 
     async def put(
@@ -259,21 +534,61 @@ class FleeksClient:
         data: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
-        """Make a PATCH request."""
+        """Make a PATCH request; ``content`` sends an already-encoded JSON body."""
         kwargs: Dict[str, Any] = {}
-        if json is not None:
+        if content is not None:
+            kwargs['content'] = content
+        elif json is not None:
             kwargs['json'] = json
         elif data is not None:
             kwargs['data'] = data
         if headers:
             kwargs['headers'] = headers
+        if self.config.compress_requests:
+            self._gzip_body(kwargs)
         return await self._make_request('PATCH', endpoint, **kwargs)
 
+    @staticmethod
+    def _gzip_body(kwargs: Dict[str, Any]) -> None:
+        """Gzip a large JSON body in ``kwargs`` in place and mark its encoding."""
+        if 'files' in kwargs:
+            return
+        body = kwargs.get('content')
+        if body is None:
+            if 'json' not in kwargs:
+                return
+            body = _json.dumps(kwargs['json'])
+        if len(body) < _GZIP_MIN_BYTES:
+            return
+        kwargs.pop('json', None)
+        kwargs['content'] = gzip.compress(body, compresslevel=1)
+        kwargs['headers'] = {**(kwargs.get('headers') or {}), 'Content-Encoding': 'gzip'}
+
     async def delete(self, endpoint: str) -> Dict[str, Any]:
         """Make a DELETE request."""
         return await self._make_request('DELETE', endpoint)
 
+    async def prewarm(self) -> None:
+        """
+        Open a pooled connection to the API host ahead of the first call.
+
+        Sends one ``HEAD /health`` so DNS, TCP and TLS setup happen now
+        rather than inside the first real request; later requests reuse the
+        keep-alive connection. Idempotent, and best-effort: failures are
+        ignored and the first real request connects as usual. Called from
+        ``__aenter__`` when the client is created with ``prewarm=True``.
+        """
+        await self._ensure_client()
+        if self._prewarmed:
+            return
+        try:
+            await self._client.head('/health')
+        except httpx.HTTPError:
+            return
+        self._prewarmed = True
+
     async def health_check(self) -> Dict[str, Any]:
         """Check API health status."""
         await self._ensure_client()
@@ -478,11 +793,35 @@ class FleeksClient:
         if self._client is not None:
             await self._client.aclose()
             self._client = None
+            self._prewarmed = False
             
         # Close streaming connection if open
         if self._streaming is not None:
             await self._streaming.disconnect()
 
+    def get_stats(self, endpoint: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Client-side request telemetry.
+
+        Args:
+            endpoint: Request path such as ``containers/ctr_1/heartbeat``.
+                ID-like segments are collapsed, so stats are shared across
+                containers. When omitted, stats for all endpoints are
+                returned keyed by normalized path.
+
+        Returns:
+            dict with ``ewma_rtt`` (seconds), ``requests``, ``rate_limited``,
+            ``errors`` and ``rate_limited_ratio``; or a mapping of those.
+        """
+        if endpoint is None:
+            return self._telemetry.snapshot()
+        stats = self._telemetry.get(endpoint)
+        return stats.to_dict() if stats is not None else {}
+
+    async def aclose(self) -> None:
+        """Alias for :meth:`close`, matching ``httpx.AsyncClient.aclose``."""
+        await self.close()
+
     async def get_usage_stats(self) -> Dict[str, Any]:
         """Get current usage statistics and rate limits."""
         try:
@@ -48,6 +48,43 @@ class Config:
         self.respect_rate_limits = kwargs.get('respect_rate_limits', True)
         self.rate_limit_buffer = kwargs.get('rate_limit_buffer', 0.1)  # 10% buffer
 
+        # Connection pooling: HTTP/2 multiplexes concurrent requests over one
+        # connection when the optional ``h2`` package is installed
+        # (``pip install fleeks-sdk[http2]``); otherwise HTTP/1.1 is used.
+        self.http2 = kwargs.get('http2', True)
+        self.max_connections = kwargs.get('max_connections', 64)
+        self.max_keepalive_connections = kwargs.get('max_keepalive_connections', 32)
+        self.keepalive_expiry = kwargs.get('keepalive_expiry', 60.0)
+
+        # Gzip POST/PATCH JSON bodies of 1 KiB or more (e.g. embed ``create``
+        # with file contents) and send ``Content-Encoding: gzip``. Off by
+        # default since not every deployment accepts compressed requests.
+        self.compress_requests = kwargs.get('compress_requests', False)
+
+        # Custom httpx async transport (proxies, test doubles). When unset the
+        # client builds a pooled AsyncHTTPTransport from the options above.
+        self.transport = kwargs.get('transport')
+
+        # Retry/backoff policy (fleeks_sdk.retry.RetryPolicy); defaults to
+        # one built from max_retries.
+        self.retry_policy = kwargs.get('retry_policy')
+
+        # Opt-in short-TTL cache for read-mostly EmbedManager calls (list: 5s,
+        # get: 10s, total analytics: 30s). Off by default so reads are never
+        # stale unless asked for.
+        self.response_cache = kwargs.get('response_cache', False)
+
+        # When an EmbedManager list()/get() fails with a connection error,
+        # timeout or 5xx, return the last good response (up to
+        # ``stale_grace`` seconds past its TTL) marked ``Embed.stale``
+        # instead of raising.
+        self.stale_on_error = kwargs.get('stale_on_error', False)
+        self.stale_grace = kwargs.get('stale_grace', 300.0)
+
+        # Open a connection on ``async with FleeksClient(...)`` entry so the
+        # first real request skips DNS/TCP/TLS setup (see FleeksClient.prewarm).
+        self.prewarm = kwargs.get('prewarm', False)
+
     def validate(self) -> None:
         """Validate the configuration."""
         if not self.api_key:
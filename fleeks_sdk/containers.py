@@ -15,7 +15,10 @@ Backend endpoints:
 - GET /api/v1/sdk/containers/{container_id}/lifecycle
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Awaitable, Callable, Iterable, List, Optional, TypeVar
+from . import _json
+from ._cache import SingleFlight, TTLCache
+from ._compat import clamp
 from .models import (
     ContainerInfo,
     ContainerStats,
@@ -30,9 +33,20 @@ from .lifecycle import (
     HeartbeatResponse,
     TimeoutExtensionResponse,
     KeepAliveResponse,
-    HibernationResponse
+    HibernationResponse,
+    _serialize_lifecycle
 )
-from .exceptions import FleeksResourceNotFoundError, FleeksAPIError
+from .exceptions import FleeksResourceNotFoundError, FleeksAPIError, FleeksRateLimitError
+
+T = TypeVar('T')
+
+# How long get_info()/get_lifecycle_status() results are reused. Backend
+# state barely changes in this window, while pollers often ask many times.
+_STATE_TTL_SECONDS = 0.5
+
+# Bounds the backend accepts for a single extend-timeout call.
+_EXTEND_MIN_MINUTES = 1
+_EXTEND_MAX_MINUTES = 480
 
 
 class ContainerManager:
@@ -42,6 +56,13 @@ class ContainerManager:
     Provides access to container information, stats, command execution,
     process management, and container lifecycle operations.
     """
+
+    __slots__ = (
+        'client', 'project_id', 'container_id', '_req', '_inflight', '_cache', '_etag',
+        '_generation',
+        '_p_info', '_p_stats', '_p_exec', '_p_procs', '_p_restart', '_p_hb',
+        '_p_ext', '_p_ka', '_p_hib', '_p_wake', '_p_life',
+    )
     
     def __init__(self, client, project_id: str, container_id: str):
         """
@@ -55,6 +76,146 @@ class ContainerManager:
         self.client = client
         self.project_id = project_id
         self.container_id = container_id
+        # Bound once; every endpoint call goes through it.
+        self._req = client._make_request
+        # Endpoint paths are fixed per container; build them once rather
+        # than per request in polling loops.
+        base = f'containers/{container_id}'
+        self._p_info = f'{base}/info'
+        self._p_stats = f'{base}/stats'
+        self._p_exec = f'{base}/exec'
+        self._p_procs = f'{base}/processes'
+        self._p_restart = f'{base}/restart'
+        self._p_hb = f'{base}/heartbeat'
+        self._p_ext = f'{base}/extend-timeout'
+        self._p_ka = f'{base}/keep-alive'
+        self._p_hib = f'{base}/hibernate'
+        self._p_wake = f'{base}/wake'
+        self._p_life = f'{base}/lifecycle'
+        self._inflight = SingleFlight()
+        self._cache = TTLCache()
+        # Bumped by _invalidate so reads that raced a mutation aren't cached.
+        self._generation = 0
+        # path -> (raw body, parsed model) for ETag-revalidated reads
+        self._etag: Dict[str, tuple] = {}
+
+    @classmethod
+    def for_containers(
+        cls,
+        client,
+        project_id: str,
+        container_ids: Iterable[str]
+    ) -> Dict[str, 'ContainerManager']:
+        """
+        Build managers for several containers that share one client.
+
+        All managers reuse the client's connection pool, so fanning calls
+        out with ``asyncio.gather`` runs them concurrently (multiplexed over
+        one connection with HTTP/2). Prefer this over awaiting per-container
+        calls in a loop.
+
+        Args:
+            client: FleeksClient instance
+            project_id: Project/workspace ID
+            container_ids: Container IDs to manage
+
+        Returns:
+            dict: Container ID -> ContainerManager
+
+        Example:
+            >>> managers = ContainerManager.for_containers(client, project_id, ids)
+            >>> stats = await asyncio.gather(
+            ...     *(m.get_stats() for m in managers.values())
+            ... )
+        """
+        return {cid: cls(client, project_id, cid) for cid in container_ids}
+
+    async def _singleflight(
+        self,
+        key: str,
+        coro_factory: Callable[[], Awaitable[T]],
+        ttl: float = 0.0
+    ) -> T:
+        """
+        Share one request between concurrent callers of the same read.
+
+        Callers that arrive while a request for ``key`` is in flight await
+        its result instead of issuing their own. With ``ttl`` set, the
+        parsed (frozen) model is also reused for that many seconds, unless
+        the cache was invalidated while the request was in flight.
+        """
+        if ttl:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        generation = self._generation
+
+        async def run() -> T:
+            result = await coro_factory()
+            if ttl and generation == self._generation:
+                self._cache.set(key, result, ttl)
+            return result
+
+        # Callers arriving after an invalidation start a fresh request
+        # rather than joining one that may predate the mutation.
+        return await self._inflight.do((key, generation), run)
+
+    def _invalidate(self, key: Optional[str] = None) -> None:
+        """Drop cached reads (one ``key`` or all) after a state change."""
+        self._generation += 1
+        self._cache.invalidate(key)
+
+    async def _get_model(self, path: str, model, conditional: bool = False):
+        """
+        GET ``path`` and validate the response into ``model``.
+
+        Plain reads validate the raw body in one pass (``_json.decode``).
+        With ``conditional``, the request carries ``If-None-Match``; on 304
+        the client hands back the previous body object and the model parsed
+        from it is reused without re-validating.
+        """
+        if not conditional:
+            raw = await self._req('GET', path, _raw=True)
+            return _json.decode(raw, model)
+        response = await self._req('GET', path, _conditional=True)
+        previous = self._etag.get(path)
+        if previous is not None and previous[0] is response:
+            return previous[1]
+        parsed = model.model_validate(response)
+        self._etag[path] = (response, parsed)
+        return parsed
+
+    async def _limited_request(
+        self,
+        endpoint: str,
+        method: str,
+        path: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make a request through the client's adaptive limiter.
+
+        Used for lifecycle calls that callers tend to issue from loops
+        (heartbeat, extend-timeout, keep-alive). Every 429 response,
+        including ones the client goes on to retry, feeds back into the
+        limiter so later calls for this container slow down, for at least
+        the client's telemetry-derived backoff floor.
+        """
+        limiter = self.client._limiter
+
+        def on_rate_limited(e: FleeksRateLimitError) -> None:
+            limiter.on_rate_limited(
+                endpoint,
+                self.container_id,
+                e.retry_after,
+                min_delay=self.client._telemetry.backoff_floor(path)
+            )
+
+        await limiter.acquire(endpoint, self.container_id)
+        response = await self._req(method, path, _on_rate_limited=on_rate_limited, **kwargs)
+        limiter.on_success(endpoint, self.container_id)
+        self._invalidate('lifecycle')
+        return response
     
     async def get_info(self) -> ContainerInfo:
         """
@@ -62,6 +223,11 @@ class ContainerManager:
         
         GET /api/v1/sdk/containers/{container_id}/info
         
+        Concurrent calls share one request, and the result is reused for
+        a short window (0.5s) so tight polling loops stay cheap. After that
+        the request is revalidated with the stored ETag; a 304 returns the
+        previous ``ContainerInfo`` without transferring the body.
+        
         Returns:
             ContainerInfo: Complete container details including template,
                           languages, resource limits, ports
@@ -72,11 +238,11 @@ class ContainerManager:
             >>> print(f"Template: {info.template}")
             >>> print(f"Languages: {', '.join(info.languages)}")
         """
-        response = await self.client._make_request(
-            'GET',
-            f'containers/{self.container_id}/info'
+        return await self._singleflight(
+            'info',
+            lambda: self._get_model(self._p_info, ContainerInfo, conditional=True),
+            ttl=_STATE_TTL_SECONDS
         )
-        return ContainerInfo.from_dict(response)
     
     async def get_stats(self) -> ContainerStats:
         """
@@ -98,11 +264,10 @@ class ContainerManager:
             >>> print(f"Memory: {stats.memory_mb}MB ({stats.memory_percent}%)")
             >>> print(f"Processes: {stats.process_count}")
         """
-        response = await self.client._make_request(
-            'GET',
-            f'containers/{self.container_id}/stats'
+        return await self._singleflight(
+            'stats',
+            lambda: self._get_model(self._p_stats, ContainerStats)
         )
-        return ContainerStats.from_dict(response)
     
     async def exec(
         self,
@@ -143,12 +308,14 @@ class ContainerManager:
         if environment:
             data['environment'] = environment
         
-        response = await self.client._make_request(
+        # Bodies are pre-encoded; the client's default Content-Type header
+        # already declares application/json.
+        response = await self._req(
             'POST',
-            f'containers/{self.container_id}/exec',
-            json=data
+            self._p_exec,
+            content=_json.dumps(data)
         )
-        return ContainerExecResult.from_dict(response)
+        return ContainerExecResult.model_validate(response)
     
     async def get_processes(self) -> ContainerProcessList:
         """
@@ -166,11 +333,10 @@ class ContainerManager:
             >>> for proc in processes.processes:
             ...     print(f"  PID {proc.pid}: {proc.command} ({proc.cpu_percent}% CPU)")
         """
-        response = await self.client._make_request(
-            'GET',
-            f'containers/{self.container_id}/processes'
+        return await self._singleflight(
+            'processes',
+            lambda: self._get_model(self._p_procs, ContainerProcessList)
         )
-        return ContainerProcessList.from_dict(response)
     
     async def restart(self) -> Dict[str, Any]:
         """
@@ -189,10 +355,11 @@ class ContainerManager:
             >>> result = await workspace.containers.restart()
             >>> print(result['message'])  # Container restarted successfully
         """
-        response = await self.client._make_request(
+        response = await self._req(
             'POST',
-            f'containers/{self.container_id}/restart'
+            self._p_restart
         )
+        self._invalidate()
         return response
     
     # ========================================================================
@@ -206,7 +373,9 @@ class ContainerManager:
         POST /api/v1/sdk/containers/{container_id}/heartbeat
         
         Call this periodically to keep the container alive when running
-        long background tasks. Resets the idle timeout timer.
+        long background tasks. Resets the idle timeout timer. Calls are
+        paced by the client's adaptive limiter: after a 429, further
+        heartbeats for this container wait out ``Retry-After`` first.
         
         Returns:
             HeartbeatResponse: Heartbeat status with next timeout timestamp
@@ -218,11 +387,12 @@ class ContainerManager:
             ...     heartbeat = await workspace.containers.heartbeat()
             ...     print(f"Next timeout: {heartbeat.next_timeout_at}")
         """
-        response = await self.client._make_request(
+        response = await self._limited_request(
+            'heartbeat',
             'POST',
-            f'containers/{self.container_id}/heartbeat'
+            self._p_hb
         )
-        return HeartbeatResponse.from_dict(response)
+        return HeartbeatResponse.model_validate(response)
     
     async def extend_timeout(
         self,
@@ -237,7 +407,9 @@ class ContainerManager:
         apply to how much time can be added and how many extensions allowed.
         
         Args:
-            additional_minutes: Minutes to add (1-480, tier-dependent max)
+            additional_minutes: Minutes to add (1-480, tier-dependent max).
+                Values outside 1-480 are clamped before sending; check
+                ``minutes_extended`` on the response for the applied value.
         
         Returns:
             TimeoutExtensionResponse: Extension confirmation with new timeout
@@ -251,12 +423,15 @@ class ContainerManager:
             >>> print(f"New timeout: {ext.new_timeout_at}")
             >>> print(f"Max allowed: {ext.max_allowed_minutes}")
         """
-        response = await self.client._make_request(
+        response = await self._limited_request(
+            'extend-timeout',
             'POST',
-            f'containers/{self.container_id}/extend-timeout',
-            json={'additional_minutes': max(1, min(480, additional_minutes))}
+            self._p_ext,
+            content=_json.dumps({
+                'additional_minutes': clamp(additional_minutes, _EXTEND_MIN_MINUTES, _EXTEND_MAX_MINUTES)
+            })
         )
-        return TimeoutExtensionResponse.from_dict(response)
+        return TimeoutExtensionResponse.model_validate(response)
     
     async def set_keep_alive(self, enabled: bool = True) -> KeepAliveResponse:
         """
@@ -282,12 +457,13 @@ class ContainerManager:
             >>> if result.keep_alive_enabled:
             ...     print("Container will never auto-shutdown")
         """
-        response = await self.client._make_request(
+        response = await self._limited_request(
+            'keep-alive',
             'POST',
-            f'containers/{self.container_id}/keep-alive',
-            json={'enabled': enabled}
+            self._p_ka,
+            content=_json.dumps({'enabled': enabled})
         )
-        return KeepAliveResponse.from_dict(response)
+        return KeepAliveResponse.model_validate(response)
     
     async def hibernate(self) -> HibernationResponse:
         """
@@ -313,11 +489,12 @@ class ContainerManager:
             >>> # Later, wake it up
             >>> await workspace.containers.wake()
         """
-        response = await self.client._make_request(
+        response = await self._req(
             'POST',
-            f'containers/{self.container_id}/hibernate'
+            self._p_hib
         )
-        return HibernationResponse.from_dict(response)
+        self._invalidate()
+        return HibernationResponse.model_validate(response)
     
     async def wake(self) -> HibernationResponse:
         """
@@ -337,11 +514,12 @@ class ContainerManager:
             >>> if result.estimated_resume_seconds:
             ...     print(f"Ready in ~{result.estimated_resume_seconds}s")
         """
-        response = await self.client._make_request(
+        response = await self._req(
             'POST',
-            f'containers/{self.container_id}/wake'
+            self._p_wake
         )
-        return HibernationResponse.from_dict(response)
+        self._invalidate()
+        return HibernationResponse.model_validate(response)
     
     async def get_lifecycle_status(self) -> LifecycleStatus:
         """
@@ -364,11 +542,11 @@ class ContainerManager:
             >>> if status.keep_alive_enabled:
             ...     print("Keep-alive is ON")
         """
-        response = await self.client._make_request(
-            'GET',
-            f'containers/{self.container_id}/lifecycle'
+        return await self._singleflight(
+            'lifecycle',
+            lambda: self._get_model(self._p_life, LifecycleStatus, conditional=True),
+            ttl=_STATE_TTL_SECONDS
         )
-        return LifecycleStatus.from_dict(response)
     
     async def configure_lifecycle(
         self,
@@ -403,10 +581,11 @@ class ContainerManager:
             >>> status = await workspace.containers.configure_lifecycle(config)
             >>> print(f"Configured: {status.idle_timeout_minutes}min timeout")
         """
-        response = await self.client._make_request(
+        response = await self._req(
             'PUT',
-            f'containers/{self.container_id}/lifecycle',
-            json=config.to_dict()
+            self._p_life,
+            content=_serialize_lifecycle(config)
         )
-        return LifecycleStatus.from_dict(response)
+        self._invalidate('lifecycle')
+        return LifecycleStatus.model_validate(response)
 
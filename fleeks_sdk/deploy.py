@@ -13,11 +13,15 @@ All methods are async and route through the parent FleeksClient,
 which prepends ``/api/v1/sdk/`` to each endpoint automatically.
 """
 
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union, TYPE_CHECKING
+
+from pydantic import TypeAdapter, ValidationError
 
 if TYPE_CHECKING:
     from .client import FleeksClient
 
+from . import _json
 from .models import (
     DeployResponse,
     DeployStatus,
@@ -34,11 +38,77 @@ from .models import (
 )
 
 
+# Validates a whole JSON array of deployments in one pydantic-core call.
+_DEPLOY_LIST = TypeAdapter(List[DeployListItem])
+
+# Status GETs in flight at once for ``status_many``; well under the pool size.
+_STATUS_CONCURRENCY = 20
+
+_SSE_DATA = b"data: "
+_SSE_DATA_LEN = len(_SSE_DATA)
+_CR = 0x0D
+
+
+def _decode_sse_payload(payload: bytes) -> Dict[str, Any]:
+    """Parse one SSE ``data:`` payload, wrapping non-JSON text as ``{"raw": ...}``."""
+    try:
+        return _json.loads(payload)
+    except _json.JSONDecodeError:
+        return {"raw": payload.decode("utf-8", "replace")}
+
+
+def _sse_payload(buf: bytearray, start: int, end: int) -> Optional[bytearray]:
+    """
+    Return the ``data:`` payload of the line ``buf[start:end]``, or None.
+
+    The prefix test runs in place on the buffer; only the payload itself
+    (minus a trailing CR) is copied out.
+    """
+    if not buf.startswith(_SSE_DATA, start, end):
+        return None
+    if end > start and buf[end - 1] == _CR:
+        end -= 1
+    return buf[start + _SSE_DATA_LEN:end]
+
+
+async def _iter_sse_data(chunks: AsyncIterator[bytes]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Parse ``data:`` payloads out of a raw Server-Sent Events byte stream.
+
+    Lines are framed on the raw bytes (LF or CRLF endings) and each
+    payload is handed to the JSON parser without decoding to ``str`` first.
+    """
+    buf = bytearray()
+    async for chunk in chunks:
+        buf += chunk
+        start = 0
+        while True:
+            end = buf.find(b"\n", start)
+            if end == -1:
+                break
+            payload = _sse_payload(buf, start, end)
+            start = end + 1
+            if payload is not None:
+                yield _decode_sse_payload(payload)
+        del buf[:start]
+    # A final line without a trailing newline is still a complete line.
+    payload = _sse_payload(buf, 0, len(buf))
+    if payload is not None:
+        yield _decode_sse_payload(payload)
+
+
 class DeployManager:
     """Manage project deployments via the Fleeks SDK."""
 
+    __slots__ = ('_client', '_get', '_get_bytes', '_post', '_delete')
+
     def __init__(self, client: "FleeksClient"):
         self._client = client
+        # Bind the HTTP helpers once instead of looking them up per call.
+        self._get = client.get
+        self._get_bytes = client.get_bytes
+        self._post = client.post
+        self._delete = client.delete
 
     # ── Create ───────────────────────────────────────────────
 
@@ -66,7 +136,7 @@ class DeployManager:
         if env_vars:
             body["env_vars"] = env_vars
 
-        data = await self._client.post("deploy", json=body)
+        data = await self._post("deploy", json=body)
         return DeployResponse.from_dict(data)
 
     # ── Status ───────────────────────────────────────────────
@@ -81,9 +151,36 @@ class DeployManager:
         Returns:
             DeployStatus with full deployment details.
         """
-        data = await self._client.get(f"deploy/{deployment_id}")
+        data = await self._get(f"deploy/{deployment_id}")
         return DeployStatus.from_dict(data)
 
+    async def status_many(
+        self,
+        deployment_ids: Iterable[int],
+        concurrency: int = _STATUS_CONCURRENCY,
+    ) -> List[DeployStatus]:
+        """
+        Get the status of several deployments concurrently.
+
+        Requests share the client's connection pool (multiplexed over one
+        connection with HTTP/2), at most ``concurrency`` at a time, so prefer
+        this over awaiting ``status()`` in a loop.
+
+        Args:
+            deployment_ids: Deployment IDs to look up.
+            concurrency: Maximum requests in flight.
+
+        Returns:
+            DeployStatus objects in the same order as ``deployment_ids``.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(deployment_id: int) -> DeployStatus:
+            async with semaphore:
+                return await self.status(deployment_id)
+
+        return list(await asyncio.gather(*(fetch(i) for i in deployment_ids)))
+
     # ── Logs ─────────────────────────────────────────────────
 
     async def logs(self, deployment_id: int) -> DeployLogs:
@@ -104,7 +201,7 @@ class DeployManager:
         Returns:
             DeployLogs with ``deployment_id``, ``status``, ``source``, and ``logs``.
         """
-        data = await self._client.get(f"deploy/{deployment_id}/logs")
+        data = await self._get(f"deploy/{deployment_id}/logs")
         return DeployLogs.from_dict(data)
 
     async def stream_logs(self, deployment_id: int):
@@ -126,19 +223,9 @@ class DeployManager:
             async for event in client.deploy.stream_logs(42):
                 print(f"[{event.get('stage')}] {event.get('message')}")
         """
-        import json as _json
-
-        await self._client._ensure_client()
-        url = f"/api/v1/sdk/deploy/{deployment_id}/logs/stream"
-        async with self._client._client.stream("GET", url) as resp:
-            resp.raise_for_status()
-            async for line in resp.aiter_lines():
-                if line.startswith("data: "):
-                    raw = line[6:]
-                    try:
-                        yield _json.loads(raw)
-                    except _json.JSONDecodeError:
-                        yield {"raw": raw}
+        async with self._client._stream("GET", f"deploy/{deployment_id}/logs/stream") as resp:
+            async for event in _iter_sse_data(resp.aiter_bytes()):
+                yield event
 
     # ── Provision Database ────────────────────────────────────
 
@@ -177,7 +264,7 @@ class DeployManager:
         }
         if env_var_name:
             body["env_var_name"] = env_var_name
-        data = await self._client.post("deploy/provision-db", json=body)
+        data = await self._post("deploy/provision-db", json=body)
         return ProvisionDbResult.from_dict(data)
 
     # ── Mobile Distribution ───────────────────────────────────
@@ -218,7 +305,7 @@ class DeployManager:
         import os
         filename = os.path.basename(artifact_path)
         files = {"artifact": (filename, content, "application/octet-stream")}
-        data = await self._client.post(
+        data = await self._post(
             "deploy/distribute/mobile",
             files=files,
             params=params,
@@ -269,7 +356,7 @@ class DeployManager:
                     content = await fh.read()
                 files[platform_key] = (os.path.basename(path), content, "application/octet-stream")
 
-        data = await self._client.post(
+        data = await self._post(
             "deploy/distribute/desktop",
             files=files,
             params=params,
@@ -288,7 +375,7 @@ class DeployManager:
         Returns:
             Dict with ``success``, ``revision``, and ``message``.
         """
-        return await self._client.post(f"deploy/{deployment_id}/rollback")
+        return await self._post(f"deploy/{deployment_id}/rollback")
 
     # ── Delete ───────────────────────────────────────────────
 
@@ -303,7 +390,7 @@ class DeployManager:
         Returns:
             Dict with ``success``, ``message``, ``service_name``.
         """
-        return await self._client.delete(f"deploy/{deployment_id}")
+        return await self._delete(f"deploy/{deployment_id}")
 
     # ── List ─────────────────────────────────────────────────
 
@@ -322,14 +409,21 @@ class DeployManager:
         Returns:
             List of DeployListItem objects.
         """
-        data = await self._client.get(
+        raw = await self._get_bytes(
             "deploy/list",
             params={"project_id": str(project_id), "limit": str(limit)},
         )
-        # Backend returns a list directly or wrapped in an object
-        items = data if isinstance(data, list) else data.get("deployments", data)
-        if isinstance(items, list):
-            return [DeployListItem.from_dict(d) for d in items]
+        # Backend returns a list directly (parsed straight from the bytes)
+        # or wrapped in an object
+        try:
+            if raw.lstrip()[:1] == b"[":
+                return _DEPLOY_LIST.validate_json(raw)
+            data = _json.loads(raw) if raw.strip() else {}
+            items = data.get("deployments", data) if isinstance(data, dict) else data
+            if isinstance(items, list):
+                return _DEPLOY_LIST.validate_python(items)
+        except ValidationError as e:
+            raise _json.invalid_response(DeployListItem, e) from e
         return []
 
     # ── Diagnose ─────────────────────────────────────────────
@@ -348,7 +442,7 @@ class DeployManager:
         Returns:
             DiagnoseResult with patterns_found, diagnosis, suggested_fixes.
         """
-        data = await self._client.post(f"deploy/{deployment_id}/diagnose")
+        data = await self._post(f"deploy/{deployment_id}/diagnose")
         return DiagnoseResult.from_dict(data)
 
     # ── Health ───────────────────────────────────────────────
@@ -366,7 +460,7 @@ class DeployManager:
         Returns:
             HealthCheckResult with status, revisions, traffic, url_check.
         """
-        data = await self._client.get(f"deploy/{deployment_id}/health")
+        data = await self._get(f"deploy/{deployment_id}/health")
         return HealthCheckResult.from_dict(data)
 
     # ── Runtime Logs ─────────────────────────────────────────
@@ -391,7 +485,7 @@ class DeployManager:
         Returns:
             RuntimeLogsResult with log entries, count, and error_count.
         """
-        data = await self._client.get(
+        data = await self._get(
             f"deploy/{deployment_id}/runtime-logs",
             params={"severity": severity, "limit": str(limit)},
         )
@@ -417,7 +511,7 @@ class DeployManager:
         Returns:
             MetricsResult with request_count, error_rate, latency_ms, instance_count.
         """
-        data = await self._client.get(
+        data = await self._get(
             f"deploy/{deployment_id}/metrics",
             params={"window_minutes": str(window_minutes)},
         )
@@ -454,7 +548,7 @@ class DeployManager:
         }
         if manifest_yaml:
             body["manifest_yaml"] = manifest_yaml
-        data = await self._client.post("deploy/multi", json=body)
+        data = await self._post("deploy/multi", json=body)
         return MultiDeployResult.from_dict(data)
 
     # ── Secrets ──────────────────────────────────────────────
@@ -484,7 +578,7 @@ class DeployManager:
             "secrets": secrets,
             "environment": environment,
         }
-        return await self._client.post("deploy/secrets", json=body)
+        return await self._post("deploy/secrets", json=body)
 
     async def list_secrets(self, project_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -496,7 +590,7 @@ class DeployManager:
         Returns:
             Dict with ``project_id``, ``secrets`` (list of key entries), ``count``.
         """
-        return await self._client.get(f"deploy/secrets/{project_id}")
+        return await self._get(f"deploy/secrets/{project_id}")
 
     async def delete_secrets(self, project_id: Union[int, str]) -> Dict[str, Any]:
         """
@@ -508,4 +602,4 @@ class DeployManager:
         Returns:
             Dict with ``success`` and ``message``.
         """
-        return await self._client.delete(f"deploy/secrets/{project_id}")
+        return await self._delete(f"deploy/secrets/{project_id}")
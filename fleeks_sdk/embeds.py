@@ -13,23 +13,42 @@ Backend endpoints:
 - GET /api/v1/embeds/ - List user's embeds
 - GET /api/v1/embeds/{embed_id} - Get embed details
 - PATCH /api/v1/embeds/{embed_id} - Update embed
+- PATCH /api/v1/embeds/{embed_id}/files/{path} - Update one file (newer backends)
 - DELETE /api/v1/embeds/{embed_id} - Delete embed
 - GET /api/v1/embeds/{embed_id}/sessions - List active sessions
+- DELETE /api/v1/embeds/{embed_id}/sessions - Terminate all sessions (newer backends)
 - DELETE /api/v1/embeds/{embed_id}/sessions/{session_id} - Terminate session
 - GET /api/v1/embeds/{embed_id}/analytics - Get analytics
 """
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, Any, List, Optional
+import asyncio
+import copy
+import logging
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from operator import attrgetter
+from typing import AsyncIterator, Awaitable, Dict, Any, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 from datetime import datetime
+from urllib.parse import quote
+
+from . import _json
+from ._cache import SingleFlight, TTLCache
+from ._compat import DATACLASS_SLOTS, StrEnum, clamp, enum_lookup
+from .exceptions import (
+    FleeksAPIError,
+    FleeksConnectionError,
+    FleeksTimeoutError,
+    FleeksValidationError,
+)
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
 # ENUMS
 # ============================================================================
 
-class EmbedTemplate(str, Enum):
+class EmbedTemplate(StrEnum):
     """
     Available embed templates.
     
@@ -76,7 +95,7 @@ class EmbedTemplate(str, Enum):
     DEFAULT = "default"
 
 
-class DisplayMode(str, Enum):
+class DisplayMode(StrEnum):
     """
     How the embed preview is rendered.
     
@@ -102,7 +121,7 @@ class DisplayMode(str, Enum):
     """Split between editor and terminal output."""
 
 
-class EmbedLayoutPreset(str, Enum):
+class EmbedLayoutPreset(StrEnum):
     """
     Embed UI layout options.
     
@@ -131,7 +150,7 @@ class EmbedLayoutPreset(str, Enum):
     """Tablet-sized preview frame."""
 
 
-class EmbedTheme(str, Enum):
+class EmbedTheme(StrEnum):
     """Color themes for embeds."""
     DARK = "dark"
     LIGHT = "light"
@@ -145,18 +164,71 @@ class EmbedTheme(str, Enum):
     SOLARIZED_LIGHT = "solarized-light"
 
 
-class EmbedStatus(str, Enum):
+class EmbedStatus(StrEnum):
     """Embed status."""
     ACTIVE = "active"
     PAUSED = "paused"
     ARCHIVED = "archived"
 
 
+# Plain-string value sets for cheap membership checks in pre-flight validation.
+_EMBED_TEMPLATES = frozenset(e.value for e in EmbedTemplate)
+_DISPLAY_MODES = frozenset(e.value for e in DisplayMode)
+
+# Value -> member tables for decoding settings without going through Enum.__call__.
+_LAYOUT_BY_VALUE: Dict[str, EmbedLayoutPreset] = {m.value: m for m in EmbedLayoutPreset}
+_THEME_BY_VALUE: Dict[str, EmbedTheme] = {m.value: m for m in EmbedTheme}
+
+
+def _validate_choice(value: str, allowed: frozenset, kind: str) -> str:
+    if value not in allowed:
+        raise FleeksValidationError(
+            f"Unknown {kind} {value!r}. Expected one of: {', '.join(sorted(allowed))}"
+        )
+    return value
+
+
+def validate_template(value: str) -> str:
+    """Return ``value`` if it is a known embed template, else raise ``FleeksValidationError``."""
+    return _validate_choice(value, _EMBED_TEMPLATES, 'embed template')
+
+
+def validate_display_mode(value: str) -> str:
+    """Return ``value`` if it is a known display mode, else raise ``FleeksValidationError``."""
+    return _validate_choice(value, _DISPLAY_MODES, 'display mode')
+
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+def _iso(value: Any) -> str:
+    """Timestamp as an ISO-8601 string; JSON payloads already carry strings."""
+    if value.__class__ is str:
+        return value
+    try:
+        return value.isoformat()
+    except AttributeError:
+        return str(value)
+
+
+def _pickle_by_fields(cls):
+    """
+    Pickle instances of dataclass ``cls`` as ``cls(*field_values)``.
+    
+    Cheaper than the default slots state protocol for records that are
+    cached or sent between processes.
+    """
+    getter = attrgetter(*(f.name for f in fields(cls)))
+
+    def __reduce__(self):
+        return (cls, getter(self))
+
+    cls.__reduce__ = __reduce__
+    return cls
+
+
+@dataclass(**DATACLASS_SLOTS)
 class EmbedSettings:
     """
     Embed display and behavior settings.
@@ -183,12 +255,21 @@ class EmbedSettings:
     hide_navigation: bool = False
     font_size: int = 14
     tab_size: int = 2
+
+    def __post_init__(self):
+        # Accept plain strings ("stacked", "nord") as well as enum members.
+        if self.layout.__class__ is not EmbedLayoutPreset:
+            self.layout = enum_lookup(EmbedLayoutPreset, self.layout)
+        if self.theme.__class__ is not EmbedTheme:
+            self.theme = enum_lookup(EmbedTheme, self.theme)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for API request."""
+        # ``_value_`` is a plain member attribute; ``.value`` goes through
+        # the enum property descriptor on every call.
         return {
-            'layout': self.layout.value,
-            'theme': self.theme.value,
+            'layout': self.layout._value_,
+            'theme': self.theme._value_,
             'read_only': self.read_only,
             'show_terminal': self.show_terminal,
             'show_file_tree': self.show_file_tree,
@@ -201,22 +282,28 @@ class EmbedSettings:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EmbedSettings':
-        """Create from API response dict."""
+        """
+        Create from API response dict.
+        
+        Layouts or themes this SDK version does not know fall back to the
+        defaults rather than failing the whole response.
+        """
+        get = data.get
         return cls(
-            layout=EmbedLayoutPreset(data.get('layout', 'side-by-side')),
-            theme=EmbedTheme(data.get('theme', 'dark')),
-            read_only=data.get('read_only', False),
-            show_terminal=data.get('show_terminal', True),
-            show_file_tree=data.get('show_file_tree', True),
-            show_console=data.get('show_console', True),
-            auto_run=data.get('auto_run', True),
-            hide_navigation=data.get('hide_navigation', False),
-            font_size=data.get('font_size', 14),
-            tab_size=data.get('tab_size', 2)
+            layout=_LAYOUT_BY_VALUE.get(get('layout'), EmbedLayoutPreset.SIDE_BY_SIDE),
+            theme=_THEME_BY_VALUE.get(get('theme'), EmbedTheme.DARK),
+            read_only=get('read_only', False),
+            show_terminal=get('show_terminal', True),
+            show_file_tree=get('show_file_tree', True),
+            show_console=get('show_console', True),
+            auto_run=get('auto_run', True),
+            hide_navigation=get('hide_navigation', False),
+            font_size=get('font_size', 14),
+            tab_size=get('tab_size', 2)
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EmbedFile:
     """
     A file in an embed's initial file set.
@@ -232,28 +319,35 @@ class EmbedFile:
     hidden: bool = False
     active: bool = False
     
+    _FIELDS = ('code', 'hidden', 'active')  # ``path`` is the key, not a field
+    _GET_FIELDS = attrgetter(*_FIELDS)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for API request."""
-        return {
-            'code': self.code,
-            'hidden': self.hidden,
-            'active': self.active
-        }
+        return dict(zip(self._FIELDS, self._GET_FIELDS(self)))
     
     @classmethod
     def from_dict(cls, path: str, data: Dict[str, Any]) -> 'EmbedFile':
         """Create from API response dict."""
         if isinstance(data, str):
             return cls(path=path, code=data)
+        get = data.get
         return cls(
             path=path,
-            code=data.get('code', ''),
-            hidden=data.get('hidden', False),
-            active=data.get('active', False)
+            code=get('code', ''),
+            hidden=get('hidden', False),
+            active=get('active', False)
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
+class _FileUpdate:
+    """File body in an update request; encodes as ``{"code": ...}``."""
+    code: str
+
+
+@_pickle_by_fields
+@dataclass(**DATACLASS_SLOTS)
 class EmbedInfo:
     """
     Embed information - matches backend SDKEmbedResponse.
@@ -305,71 +399,83 @@ class EmbedInfo:
     total_views: Optional[int] = None
     active_sessions: Optional[int] = None
     
+    # Serialized keys, in API order; ``to_dict`` reads them in one C-level call.
+    _FIELDS = (
+        'id', 'name', 'description', 'template', 'display_mode',
+        'project_category', 'embed_url', 'iframe_html', 'files',
+        'allowed_origins', 'max_sessions', 'session_timeout_minutes',
+        'is_active', 'is_public', 'requires_streaming', 'owner_tier',
+        'min_required_tier', 'is_tier_sufficient', 'total_views',
+        'active_sessions', 'created_at', 'updated_at',
+    )
+    _GET_FIELDS = attrgetter(*_FIELDS)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EmbedInfo':
-        """Create from API response dict."""
-        # Handle datetime conversion
-        created_at = data.get('created_at', '')
-        updated_at = data.get('updated_at', created_at)
-        if hasattr(created_at, 'isoformat'):
-            created_at = created_at.isoformat()
-        if hasattr(updated_at, 'isoformat'):
-            updated_at = updated_at.isoformat()
+        """
+        Create from API response dict.
+        
+        ``files`` and ``allowed_origins`` are copied, so the instance never
+        aliases ``data``, which the manager's response cache may share.
+        """
+        get = data.get
+        embed_id = data['id']
+        created_at = _iso(get('created_at', ''))
+        updated_at = get('updated_at')
+        files = get('files')
+        origins = get('allowed_origins')
         
         return cls(
-            id=data['id'],
+            id=embed_id,
             name=data['name'],
-            description=data.get('description'),
-            template=data.get('template', 'default'),
-            display_mode=data.get('display_mode', 'web_preview'),
-            project_category=data.get('project_category', 'other'),
-            embed_url=data.get('embed_url', f"https://embed.fleeks.ai/{data['id']}"),
-            iframe_html=data.get('iframe_html', ''),
-            files=data.get('files', {}),
-            allowed_origins=data.get('allowed_origins', ['*']),
-            max_sessions=data.get('max_sessions', 100),
-            session_timeout_minutes=data.get('session_timeout_minutes', 30),
-            is_active=data.get('is_active', True),
-            is_public=data.get('is_public', True),
-            requires_streaming=data.get('requires_streaming', False),
-            owner_tier=data.get('owner_tier', 'FREE'),
-            min_required_tier=data.get('min_required_tier', 'FREE'),
-            is_tier_sufficient=data.get('is_tier_sufficient', True),
-            total_views=data.get('total_views'),
-            active_sessions=data.get('active_sessions'),
-            created_at=str(created_at),
-            updated_at=str(updated_at)
+            description=get('description'),
+            template=get('template', 'default'),
+            display_mode=get('display_mode', 'web_preview'),
+            project_category=get('project_category', 'other'),
+            embed_url=data['embed_url'] if 'embed_url' in data else f"https://embed.fleeks.ai/{embed_id}",
+            iframe_html=get('iframe_html', ''),
+            files={} if files is None else {
+                path: dict(f) if f.__class__ is dict else f for path, f in files.items()
+            },
+            allowed_origins=['*'] if origins is None else list(origins),
+            max_sessions=get('max_sessions', 100),
+            session_timeout_minutes=get('session_timeout_minutes', 30),
+            is_active=get('is_active', True),
+            is_public=get('is_public', True),
+            requires_streaming=get('requires_streaming', False),
+            owner_tier=get('owner_tier', 'FREE'),
+            min_required_tier=get('min_required_tier', 'FREE'),
+            is_tier_sufficient=get('is_tier_sufficient', True),
+            total_views=get('total_views'),
+            active_sessions=get('active_sessions'),
+            created_at=created_at,
+            updated_at=created_at if updated_at is None else _iso(updated_at)
         )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for serialization."""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'template': self.template,
-            'display_mode': self.display_mode,
-            'project_category': self.project_category,
-            'embed_url': self.embed_url,
-            'iframe_html': self.iframe_html,
-            'files': self.files,
-            'allowed_origins': self.allowed_origins,
-            'max_sessions': self.max_sessions,
-            'session_timeout_minutes': self.session_timeout_minutes,
-            'is_active': self.is_active,
-            'is_public': self.is_public,
-            'requires_streaming': self.requires_streaming,
-            'owner_tier': self.owner_tier,
-            'min_required_tier': self.min_required_tier,
-            'is_tier_sufficient': self.is_tier_sufficient,
-            'total_views': self.total_views,
-            'active_sessions': self.active_sessions,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+        return dict(zip(self._FIELDS, self._GET_FIELDS(self)))
 
+    def get_file(self, path: str) -> Optional[EmbedFile]:
+        """
+        Return one file as an ``EmbedFile``, or None if it is not present.
+        
+        ``files`` keeps the raw response mapping; typed ``EmbedFile``
+        objects are only built for the files actually requested.
+        """
+        data = self.files.get(path)
+        if data is None:
+            return None
+        return EmbedFile.from_dict(path, data)
+    
+    def iter_files(self) -> Iterator[EmbedFile]:
+        """Yield every file as an ``EmbedFile``, decoding one at a time."""
+        for path, data in self.files.items():
+            yield EmbedFile.from_dict(path, data)
 
-@dataclass
+
+@_pickle_by_fields
+@dataclass(**DATACLASS_SLOTS)
 class EmbedSession:
     """
     An active embed session.
@@ -398,27 +504,28 @@ class EmbedSession:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EmbedSession':
         """Create from API response dict."""
-        # Handle datetime conversion
-        started_at = data.get('started_at', '')
-        last_activity = data.get('last_activity_at')
-        if hasattr(started_at, 'isoformat'):
-            started_at = started_at.isoformat()
-        if last_activity and hasattr(last_activity, 'isoformat'):
-            last_activity = last_activity.isoformat()
+        get = data.get
+        started = get('started_at', '')
+        last_activity = get('last_activity_at') or None
         
         return cls(
             session_id=data['session_id'],
-            display_mode=data.get('display_mode', 'web_preview'),
-            status=data.get('status', 'active'),
-            origin_url=data.get('origin_url'),
-            started_at=str(started_at),
-            last_activity_at=str(last_activity) if last_activity else None,
-            is_streaming=data.get('is_streaming', False),
-            metrics=data.get('metrics', {})
+            display_mode=get('display_mode', 'web_preview'),
+            status=get('status', 'active'),
+            origin_url=get('origin_url'),
+            # JSON timestamps are already strings; only convert anything else.
+            started_at=started if started.__class__ is str else _iso(started),
+            last_activity_at=(
+                last_activity if last_activity is None or last_activity.__class__ is str
+                else _iso(last_activity)
+            ),
+            is_streaming=get('is_streaming', False),
+            metrics=get('metrics', {})
         )
 
 
-@dataclass
+@_pickle_by_fields
+@dataclass(**DATACLASS_SLOTS)
 class EmbedAnalytics:
     """
     Analytics data for an embed.
@@ -447,25 +554,25 @@ class EmbedAnalytics:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EmbedAnalytics':
         """Create from API response dict."""
+        get = data.get
         return cls(
             embed_id=data['embed_id'],
-            period=data.get('period', '30d'),
-            total_views=data.get('total_views', 0),
-            unique_visitors=data.get('unique_visitors', 0),
-            total_sessions=data.get('total_sessions', 0),
-            average_session_duration_seconds=data.get('average_session_duration_seconds', 0),
-            top_origins=data.get('top_origins', []),
-            views_by_day=data.get('views_by_day', []),
-            sessions_by_day=data.get('sessions_by_day', [])
+            period=get('period', '30d'),
+            total_views=get('total_views', 0),
+            unique_visitors=get('unique_visitors', 0),
+            total_sessions=get('total_sessions', 0),
+            average_session_duration_seconds=get('average_session_duration_seconds', 0),
+            top_origins=get('top_origins', []),
+            views_by_day=get('views_by_day', []),
+            sessions_by_day=get('sessions_by_day', [])
         )
 
 
-@dataclass
-class EmbedStatusChangeResponse:
+class EmbedStatusChangeResponse(NamedTuple):
     """
     Response from embed status change operations (pause, resume, archive).
     
-    Matches backend: EmbedStatusChangeResponse
+    Matches backend: EmbedStatusChangeResponse. A read-only named tuple.
     
     Attributes:
         id: Embed ID
@@ -481,11 +588,12 @@ class EmbedStatusChangeResponse:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EmbedStatusChangeResponse':
         """Create from API response dict."""
+        get = data.get
         return cls(
-            id=data['id'],
-            status=data.get('status', 'unknown'),
-            previous_status=data.get('previous_status', 'unknown'),
-            message=data.get('message', '')
+            data['id'],
+            get('status', 'unknown'),
+            get('previous_status', 'unknown'),
+            get('message', '')
         )
 
 
@@ -493,6 +601,16 @@ class EmbedStatusChangeResponse:
 # EMBED CLASS
 # ============================================================================
 
+_IFRAME_TEMPLATE = (
+    '<iframe src="{url}" '
+    'width="100%" height="500px" '
+    'frameborder="0" '
+    'allow="clipboard-read; clipboard-write" '
+    'sandbox="allow-scripts allow-same-origin allow-forms allow-popups">'
+    '</iframe>'
+)
+
+
 class Embed:
     """
     A single embed instance.
@@ -524,8 +642,18 @@ class Embed:
         self.client = client
         self.id = info.id
         self.info = info
-    
-    @property
+        # True when served from EmbedManager's last-good cache after a
+        # failed request (``stale_on_error=True``).
+        self.stale = False
+        # Request paths, built once per embed.
+        self._path = f'embeds/{info.id}'
+        self._p_sessions = f'{self._path}/sessions'
+        self._p_analytics = f'{self._path}/analytics'
+        # (path, params) -> (response body, parsed result) for conditional GETs
+        self._etag: Dict[tuple, tuple] = {}
+        self._inflight = SingleFlight()
+    
+    @cached_property
     def embed_url(self) -> str:
         """
         URL to embed in iframe.
@@ -539,7 +667,7 @@ class Embed:
         """
         return f"https://embed.fleeks.ai/{self.id}"
     
-    @property
+    @cached_property
     def iframe_html(self) -> str:
         """
         Ready-to-use iframe HTML.
@@ -551,16 +679,9 @@ class Embed:
             >>> print(embed.iframe_html)
             <iframe src="https://embed.fleeks.ai/emb_abc123" ...></iframe>
         """
-        return (
-            f'<iframe src="{self.embed_url}" '
-            f'width="100%" height="500px" '
-            f'frameborder="0" '
-            f'allow="clipboard-read; clipboard-write" '
-            f'sandbox="allow-scripts allow-same-origin allow-forms allow-popups">'
-            f'</iframe>'
-        )
+        return _IFRAME_TEMPLATE.format(url=self.embed_url)
     
-    @property
+    @cached_property
     def markdown_embed(self) -> str:
         """
         Markdown embed code for documentation.
@@ -570,16 +691,60 @@ class Embed:
         """
         return f'<FleeksEmbed id="{self.id}" />'
     
-    async def refresh(self) -> 'Embed':
+    async def refresh(self, fields: Optional[Sequence[str]] = None) -> 'Embed':
         """
         Refresh embed info from API.
         
+        Revalidates with ``If-None-Match``; when the embed is unchanged
+        (304) the current info is kept without re-parsing.
+        
+        Args:
+            fields: Only fetch these EmbedInfo fields (sent as ``?fields=``).
+                Other fields keep their current values. Skipping ``files``
+                and ``iframe_html`` makes metadata polling much cheaper.
+        
         Returns:
             Embed: Self with updated info
+        
+        Example:
+            >>> await embed.refresh(fields=["active_sessions", "total_views"])
         """
-        response = await self.client.get(f'embeds/{self.id}')
-        self.info = EmbedInfo.from_dict(response)
+        if fields:
+            response = await self.client.get(
+                self._path,
+                params={'fields': ','.join(fields)}
+            )
+            self.info = EmbedInfo.from_dict({**self.info.to_dict(), **response})
+            return self
+        self.info = await self._get_conditional(self._path, EmbedInfo.from_dict)
         return self
+
+    async def _get_conditional(self, path: str, parse, params: Optional[Dict[str, Any]] = None):
+        """
+        GET ``path`` with ``If-None-Match`` and parse the response.
+
+        Concurrent calls for the same path and params share one request.
+        On 304 the client hands back the previous body object, and the result
+        parsed from it is reused without re-parsing.
+        """
+        key = (path, tuple(sorted(params.items())) if params else None)
+        return await self._inflight.do(key, lambda: self._fetch_conditional(key, parse, params))
+
+    async def _fetch_conditional(self, key: tuple, parse, params: Optional[Dict[str, Any]]):
+        kwargs = {'params': params} if params else {}
+        response = await self.client._make_request('GET', key[0], _conditional=True, **kwargs)
+        previous = self._etag.get(key)
+        if previous is not None and previous[0] is response:
+            return previous[1]
+        parsed = parse(response)
+        self._etag[key] = (response, parsed)
+        return parsed
+    
+    def _invalidate_cached(self) -> None:
+        """Drop this embed from the manager's response cache, if one exists."""
+        manager = getattr(self.client, '_embeds', None)
+        if manager is not None:
+            manager.invalidate(self.id)
     
     async def update(
         self,
@@ -620,7 +785,7 @@ class Embed:
         if description is not None:
             data['description'] = description
         if files is not None:
-            data['files'] = {k: {'code': v} for k, v in files.items()}
+            data['files'] = {k: _FileUpdate(v) for k, v in files.items()}
         if allowed_origins is not None:
             data['allowed_origins'] = allowed_origins
         if settings is not None:
@@ -630,7 +795,8 @@ class Embed:
         if max_sessions is not None:
             data['max_sessions'] = max_sessions
         
-        response = await self.client.patch(f'embeds/{self.id}', json=data)
+        response = await self.client.patch(self._path, content=_json.dumps(data))
+        self._invalidate_cached()
         self.info = EmbedInfo.from_dict(response)
         return self
     
@@ -644,8 +810,23 @@ class Embed:
         
         Returns:
             Embed: Self with updated info
+        
+        Sends only this file to the per-file endpoint; backends without it
+        (404/405/501) get the equivalent ``update(files={path: content})``.
+        The response carries the updated EmbedInfo, so no refresh is needed.
         """
-        return await self.update(files={path: content})
+        try:
+            response = await self.client.patch(
+                f'{self._path}/files/{quote(path)}',
+                content=_json.dumps({'code': content})
+            )
+        except FleeksAPIError as e:
+            if e.status_code not in (404, 405, 501):
+                raise
+            return await self.update(files={path: content})
+        self._invalidate_cached()
+        self.info = EmbedInfo.from_dict(response)
+        return self
     
     async def get_sessions(self) -> List[EmbedSession]:
         """
@@ -660,12 +841,29 @@ class Embed:
             >>> for s in sessions:
             ...     print(f"  {s.origin_url}: started {s.started_at}")
         """
-        response = await self.client.get(f'embeds/{self.id}/sessions')
+        response = await self.client.get(self._p_sessions)
         return [
             EmbedSession.from_dict(s) 
             for s in response.get('sessions', [])
         ]
     
+    async def iter_sessions(self) -> AsyncIterator[EmbedSession]:
+        """
+        Yield active sessions one at a time.
+        
+        Sessions are decoded as they are consumed, so stopping early (e.g.
+        once a matching origin is found) skips parsing the rest.
+        
+        Example:
+            >>> async for s in embed.iter_sessions():
+            ...     if s.origin_url == "https://docs.example.com":
+            ...         await embed.terminate_session(s.session_id)
+            ...         break
+        """
+        response = await self.client.get(self._p_sessions)
+        for s in response.get('sessions', ()):
+            yield EmbedSession.from_dict(s)
+    
     async def terminate_session(self, session_id: str) -> None:
         """
         Terminate a specific session.
@@ -673,19 +871,53 @@ class Embed:
         Args:
             session_id: Session ID to terminate
         """
-        await self.client.delete(f'embeds/{self.id}/sessions/{session_id}')
+        await self.client.delete(f'{self._p_sessions}/{session_id}')
     
     async def terminate_all_sessions(self) -> int:
         """
         Terminate all active sessions.
         
+        Uses the bulk ``DELETE embeds/{id}/sessions`` endpoint when the
+        backend provides it; otherwise terminates sessions concurrently.
+        
         Returns:
             int: Number of sessions terminated
         """
         sessions = await self.get_sessions()
-        for session in sessions:
-            await self.terminate_session(session.session_id)
-        return len(sessions)
+        if not sessions:
+            return 0
+        if await self._bulk_terminate_sessions():
+            return len(sessions)
+
+        # Older backends: one DELETE per session, issued concurrently.
+        results = await asyncio.gather(
+            *(self.terminate_session(s.session_id) for s in sessions),
+            return_exceptions=True
+        )
+        terminated = 0
+        for result in results:
+            if result is None:
+                terminated += 1
+            elif isinstance(result, FleeksAPIError) and result.status_code == 404:
+                terminated += 1  # session ended on its own meanwhile
+            else:
+                raise result
+        return terminated
+
+    async def _bulk_terminate_sessions(self) -> bool:
+        """
+        Terminate every session with one request.
+
+        Returns False when the backend has no bulk endpoint (404/405/501),
+        so the caller can fall back to per-session deletes.
+        """
+        try:
+            await self.client.delete(self._p_sessions)
+        except FleeksAPIError as e:
+            if e.status_code in (404, 405, 501):
+                return False
+            raise
+        return True
     
     async def get_analytics(
         self,
@@ -706,11 +938,11 @@ class Embed:
             >>> print(f"Unique visitors: {analytics.unique_visitors}")
             >>> print(f"Avg session: {analytics.average_session_duration_seconds}s")
         """
-        response = await self.client.get(
-            f'embeds/{self.id}/analytics',
+        return await self._get_conditional(
+            self._p_analytics,
+            EmbedAnalytics.from_dict,
             params={'period': period}
         )
-        return EmbedAnalytics.from_dict(response)
     
     async def pause(self) -> EmbedStatusChangeResponse:
         """
@@ -722,7 +954,8 @@ class Embed:
         Returns:
             EmbedStatusChangeResponse: Status change confirmation
         """
-        response = await self.client.post(f'embeds/{self.id}/pause')
+        response = await self.client.post(self._path + '/pause')
+        self._invalidate_cached()
         return EmbedStatusChangeResponse.from_dict(response)
     
     async def resume(self) -> EmbedStatusChangeResponse:
@@ -732,7 +965,8 @@ class Embed:
         Returns:
             EmbedStatusChangeResponse: Status change confirmation
         """
-        response = await self.client.post(f'embeds/{self.id}/resume')
+        response = await self.client.post(self._path + '/resume')
+        self._invalidate_cached()
         return EmbedStatusChangeResponse.from_dict(response)
     
     async def archive(self) -> EmbedStatusChangeResponse:
@@ -745,7 +979,8 @@ class Embed:
         Returns:
             EmbedStatusChangeResponse: Status change confirmation
         """
-        response = await self.client.post(f'embeds/{self.id}/archive')
+        response = await self.client.post(self._path + '/archive')
+        self._invalidate_cached()
         return EmbedStatusChangeResponse.from_dict(response)
     
     async def delete(self) -> None:
@@ -755,7 +990,8 @@ class Embed:
         This terminates all sessions and removes the embed.
         This action cannot be undone.
         """
-        await self.client.delete(f'embeds/{self.id}')
+        await self.client.delete(self._path)
+        self._invalidate_cached()
     
     async def duplicate(self, new_name: Optional[str] = None) -> 'Embed':
         """
@@ -768,9 +1004,10 @@ class Embed:
             Embed: New embed instance
         """
         response = await self.client.post(
-            f'embeds/{self.id}/duplicate',
+            self._path + '/duplicate',
             json={'name': new_name or f"{self.info.name} (copy)"}
         )
+        self._invalidate_cached()
         return Embed(self.client, EmbedInfo.from_dict(response))
 
 
@@ -778,6 +1015,39 @@ class Embed:
 # EMBED MANAGER
 # ============================================================================
 
+# TTLs for the opt-in response cache (Config ``response_cache=True``).
+_LIST_TTL_SECONDS = 5.0
+_GET_TTL_SECONDS = 10.0
+_ANALYTICS_TTL_SECONDS = 30.0
+
+# Detail GETs in flight at once for ``list_detailed``; well under the pool size.
+_DETAIL_CONCURRENCY = 20
+
+# Serialized ``EmbedSettings`` for ``create``, keyed by its arguments. The
+# combinations are few, and the dicts are only ever encoded, never mutated.
+_SETTINGS_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# ``create`` arguments preset by the ``create_*`` convenience factories.
+_REACT_DEFAULTS: Dict[str, Any] = {'template': EmbedTemplate.REACT}
+_PYTHON_DEFAULTS: Dict[str, Any] = {
+    'template': EmbedTemplate.PYTHON,
+    'layout_preset': EmbedLayoutPreset.STACKED,
+    'display_mode': DisplayMode.SPLIT_VIEW,
+}
+_JUPYTER_DEFAULTS: Dict[str, Any] = {
+    'template': EmbedTemplate.JUPYTER,
+    'display_mode': DisplayMode.NOTEBOOK,
+    'layout_preset': EmbedLayoutPreset.FULL_IDE,
+    'show_terminal': False,
+}
+_STATIC_DEFAULTS: Dict[str, Any] = {'template': EmbedTemplate.STATIC}
+
+
+# Enum member (or equal plain string) -> wire value.
+_TEMPLATE_VALUES: Dict[str, str] = {m: m.value for m in EmbedTemplate}
+_DISPLAY_MODE_VALUES: Dict[str, str] = {m: m.value for m in DisplayMode}
+
+
 class EmbedManager:
     """
     Manager for embed operations.
@@ -808,6 +1078,110 @@ class EmbedManager:
             client: FleeksClient instance
         """
         self.client = client
+        config = client.config
+        self._cache_enabled = bool(config.response_cache)
+        self._stale_on_error = bool(config.stale_on_error)
+        self._stale_grace = float(config.stale_grace)
+        self._cache = TTLCache()
+        self._inflight = SingleFlight()
+        self._generation = 0
+    
+    def invalidate(self, embed_id: Optional[str] = None) -> None:
+        """
+        Drop cached ``list`` / ``get`` / ``get_total_analytics`` responses.
+        
+        Called automatically after changes made through this client. With
+        ``embed_id``, only that embed and the listings/totals that may
+        include it are dropped.
+        
+        Args:
+            embed_id: Embed whose entries to drop (default: everything)
+        """
+        self._generation += 1
+        if embed_id is None:
+            self._cache.invalidate()
+            return
+        path = f'embeds/{embed_id}'
+        self._cache.invalidate_where(
+            lambda key: key[0] in ('embeds', path, 'embeds/analytics/total')
+        )
+    
+    async def _cached_get(
+        self,
+        path: str,
+        ttl: float,
+        params: Optional[Dict[str, Any]] = None,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        GET ``path`` through the response cache when it is enabled.
+        
+        With caching on, requests are conditional (``If-None-Match``), so an
+        expired entry is revalidated cheaply: an unchanged resource costs a
+        304 and no parse. Concurrent misses for the same key share one
+        request. ``no_cache`` skips the lookup but still stores the fresh
+        response.
+        
+        With caching on, the returned body may be shared with the cache (and
+        the client's ETag store); callers must not mutate it. ``EmbedInfo``
+        copies what it keeps, and ``get_total_analytics`` returns a copy.
+        """
+        kwargs: Dict[str, Any] = {}
+        if params is not None:
+            kwargs['params'] = params
+        if not (self._cache_enabled or self._stale_on_error):
+            return await self.client.get(path, **kwargs)
+        kwargs['conditional'] = True
+        key = self._cache_key(path, params)
+        if self._cache_enabled and not no_cache:
+            hit = self._cache.get(key)
+            if hit is not None:
+                return hit
+        # With only stale_on_error, entries are stored already expired and
+        # are read back solely by ``_get_or_stale``.
+        if not self._cache_enabled:
+            ttl = 0.0
+        return await self._inflight.do(key, lambda: self._fetch(key, path, ttl, kwargs))
+    
+    async def _fetch(self, key: tuple, path: str, ttl: float, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        generation = self._generation
+        response = await self.client.get(path, **kwargs)
+        # Don't store a response that raced with an invalidation.
+        if generation == self._generation:
+            grace = self._stale_grace if self._stale_on_error else 0.0
+            self._cache.set(key, response, ttl, grace)
+        return response
+    
+    @staticmethod
+    def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> tuple:
+        return (path, tuple(sorted(params.items())) if params else None)
+    
+    async def _get_or_stale(
+        self,
+        path: str,
+        ttl: float,
+        params: Optional[Dict[str, Any]] = None,
+        no_cache: bool = False
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        ``_cached_get``, falling back to the last good response on outages.
+        
+        Returns ``(response, stale)``. With ``stale_on_error`` enabled, a
+        connection error, timeout or 5xx is answered from an entry still
+        within its grace period; any other error, or no such entry, raises.
+        """
+        try:
+            return await self._cached_get(path, ttl, params, no_cache), False
+        except (FleeksAPIError, FleeksConnectionError, FleeksTimeoutError) as e:
+            if not self._stale_on_error:
+                raise
+            if isinstance(e, FleeksAPIError) and (e.status_code or 0) < 500:
+                raise
+            stale = self._cache.get_stale(self._cache_key(path, params))
+            if stale is None:
+                raise
+            logger.debug("Serving stale %s after error: %s", path, e)
+            return stale, True
     
     async def create(
         self,
@@ -848,6 +1222,9 @@ class EmbedManager:
         Returns:
             Embed: New embed instance
         
+        Raises:
+            FleeksValidationError: If template or display_mode is unknown
+        
         Example:
             >>> embed = await client.embeds.create(
             ...     name="React Counter Demo",
@@ -869,23 +1246,26 @@ class EmbedManager:
             >>> print(f"Embed URL: {embed.embed_url}")
             >>> print(f"IFrame: {embed.iframe_html}")
         """
-        settings = EmbedSettings(
-            layout=layout_preset,
-            theme=theme,
-            read_only=read_only,
-            show_terminal=show_terminal,
-            show_file_tree=show_file_tree,
-            auto_run=auto_run
-        )
+        settings_key = (layout_preset, theme, read_only, show_terminal, show_file_tree, auto_run)
+        settings = _SETTINGS_CACHE.get(settings_key)
+        if settings is None:
+            settings = _SETTINGS_CACHE[settings_key] = EmbedSettings(
+                layout=layout_preset,
+                theme=theme,
+                read_only=read_only,
+                show_terminal=show_terminal,
+                show_file_tree=show_file_tree,
+                auto_run=auto_run
+            ).to_dict()
         
         data = {
             'name': name,
-            'template': template.value if isinstance(template, EmbedTemplate) else template,
-            'display_mode': display_mode.value if isinstance(display_mode, DisplayMode) else display_mode,
+            'template': _TEMPLATE_VALUES.get(template) or validate_template(template),
+            'display_mode': _DISPLAY_MODE_VALUES.get(display_mode) or validate_display_mode(display_mode),
             'allowed_origins': allowed_origins or ['*'],
-            'session_timeout_minutes': max(5, min(60, session_timeout_minutes)),
-            'max_sessions': max(1, min(1000, max_sessions)),
-            'settings': settings.to_dict()
+            'session_timeout_minutes': clamp(session_timeout_minutes, 5, 60),
+            'max_sessions': clamp(max_sessions, 1, 1000),
+            'settings': settings
         }
         
         if files:
@@ -894,7 +1274,8 @@ class EmbedManager:
         if description:
             data['description'] = description
         
-        response = await self.client.post('embeds', json=data)
+        response = await self.client.post('embeds', content=_json.dumps(data))
+        self.invalidate()
         return Embed(self.client, EmbedInfo.from_dict(response))
     
     async def list(
@@ -903,7 +1284,8 @@ class EmbedManager:
         page_size: int = 20,
         include_inactive: bool = False,
         template: Optional[EmbedTemplate] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        no_cache: bool = False
     ) -> List[Embed]:
         """
         List all embeds owned by authenticated user.
@@ -913,7 +1295,9 @@ class EmbedManager:
             page_size: Results per page (1-100)
             include_inactive: Include inactive embeds (paused/archived)
             template: Filter by template
-            search: Search in name and description
+            search: Search in name and description (runs of whitespace
+                are collapsed, so equivalent queries share cached results)
+            no_cache: Bypass the response cache (when enabled)
         
         Returns:
             List[Embed]: List of embed instances
@@ -934,20 +1318,107 @@ class EmbedManager:
         if template:
             params['template'] = template.value if isinstance(template, EmbedTemplate) else template
         if search:
-            params['search'] = search
+            # Collapse whitespace so "React  demo" and "React demo" share one
+            # cached result. Case is kept: the backend may match it.
+            params['search'] = ' '.join(search.split())
         
-        response = await self.client.get('embeds', params=params)
-        return [
+        response, stale = await self._get_or_stale(
+            'embeds', _LIST_TTL_SECONDS, params, no_cache
+        )
+        embeds = [
             Embed(self.client, EmbedInfo.from_dict(e))
             for e in response.get('embeds', [])
         ]
+        if stale:
+            for embed in embeds:
+                embed.stale = True
+        return embeds
     
-    async def get(self, embed_id: str) -> Embed:
+    async def list_detailed(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        include_inactive: bool = False,
+        template: Optional[EmbedTemplate] = None,
+        search: Optional[str] = None,
+        concurrency: int = _DETAIL_CONCURRENCY,
+        no_cache: bool = False
+    ) -> List[Embed]:
+        """
+        List embeds and fetch each one's full details concurrently.
+        
+        Equivalent to ``list()`` followed by ``get()`` per embed, but the
+        detail requests run in parallel over the shared connection pool,
+        at most ``concurrency`` at a time. Embeds deleted between the two
+        steps are skipped.
+        
+        Args:
+            page, page_size, include_inactive, template, search: As for ``list()``
+            concurrency: Maximum detail requests in flight
+            no_cache: Bypass the response cache (when enabled)
+        
+        Returns:
+            List[Embed]: Embeds in listing order, with detailed info
+        """
+        listed = await self.list(
+            page=page,
+            page_size=page_size,
+            include_inactive=include_inactive,
+            template=template,
+            search=search,
+            no_cache=no_cache
+        )
+        return await self.get_many(
+            [e.id for e in listed],
+            concurrency=concurrency,
+            no_cache=no_cache
+        )
+    
+    async def get_many(
+        self,
+        embed_ids: Sequence[str],
+        concurrency: int = _DETAIL_CONCURRENCY,
+        no_cache: bool = False
+    ) -> List[Embed]:
+        """
+        Get several embeds concurrently.
+        
+        Requests run in parallel over the shared connection pool, at most
+        ``concurrency`` at a time. Embeds that do not exist are skipped.
+        
+        Args:
+            embed_ids: Embed IDs
+            concurrency: Maximum requests in flight
+            no_cache: Bypass the response cache (when enabled)
+        
+        Returns:
+            List[Embed]: Found embeds, in the order of ``embed_ids``
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def fetch(embed_id: str) -> Embed:
+            async with semaphore:
+                return await self.get(embed_id, no_cache=no_cache)
+        
+        results = await asyncio.gather(
+            *(fetch(embed_id) for embed_id in embed_ids),
+            return_exceptions=True
+        )
+        embeds = []
+        for result in results:
+            if isinstance(result, Embed):
+                embeds.append(result)
+            elif not (isinstance(result, FleeksAPIError) and result.status_code == 404):
+                raise result
+        return embeds
+    
+    async def get(self, embed_id: str, no_cache: bool = False) -> Embed:
         """
         Get embed by ID.
         
         Args:
             embed_id: Embed ID
+            no_cache: Bypass the response cache (when enabled)
         
         Returns:
             Embed: Embed instance
@@ -959,8 +1430,12 @@ class EmbedManager:
             >>> embed = await client.embeds.get("emb_abc123")
             >>> print(f"Name: {embed.info.name}")
         """
-        response = await self.client.get(f'embeds/{embed_id}')
-        return Embed(self.client, EmbedInfo.from_dict(response))
+        response, stale = await self._get_or_stale(
+            f'embeds/{embed_id}', _GET_TTL_SECONDS, no_cache=no_cache
+        )
+        embed = Embed(self.client, EmbedInfo.from_dict(response))
+        embed.stale = stale
+        return embed
     
     async def delete(self, embed_id: str) -> None:
         """
@@ -972,16 +1447,73 @@ class EmbedManager:
             embed_id: Embed ID to delete
         """
         await self.client.delete(f'embeds/{embed_id}')
+        self.invalidate(embed_id)
+    
+    async def delete_many(
+        self,
+        embed_ids: Sequence[str],
+        concurrency: int = _DETAIL_CONCURRENCY
+    ) -> int:
+        """
+        Delete several embeds.
+        
+        Uses the batch ``POST embeds/batch-delete`` endpoint when the backend
+        provides it; otherwise deletes concurrently, at most ``concurrency``
+        at a time. Embeds that are already gone count as deleted.
+        
+        Args:
+            embed_ids: Embed IDs to delete
+            concurrency: Maximum per-embed deletes in flight (fallback only)
+        
+        Returns:
+            int: Number of embeds deleted
+        """
+        embed_ids = list(dict.fromkeys(embed_ids))
+        if not embed_ids:
+            return 0
+        try:
+            await self.client.post('embeds/batch-delete', content=_json.dumps({'ids': embed_ids}))
+        except FleeksAPIError as e:
+            if e.status_code not in (404, 405, 501):
+                raise
+        else:
+            for embed_id in embed_ids:
+                self.invalidate(embed_id)
+            return len(embed_ids)
+        
+        # Older backends: one DELETE per embed, issued concurrently.
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def delete(embed_id: str) -> None:
+            async with semaphore:
+                await self.delete(embed_id)
+        
+        results = await asyncio.gather(
+            *(delete(embed_id) for embed_id in embed_ids),
+            return_exceptions=True
+        )
+        deleted = 0
+        for embed_id, result in zip(embed_ids, results):
+            if result is None:
+                deleted += 1
+            elif isinstance(result, FleeksAPIError) and result.status_code == 404:
+                self.invalidate(embed_id)
+                deleted += 1  # deleted elsewhere meanwhile
+            else:
+                raise result
+        return deleted
     
     async def get_total_analytics(
         self,
-        period: str = "30d"
+        period: str = "30d",
+        no_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Get aggregated analytics across all embeds.
         
         Args:
             period: Time period ("7d", "30d", "90d", "1y")
+            no_cache: Bypass the response cache (when enabled)
         
         Returns:
             dict: Aggregated analytics data
@@ -991,71 +1523,97 @@ class EmbedManager:
             >>> print(f"Total views: {analytics['total_views']}")
             >>> print(f"Total embeds: {analytics['embed_count']}")
         """
-        response = await self.client.get(
+        response = await self._cached_get(
             'embeds/analytics/total',
-            params={'period': period}
+            _ANALYTICS_TTL_SECONDS,
+            {'period': period},
+            no_cache
         )
+        if self._cache_enabled or self._stale_on_error:
+            # Shared with the cache; hand out a copy the caller may mutate.
+            return copy.deepcopy(response)
         return response
-    
-    # Convenience factory methods for common embed types
-    
-    async def create_react(
+
+    async def get_total_analytics_stream(
+        self,
+        period: str = "30d",
+        keys: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[tuple]:
+        """
+        Stream aggregated analytics as ``(key, value)`` pairs.
+
+        Use this instead of ``get_total_analytics`` when the response is large
+        (per-day series, per-embed breakdowns) and only a few top-level keys
+        are needed. With the ``streaming`` extra installed (``ijson``) the body
+        is parsed incrementally and the connection is closed as soon as every
+        key in ``keys`` has been seen; without it the body is read in full and
+        filtered. The response cache is not consulted.
+
+        Args:
+            period: Time period ("7d", "30d", "90d", "1y")
+            keys: Top-level keys to yield; all keys when omitted
+
+        Yields:
+            tuple: ``(key, value)`` for each top-level field of the response
+
+        Example:
+            >>> async for key, value in client.embeds.get_total_analytics_stream(
+            ...         "1y", keys=["total_views"]):
+            ...     print(key, value)
+        """
+        wanted = set(keys) if keys is not None else None
+        items = self.client._stream_items(
+            'GET', 'embeds/analytics/total', params={'period': period}
+        )
+        try:
+            async for key, value in items:
+                if wanted is None:
+                    yield key, value
+                elif key in wanted:
+                    yield key, value
+                    wanted.discard(key)
+                    if not wanted:
+                        break
+        finally:
+            await items.aclose()
+    
+    # Convenience factory methods for common embed types.
+    # These return ``create()``'s coroutine directly rather than awaiting it
+    # in a wrapper coroutine; ``await client.embeds.create_react(...)`` works
+    # the same. Keyword arguments override the preset defaults.
+    
+    def create_react(
         self,
         name: str,
         files: Dict[str, str],
         **kwargs
-    ) -> Embed:
+    ) -> Awaitable[Embed]:
         """Create a React embed with sensible defaults."""
-        return await self.create(
-            name=name,
-            template=EmbedTemplate.REACT,
-            files=files,
-            **kwargs
-        )
+        return self.create(name, files=files, **{**_REACT_DEFAULTS, **kwargs})
     
-    async def create_python(
+    def create_python(
         self,
         name: str,
         files: Dict[str, str],
         **kwargs
-    ) -> Embed:
+    ) -> Awaitable[Embed]:
         """Create a Python embed with sensible defaults."""
-        return await self.create(
-            name=name,
-            template=EmbedTemplate.PYTHON,
-            files=files,
-            layout_preset=EmbedLayoutPreset.STACKED,
-            display_mode=DisplayMode.SPLIT_VIEW,
-            **kwargs
-        )
+        return self.create(name, files=files, **{**_PYTHON_DEFAULTS, **kwargs})
     
-    async def create_jupyter(
+    def create_jupyter(
         self,
         name: str,
         files: Optional[Dict[str, str]] = None,
         **kwargs
-    ) -> Embed:
+    ) -> Awaitable[Embed]:
         """Create a Jupyter notebook embed."""
-        return await self.create(
-            name=name,
-            template=EmbedTemplate.JUPYTER,
-            files=files,
-            display_mode=DisplayMode.NOTEBOOK,
-            layout_preset=EmbedLayoutPreset.FULL_IDE,
-            show_terminal=False,
-            **kwargs
-        )
+        return self.create(name, files=files, **{**_JUPYTER_DEFAULTS, **kwargs})
     
-    async def create_static(
+    def create_static(
         self,
         name: str,
         files: Dict[str, str],
         **kwargs
-    ) -> Embed:
+    ) -> Awaitable[Embed]:
         """Create a static HTML/CSS/JS embed."""
-        return await self.create(
-            name=name,
-            template=EmbedTemplate.STATIC,
-            files=files,
-            **kwargs
-        )
+        return self.create(name, files=files, **{**_STATIC_DEFAULTS, **kwargs})
@@ -26,12 +26,17 @@ class FleeksAPIError(FleeksException):
 
 
 class FleeksRateLimitError(FleeksAPIError):
-    """Exception raised when rate limit is exceeded."""
+    """
+    Exception raised when rate limit is exceeded.
+
+    ``retry_after`` is the server's ``Retry-After`` in seconds (parsed from
+    either delta-seconds or an HTTP date), or 60 when the header is absent.
+    """
     
     def __init__(
         self, 
         message: str, 
-        retry_after: int = 60,
+        retry_after: Optional[float] = 60,
         status_code: int = 429,
         response: Optional[httpx.Response] = None
     ):
@@ -16,11 +16,19 @@ Backend endpoints (to be implemented):
 - POST /api/v1/sdk/containers/{container_id}/wake
 """
 
-from dataclasses import dataclass, field
+import functools
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterator, Mapping
 from datetime import datetime
 
+from pydantic import model_validator
+
+from . import _json
+from ._compat import DATACLASS_SLOTS
+from .models import _ResponseModel
+
 
 class IdleAction(str, Enum):
     """
@@ -59,13 +67,14 @@ class LifecycleState(str, Enum):
     """Container is waking from hibernation."""
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LifecycleConfig:
     """
     Container lifecycle configuration.
     
     Controls how containers behave during idle periods and their maximum
-    lifetime. Some features are tier-locked.
+    lifetime. Some features are tier-locked. Instances are immutable and
+    hashable; use ``dataclasses.replace`` to derive a variant.
     
     Attributes:
         idle_timeout_minutes: Minutes of inactivity before idle_action triggers.
@@ -116,11 +125,16 @@ class LifecycleConfig:
     """Recommended heartbeat interval (5 minutes) for long operations."""
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dict for API request."""
+        """
+        Convert to dict for API request.
+
+        ``configure_lifecycle`` encodes the dataclass directly, so keys here
+        must stay identical to the field names.
+        """
         return {
             'idle_timeout_minutes': self.idle_timeout_minutes,
             'max_duration_hours': self.max_duration_hours,
-            'idle_action': self.idle_action.value,
+            'idle_action': self.idle_action._value_,
             'auto_wake': self.auto_wake,
             'keep_alive_on_preview': self.keep_alive_on_preview,
             'heartbeat_interval_seconds': self.heartbeat_interval_seconds
@@ -188,8 +202,18 @@ class LifecycleConfig:
         )
 
 
-@dataclass
-class HeartbeatResponse:
+@functools.lru_cache(maxsize=64)
+def _serialize_lifecycle(config: LifecycleConfig) -> bytes:
+    """
+    JSON request body for ``config``, memoized.
+
+    Callers mostly send a handful of presets, so equal configs share one
+    encoded ``bytes`` object.
+    """
+    return _json.dumps(config)
+
+
+class HeartbeatResponse(_ResponseModel):
     """
     Response from container heartbeat.
     
@@ -203,28 +227,21 @@ class HeartbeatResponse:
         next_timeout_at: Timestamp when container will timeout if no activity
         message: Status message
     """
+
     container_id: str
-    status: str
     last_heartbeat: str
-    idle_timeout_seconds: int
     next_timeout_at: str
-    message: str
+    status: str = 'active'
+    idle_timeout_seconds: int = 1800
+    message: str = ''
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'HeartbeatResponse':
         """Create from API response dict."""
-        return cls(
-            container_id=data['container_id'],
-            status=data.get('status', 'active'),
-            last_heartbeat=data['last_heartbeat'],
-            idle_timeout_seconds=data.get('idle_timeout_seconds', 1800),
-            next_timeout_at=data['next_timeout_at'],
-            message=data.get('message', '')
-        )
+        return cls.model_validate(data)
 
 
-@dataclass
-class TimeoutExtensionResponse:
+class TimeoutExtensionResponse(_ResponseModel):
     """
     Response from timeout extension request.
     
@@ -238,31 +255,30 @@ class TimeoutExtensionResponse:
         max_allowed_minutes: Maximum minutes allowed for user's tier
         message: Status message
     """
+
     container_id: str
-    success: bool
     new_timeout_at: str
-    added_minutes: int
-    max_allowed_minutes: int
-    message: str
+    success: bool = True
+    added_minutes: int = 0
+    max_allowed_minutes: int = 30
+    message: str = ''
     minutes_extended: int = 0  # Alias returned by backend for SDK compatibility
+
+    @model_validator(mode='before')
+    @classmethod
+    def _default_minutes_extended(cls, data: Any) -> Any:
+        """Older backends omit ``minutes_extended``; mirror ``added_minutes``."""
+        if isinstance(data, dict) and 'minutes_extended' not in data:
+            data = {**data, 'minutes_extended': data.get('added_minutes', 0)}
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TimeoutExtensionResponse':
         """Create from API response dict."""
-        added = data.get('added_minutes', 0)
-        return cls(
-            container_id=data['container_id'],
-            success=data.get('success', True),
-            new_timeout_at=data['new_timeout_at'],
-            added_minutes=added,
-            max_allowed_minutes=data.get('max_allowed_minutes', 30),
-            message=data.get('message', ''),
-            minutes_extended=data.get('minutes_extended', added),
-        )
+        return cls.model_validate(data)
 
 
-@dataclass
-class KeepAliveResponse:
+class KeepAliveResponse(_ResponseModel):
     """
     Response from keep-alive toggle.
     
@@ -276,28 +292,21 @@ class KeepAliveResponse:
         is_authorized: Whether user is authorized for this feature
         message: Status message
     """
+
     container_id: str
-    keep_alive_enabled: bool
-    requires_tier: str
-    user_tier: str
-    is_authorized: bool
-    message: str
+    keep_alive_enabled: bool = False
+    requires_tier: str = 'TEAM_ENTERPRISE'
+    user_tier: str = 'FREE'
+    is_authorized: bool = False
+    message: str = ''
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'KeepAliveResponse':
         """Create from API response dict."""
-        return cls(
-            container_id=data['container_id'],
-            keep_alive_enabled=data.get('keep_alive_enabled', False),
-            requires_tier=data.get('requires_tier', 'TEAM_ENTERPRISE'),
-            user_tier=data.get('user_tier', 'FREE'),
-            is_authorized=data.get('is_authorized', False),
-            message=data.get('message', '')
-        )
+        return cls.model_validate(data)
 
 
-@dataclass
-class HibernationResponse:
+class HibernationResponse(_ResponseModel):
     """
     Response from hibernation or wake operations.
     
@@ -310,11 +319,12 @@ class HibernationResponse:
         estimated_resume_seconds: Estimated time to resume (for hibernation)
         message: Status message
     """
+
     container_id: str
-    status: str
-    action: str
-    estimated_resume_seconds: Optional[int]
-    message: str
+    status: str = 'unknown'
+    action: str = 'unknown'
+    estimated_resume_seconds: Optional[int] = None
+    message: str = ''
 
     @property
     def state(self) -> str:
@@ -324,17 +334,10 @@ class HibernationResponse:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'HibernationResponse':
         """Create from API response dict."""
-        return cls(
-            container_id=data['container_id'],
-            status=data.get('status', 'unknown'),
-            action=data.get('action', 'unknown'),
-            estimated_resume_seconds=data.get('estimated_resume_seconds'),
-            message=data.get('message', '')
-        )
+        return cls.model_validate(data)
 
 
-@dataclass
-class LifecycleStatus:
+class LifecycleStatus(_ResponseModel):
     """
     Current lifecycle status of a container.
     
@@ -351,62 +354,83 @@ class LifecycleStatus:
         time_remaining_seconds: Seconds until timeout (None if keep_alive)
         uptime_seconds: Total uptime in seconds
     """
+
     container_id: str
-    state: str
-    idle_timeout_minutes: int
-    idle_action: str
-    keep_alive_enabled: bool
     last_activity_at: str
-    timeout_at: Optional[str]
-    time_remaining_seconds: Optional[int]
-    uptime_seconds: int
+    state: str = 'running'
+    idle_timeout_minutes: int = 30
+    idle_action: str = 'shutdown'
+    keep_alive_enabled: bool = False
+    timeout_at: Optional[str] = None
+    time_remaining_seconds: Optional[int] = None
+    uptime_seconds: int = 0
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LifecycleStatus':
         """Create from API response dict."""
-        return cls(
-            container_id=data['container_id'],
-            state=data.get('state', 'running'),
-            idle_timeout_minutes=data.get('idle_timeout_minutes', 30),
-            idle_action=data.get('idle_action', 'shutdown'),
-            keep_alive_enabled=data.get('keep_alive_enabled', False),
-            last_activity_at=data['last_activity_at'],
-            timeout_at=data.get('timeout_at'),
-            time_remaining_seconds=data.get('time_remaining_seconds'),
-            uptime_seconds=data.get('uptime_seconds', 0)
-        )
+        return cls.model_validate(data)
+
+
+@dataclass(frozen=True, eq=False, **DATACLASS_SLOTS)
+class TierLimit(Mapping[str, Any]):
+    """
+    Lifecycle limits for one subscription tier.
+    
+    ``None`` means unlimited. Fields are attributes, and the instance is
+    also a read-only mapping of field name to value, so code written against
+    the dicts ``TIER_LIMITS`` used to hold (``limit['hibernate']``,
+    ``limit.get(...)``, ``'hibernate' in limit``, ``dict(limit)``) keeps working.
+    """
+    max_idle_timeout_minutes: Optional[int]
+    max_extensions: Optional[int]
+    hibernate: bool
+    keep_alive: bool
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in _TIER_LIMIT_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_TIER_LIMIT_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(_TIER_LIMIT_FIELDS)
+
+
+_TIER_LIMIT_FIELDS = tuple(f.name for f in fields(TierLimit))
 
 
-# Tier limits for documentation and validation
-TIER_LIMITS = {
-    'FREE': {
-        'max_idle_timeout_minutes': 30,
-        'max_extensions': 0,
-        'hibernate': False,
-        'keep_alive': False,
-    },
-    'BASIC': {
-        'max_idle_timeout_minutes': 60,
-        'max_extensions': 2,
-        'hibernate': False,
-        'keep_alive': False,
-    },
-    'PRO': {
-        'max_idle_timeout_minutes': 120,
-        'max_extensions': 5,
-        'hibernate': True,
-        'keep_alive': False,
-    },
-    'ULTIMATE': {
-        'max_idle_timeout_minutes': 240,
-        'max_extensions': 10,
-        'hibernate': True,
-        'keep_alive': False,
-    },
-    'ENTERPRISE': {
-        'max_idle_timeout_minutes': None,  # Unlimited
-        'max_extensions': None,  # Unlimited
-        'hibernate': True,
-        'keep_alive': True,
-    },
-}
+# Tier limits for documentation and validation (read-only).
+TIER_LIMITS: Mapping[str, TierLimit] = MappingProxyType({
+    'FREE': TierLimit(
+        max_idle_timeout_minutes=30,
+        max_extensions=0,
+        hibernate=False,
+        keep_alive=False,
+    ),
+    'BASIC': TierLimit(
+        max_idle_timeout_minutes=60,
+        max_extensions=2,
+        hibernate=False,
+        keep_alive=False,
+    ),
+    'PRO': TierLimit(
+        max_idle_timeout_minutes=120,
+        max_extensions=5,
+        hibernate=True,
+        keep_alive=False,
+    ),
+    'ULTIMATE': TierLimit(
+        max_idle_timeout_minutes=240,
+        max_extensions=10,
+        hibernate=True,
+        keep_alive=False,
+    ),
+    'ENTERPRISE': TierLimit(
+        max_idle_timeout_minutes=None,  # Unlimited
+        max_extensions=None,  # Unlimited
+        hibernate=True,
+        keep_alive=True,
+    ),
+})
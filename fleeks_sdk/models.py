@@ -14,6 +14,10 @@ from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
 
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from . import _json
+
 
 # ============================================================================
 # ENUMS
@@ -181,144 +185,121 @@ class PreviewURLInfo:
 # CONTAINER MODELS
 # ============================================================================
 
-@dataclass
-class ContainerInfo:
+class _ResponseModel(BaseModel):
+    """
+    Base for frozen pydantic response models.
+
+    ``model_validate`` (and so ``from_dict``) raises ``FleeksValidationError``
+    instead of pydantic's ``ValidationError`` when a payload does not match.
+    """
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+    @classmethod
+    def model_validate(cls, obj: Any, *args, **kwargs):
+        try:
+            return super().model_validate(obj, *args, **kwargs)
+        except ValidationError as e:
+            raise _json.invalid_response(cls, e) from e
+
+
+class ContainerInfo(_ResponseModel):
     """
     Container information - matches backend ContainerInfoResponse.
     
     Provides complete container configuration and status.
     """
+
     container_id: str
-    project_id: str
+    project_id: Any  # int or str depending on backend version
     template: str
     status: str
-    ip_address: Optional[str]
     created_at: str
     languages: List[str]
-    resource_limits: Dict[str, str]
-    ports: Dict[str, int]
+    resource_limits: Dict[str, Any]
+    ports: Dict[str, Any]
+    ip_address: Optional[str] = None
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ContainerInfo':
         """Create from API response dict"""
-        return cls(
-            container_id=data['container_id'],
-            project_id=data['project_id'],
-            template=data['template'],
-            status=data['status'],
-            ip_address=data.get('ip_address'),
-            created_at=data['created_at'],
-            languages=data['languages'],
-            resource_limits=data['resource_limits'],
-            ports=data['ports']
-        )
+        return cls.model_validate(data)
 
 
-@dataclass
-class ContainerStats:
+class ContainerStats(_ResponseModel):
     """
     Container statistics - matches backend ContainerStatsResponse.
     
     Real-time resource usage metrics collected from Docker stats.
     """
+
     container_id: str
-    cpu_percent: float
-    memory_mb: float
-    memory_percent: float
-    network_rx_mb: float
-    network_tx_mb: float
-    disk_read_mb: float
-    disk_write_mb: float
-    process_count: int
+    cpu_percent: Optional[float]
+    memory_mb: Optional[float]
+    memory_percent: Optional[float]
+    network_rx_mb: Optional[float]
+    network_tx_mb: Optional[float]
+    disk_read_mb: Optional[float]
+    disk_write_mb: Optional[float]
+    process_count: Optional[int]
     timestamp: str
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ContainerStats':
         """Create from API response dict"""
-        return cls(
-            container_id=data['container_id'],
-            cpu_percent=data['cpu_percent'],
-            memory_mb=data['memory_mb'],
-            memory_percent=data['memory_percent'],
-            network_rx_mb=data['network_rx_mb'],
-            network_tx_mb=data['network_tx_mb'],
-            disk_read_mb=data['disk_read_mb'],
-            disk_write_mb=data['disk_write_mb'],
-            process_count=data['process_count'],
-            timestamp=data['timestamp']
-        )
+        return cls.model_validate(data)
 
 
-@dataclass
-class ContainerProcess:
+class ContainerProcess(_ResponseModel):
     """
     Container process information.
     
     Single process running inside the container.
     """
+
     pid: int
-    user: str
+    user: Optional[str]
     command: str
-    cpu_percent: float
-    memory_mb: float
+    cpu_percent: Optional[float]
+    memory_mb: Optional[float]
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ContainerProcess':
         """Create from API response dict"""
-        return cls(
-            pid=data['pid'],
-            user=data['user'],
-            command=data['command'],
-            cpu_percent=data['cpu_percent'],
-            memory_mb=data['memory_mb']
-        )
+        return cls.model_validate(data)
 
 
-@dataclass
-class ContainerProcessList:
+class ContainerProcessList(_ResponseModel):
     """
     Container process list - matches backend ContainerProcessListResponse.
     """
+
     container_id: str
-    project_id: str
+    project_id: Any  # int or str depending on backend version
     process_count: int
     processes: List[ContainerProcess]
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ContainerProcessList':
         """Create from API response dict"""
-        processes = [ContainerProcess.from_dict(p) for p in data['processes']]
-        return cls(
-            container_id=data['container_id'],
-            project_id=data['project_id'],
-            process_count=data['process_count'],
-            processes=processes
-        )
+        return cls.model_validate(data)
 
 
-@dataclass
-class ContainerExecResult:
+class ContainerExecResult(_ResponseModel):
     """
     Container command execution result - matches backend ContainerExecResponse.
     """
+
     container_id: str
     command: str
     exit_code: int
     stdout: str
     stderr: str
-    execution_time_ms: float
+    execution_time_ms: Optional[float]
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ContainerExecResult':
         """Create from API response dict"""
-        return cls(
-            container_id=data['container_id'],
-            command=data['command'],
-            exit_code=data['exit_code'],
-            stdout=data['stdout'],
-            stderr=data['stderr'],
-            execution_time_ms=data['execution_time_ms']
-        )
+        return cls.model_validate(data)
 
 
 # ============================================================================
@@ -797,15 +778,15 @@ class DeployStatus:
         return self.status == "failed"
 
 
-@dataclass
-class DeployListItem:
+class DeployListItem(_ResponseModel):
     """
     Single item in a deployment list — matches backend list response.
     """
+
     deployment_id: int
     project_id: Any  # int or str depending on backend version
-    deployment_number: int
-    environment: str
+    deployment_number: int = 0
+    environment: str = 'production'
     status: str
     url: Optional[str] = None
     created_at: Optional[str] = None
@@ -814,16 +795,7 @@ class DeployListItem:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DeployListItem':
         """Create from API response dict"""
-        return cls(
-            deployment_id=data['deployment_id'],
-            project_id=data['project_id'],
-            deployment_number=data.get('deployment_number', 0),
-            environment=data.get('environment', 'production'),
-            status=data['status'],
-            url=data.get('url'),
-            created_at=data.get('created_at'),
-            health_status=data.get('health_status'),
-        )
+        return cls.model_validate(data)
 
 
 @dataclass
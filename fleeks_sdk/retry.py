@@ -0,0 +1,109 @@
+"""
+Retry policy for Fleeks API requests.
+
+``FleeksClient`` retries requests that failed for reasons that are likely to
+go away on their own:
+
+- ``429 Too Many Requests`` for any method: the request was not processed.
+  The server's ``Retry-After`` is honoured (plus a little jitter); when it
+  asks for a longer wait than ``max_delay`` the error is raised instead.
+- Connection errors, timeouts and ``502/503/504`` only for idempotent
+  methods, or for any method sent with an ``Idempotency-Key`` header.
+
+Other delays use exponential backoff with jitter, capped at ``max_delay``.
+"""
+
+import random
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Mapping, Optional
+
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, stop_after_attempt
+
+from .exceptions import (
+    FleeksAPIError,
+    FleeksConnectionError,
+    FleeksRateLimitError,
+    FleeksTimeoutError,
+)
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How ``FleeksClient`` retries failed requests.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 disables retrying).
+        base_delay: Backoff for the first retry, in seconds.
+        max_delay: Cap on any single wait, including ``Retry-After``.
+        jitter: Random fraction added to backoff delays (0.5 = up to +50%).
+    """
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    jitter: float = 0.5
+
+    def is_retryable(
+        self,
+        exc: BaseException,
+        method: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> bool:
+        """Whether ``exc`` raised by a ``method`` request may be retried."""
+        if isinstance(exc, FleeksRateLimitError):
+            return exc.retry_after is None or exc.retry_after <= self.max_delay
+        replay_safe = method.upper() in IDEMPOTENT_METHODS or _has_idempotency_key(headers)
+        if isinstance(exc, (FleeksConnectionError, FleeksTimeoutError)):
+            return replay_safe
+        if isinstance(exc, FleeksAPIError):
+            return replay_safe and exc.status_code in RETRYABLE_STATUS_CODES
+        return False
+
+    def backoff(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (1-based)."""
+        if isinstance(exc, FleeksRateLimitError) and exc.retry_after is not None:
+            return min(self.max_delay, exc.retry_after + random.uniform(0.0, self.base_delay * self.jitter))
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return min(self.max_delay, delay * (1.0 + random.random() * self.jitter))
+
+    def retrying(self, method: str, headers: Optional[Mapping[str, str]] = None) -> AsyncRetrying:
+        """Build the tenacity controller for one request."""
+
+        def wait(state: RetryCallState) -> float:
+            return self.backoff(state.attempt_number, state.outcome.exception())
+
+        return AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries + 1),
+            wait=wait,
+            retry=retry_if_exception(lambda exc: self.is_retryable(exc, method, headers)),
+            reraise=True,
+        )
+
+
+def _has_idempotency_key(headers: Optional[Mapping[str, Any]]) -> bool:
+    if not headers:
+        return False
+    return any(k.lower() == 'idempotency-key' for k in headers)
@@ -8,15 +8,37 @@ This script helps you get started with the Fleeks SDK by:
 3. Testing the connection to the Fleeks API
 """
 
+import asyncio
+import importlib.metadata
 import subprocess
 import sys
 
 
-def install_fleeks_sdk():
-    """Install the Fleeks SDK from PyPI."""
+def install_fleeks_sdk(upgrade=False):
+    """
+    Install the Fleeks SDK from PyPI.
+
+    Skips pip entirely when the SDK is already installed, unless
+    ``upgrade`` is set (``--upgrade`` on the command line).
+    """
+    if not upgrade:
+        try:
+            version = importlib.metadata.version("fleeks-sdk")
+        except importlib.metadata.PackageNotFoundError:
+            pass
+        else:
+            print(f"✅ Fleeks SDK {version} already installed (pass --upgrade to update)")
+            return True
+
     print("📦 Installing Fleeks SDK...")
+    command = [
+        sys.executable, "-m", "pip", "install", "fleeks-sdk", "-q",
+        "--disable-pip-version-check", "--no-input",
+    ]
+    if upgrade:
+        command.append("--upgrade")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "fleeks-sdk", "-q"])
+        subprocess.check_call(command)
         print("✅ Fleeks SDK installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -47,10 +69,13 @@ def test_connection(api_key):
     try:
         from fleeks_sdk import FleeksClient
         
-        client = FleeksClient(api_key=api_key)
+        async def list_workspaces():
+            # One pooled connection for the whole check; closed on exit.
+            async with FleeksClient(api_key=api_key) as client:
+                return await client.workspaces.list()
         
         # Try to list workspaces as a simple connectivity test
-        workspaces = client.workspaces.list()
+        workspaces = asyncio.run(list_workspaces())
         
         print("✅ Connection successful!")
         print(f"📁 Found {len(workspaces)} workspace(s)")
@@ -98,9 +123,9 @@ def main():
     print("=" * 50)
     
     # Step 1: Install SDK
-    install_choice = input("\nInstall/upgrade Fleeks SDK? (y/n) [y]: ").strip().lower()
+    install_choice = input("\nInstall Fleeks SDK (pass --upgrade to update)? (y/n) [y]: ").strip().lower()
     if install_choice != 'n':
-        if not install_fleeks_sdk():
+        if not install_fleeks_sdk(upgrade="--upgrade" in sys.argv[1:]):
             print("\n⚠️  You can try installing manually with: pip install fleeks-sdk")
     
     # Step 2: Get API key
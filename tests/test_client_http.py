@@ -0,0 +1,328 @@
+"""
+Tests for FleeksClient request handling against a mock HTTP transport.
+
+Covers:
+- The pooled transport is built once and shared; ``transport=`` overrides it.
+- ``get_stats`` exposes per-endpoint RTT / 429 telemetry.
+- Conditional GETs: ETag stored on 200, ``If-None-Match`` sent on the next
+  call, and the previously parsed body returned on 304.
+- Retry policy: 429s honour ``Retry-After`` (exponential backoff without
+  it, reporting the 60s default once exhausted); transport errors are retried
+  only for idempotent methods or with an ``Idempotency-Key``; timeouts and
+  network failures surface as ``FleeksTimeoutError``/``FleeksConnectionError``.
+- Responses are requested compressed and gzip bodies are decoded.
+- ``compress_requests=True`` gzips large POST/PATCH JSON bodies only.
+"""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from fleeks_sdk.client import FleeksClient
+from fleeks_sdk.exceptions import (
+    FleeksAPIError,
+    FleeksConnectionError,
+    FleeksRateLimitError,
+    FleeksTimeoutError,
+)
+from fleeks_sdk.retry import RetryPolicy, parse_retry_after
+
+
+API_KEY = "fleeks_" + "x" * 40
+
+
+def _client(handler, **kwargs) -> FleeksClient:
+    return FleeksClient(
+        api_key=API_KEY,
+        base_url="https://api.test",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Transport
+# ---------------------------------------------------------------------------
+
+async def test_default_transport_is_pooled_without_transport_retries():
+    client = FleeksClient(api_key=API_KEY, base_url="https://api.test")
+    await client._ensure_client()
+    http = client._client
+    await client._ensure_client()
+
+    assert client._client is http
+    pool = http._transport._pool
+    assert pool._max_connections == 64
+    assert pool._keepalive_expiry == 60.0
+    assert pool._retries == 0
+    await client.aclose()
+    assert client._client is None
+
+
+async def test_get_bytes_returns_raw_body():
+    client = _client(lambda request: httpx.Response(200, content=b'[{"a": 1}]'))
+    assert await client.get_bytes("deploy/list", params={"limit": "1"}) == b'[{"a": 1}]'
+    await client.aclose()
+
+
+async def test_get_stats_tracks_rtt_and_rate_limits():
+    handler, _ = _flaky(
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={}),
+    )
+    client = _client(handler)
+    client.retry_policy = FAST_RETRY
+
+    await client._make_request("POST", "containers/ctr_1/heartbeat")
+
+    stats = client.get_stats("containers/ctr_9/heartbeat")
+    assert stats["requests"] == 2
+    assert stats["rate_limited"] == 1
+    assert stats["ewma_rtt"] >= 0.0
+    assert list(client.get_stats()) == ["containers/{id}/heartbeat"]
+    await client.aclose()
+
+
+async def test_custom_transport_is_used():
+    client = _client(lambda request: httpx.Response(200, json={"path": request.url.path}))
+    assert await client._make_request("GET", "ping") == {"path": "/api/v1/sdk/ping"}
+    await client.aclose()
+
+
+async def test_requests_compressed_responses():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["accept-encoding"])
+        body = gzip.compress(json.dumps({"files": {"a.py": "x" * 4096}}).encode())
+        return httpx.Response(
+            200,
+            content=body,
+            headers={"content-type": "application/json", "content-encoding": "gzip"},
+        )
+
+    client = _client(handler)
+    data = await client.get("embeds/emb_1")
+
+    assert "gzip" in seen[0]
+    assert data["files"]["a.py"] == "x" * 4096
+    await client.close()
+
+
+async def test_compress_requests_gzips_large_bodies_only():
+    seen = []
+
+    def handler(request):
+        seen.append((request.headers.get("content-encoding"), request.content))
+        return httpx.Response(200, json={"ok": True})
+
+    client = _client(handler, compress_requests=True)
+    big = {"files": {"index.js": "x" * 4096}}
+    await client.post("embeds", json=big)
+    await client.patch("embeds/emb_1", content=json.dumps(big).encode())
+    await client.post("embeds", json={"name": "small"})
+    await client.close()
+
+    (enc1, body1), (enc2, body2), (enc3, body3) = seen
+    assert enc1 == enc2 == "gzip"
+    assert json.loads(gzip.decompress(body1)) == big
+    assert json.loads(gzip.decompress(body2)) == big
+    assert len(body1) < 1024
+    assert enc3 is None and json.loads(body3) == {"name": "small"}
+
+
+async def test_request_bodies_are_uncompressed_by_default():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("content-encoding"))
+        return httpx.Response(200, json={"ok": True})
+
+    client = _client(handler)
+    await client.post("embeds", json={"files": {"index.js": "x" * 4096}})
+    await client.close()
+
+    assert seen == [None]
+
+# ---------------------------------------------------------------------------
+# Conditional GET
+# ---------------------------------------------------------------------------
+
+async def test_conditional_get_revalidates_with_etag():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(200, json={"container_id": "ctr_1"}, headers={"etag": '"v1"'})
+
+    client = _client(handler)
+    first = await client._make_request("GET", "containers/ctr_1/info", _conditional=True)
+    second = await client._make_request("GET", "containers/ctr_1/info", _conditional=True)
+
+    assert seen == [None, '"v1"']
+    assert second is first
+    await client.close()
+
+
+async def test_conditional_get_keys_etags_by_query():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.params["period"], request.headers.get("if-none-match")))
+        return httpx.Response(200, json={"ok": True}, headers={"etag": '"%s"' % request.url.params["period"]})
+
+    client = _client(handler)
+    for period in ("7d", "30d", "7d"):
+        await client._make_request("GET", "embeds/emb_1/analytics", params={"period": period}, _conditional=True)
+
+    assert seen == [("7d", None), ("30d", None), ("7d", '"7d"')]
+    await client.close()
+
+
+async def test_public_get_can_be_conditional():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"embeds": []}, headers={"etag": '"v1"'})
+
+    client = _client(handler)
+    first = await client.get("embeds", params={"page": 1}, conditional=True)
+    assert await client.get("embeds", params={"page": 1}, conditional=True) is first
+    await client.close()
+
+
+async def test_plain_get_does_not_send_if_none_match():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        return httpx.Response(200, json={"ok": True}, headers={"etag": '"v1"'})
+
+    client = _client(handler)
+    await client._make_request("GET", "containers/ctr_1/info")
+    await client._make_request("GET", "containers/ctr_1/info")
+
+    assert seen == [None, None]
+    assert not client._etags
+    await client.close()
+
+
+# ---------------------------------------------------------------------------
+# Retries
+# ---------------------------------------------------------------------------
+
+FAST_RETRY = RetryPolicy(max_retries=2, base_delay=0.0, jitter=0.0)
+
+
+def _flaky(*responses):
+    """Handler returning ``responses`` in order; exceptions are raised."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        result = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return handler, calls
+
+
+async def test_rate_limit_is_retried_after_retry_after():
+    handler, calls = _flaky(
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"ok": True}),
+    )
+    client = _client(handler)
+    client.retry_policy = FAST_RETRY
+
+    assert await client._make_request("POST", "containers/ctr_1/heartbeat") == {"ok": True}
+    assert len(calls) == 2
+    await client.aclose()
+
+
+async def test_rate_limit_without_retry_after_uses_backoff():
+    handler, calls = _flaky(
+        httpx.Response(429),
+        httpx.Response(200, json={"ok": True}),
+    )
+    client = _client(handler)
+    client.retry_policy = FAST_RETRY
+
+    assert await client._make_request("POST", "containers/ctr_1/heartbeat") == {"ok": True}
+    assert len(calls) == 2
+    await client.aclose()
+
+
+async def test_exhausted_rate_limit_without_retry_after_reports_default():
+    handler, calls = _flaky(httpx.Response(429))
+    client = _client(handler)
+    client.retry_policy = FAST_RETRY
+
+    with pytest.raises(FleeksRateLimitError) as exc_info:
+        await client._make_request("GET", "containers/ctr_1/info")
+    assert exc_info.value.retry_after == 60.0
+    assert "60 seconds" in str(exc_info.value)
+    assert len(calls) == FAST_RETRY.max_retries + 1
+    await client.aclose()
+
+
+async def test_rate_limit_longer_than_max_delay_is_raised():
+    handler, calls = _flaky(httpx.Response(429, headers={"Retry-After": "120"}))
+    client = _client(handler)
+    client.retry_policy = FAST_RETRY
+
+    with pytest.raises(FleeksRateLimitError) as exc_info:
+        await client._make_request("GET", "containers/ctr_1/info")
+    assert exc_info.value.retry_after == 120.0
+    assert len(calls) == 1
+    await client.aclose()
+
+
+async def test_connection_errors_retried_only_when_replay_safe():
+    handler, calls = _flaky(httpx.ConnectError("reset"))
+    client = _client(handler)
+    client.retry_policy = FAST_RETRY
+
+    with pytest.raises(FleeksConnectionError):
+        await client._make_request("POST", "containers/ctr_1/exec")
+    assert len(calls) == 1
+
+    with pytest.raises(FleeksConnectionError):
+        await client._make_request("GET", "containers/ctr_1/info")
+    assert len(calls) == 1 + 3
+
+    with pytest.raises(FleeksConnectionError):
+        await client._make_request(
+            "POST", "schedules/s1/message", headers={"Idempotency-Key": "abc"}
+        )
+    assert len(calls) == 4 + 3
+    await client.aclose()
+
+
+async def test_timeouts_and_client_errors():
+    handler, calls = _flaky(httpx.ReadTimeout("slow"))
+    client = _client(handler)
+    client.retry_policy = RetryPolicy(max_retries=0)
+    with pytest.raises(FleeksTimeoutError):
+        await client._make_request("GET", "containers/ctr_1/info")
+    await client.aclose()
+
+    handler, calls = _flaky(httpx.Response(404, json={"detail": "nope"}))
+    client = _client(handler)
+    client.retry_policy = FAST_RETRY
+    with pytest.raises(FleeksAPIError):
+        await client._make_request("GET", "containers/ctr_1/info")
+    assert len(calls) == 1
+    await client.aclose()
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,472 @@
+"""
+Tests for ContainerManager and the container / lifecycle response models.
+
+Covers:
+- Response models validate straight from API payloads, keep the defaults the
+  old hand-written ``from_dict`` constructors applied, and ignore unknown keys;
+  metrics the backend may null are optional, and payloads that do not match
+  raise ``FleeksValidationError``.
+- Lifecycle config and response types are immutable and survive pickling.
+- ``TIER_LIMITS`` is a read-only mapping of immutable ``TierLimit`` records
+  that still behave like the read-only dicts they replaced.
+- ContainerManager methods parse every endpoint's response into its model.
+- Lifecycle calls report every 429, including retried ones, to the client's
+  adaptive limiter.
+- Concurrent reads are coalesced into one request; state-changing calls
+  invalidate the short-lived info/lifecycle cache, and reads in flight
+  during the change are neither cached nor joined afterwards.
+"""
+
+import asyncio
+import dataclasses
+import json
+import pickle
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from unittest.mock import AsyncMock, MagicMock
+
+from fleeks_sdk import _json
+from fleeks_sdk._limiter import AdaptiveLimiter
+from fleeks_sdk._telemetry import Telemetry
+from fleeks_sdk.client import FleeksClient
+from fleeks_sdk.containers import ContainerManager
+from fleeks_sdk.exceptions import (
+    FleeksAPIError,
+    FleeksException,
+    FleeksValidationError,
+)
+from fleeks_sdk.models import ContainerProcessList, ContainerStats
+from fleeks_sdk.retry import RetryPolicy
+from fleeks_sdk.lifecycle import (
+    HeartbeatResponse,
+    HibernationResponse,
+    IdleAction,
+    KeepAliveResponse,
+    LifecycleConfig,
+    LifecycleStatus,
+    TIER_LIMITS,
+    TimeoutExtensionResponse,
+    _serialize_lifecycle,
+)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def _mock_client() -> MagicMock:
+    client = MagicMock()
+    client._make_request = AsyncMock()
+    client._limiter = AdaptiveLimiter(jitter=0.0)
+    client._telemetry = Telemetry()
+    return client
+
+
+def _stats_payload(**overrides):
+    base = {
+        "container_id": "ctr_1",
+        "cpu_percent": 12.5,
+        "memory_mb": 256,
+        "memory_percent": 25.0,
+        "network_rx_mb": 1.0,
+        "network_tx_mb": 2.0,
+        "disk_read_mb": 0,
+        "disk_write_mb": 0,
+        "process_count": 3,
+        "timestamp": "2026-05-13T12:00:00Z",
+    }
+    base.update(overrides)
+    return base
+
+
+# ---------------------------------------------------------------------------
+# Models
+# ---------------------------------------------------------------------------
+
+def test_stats_model_ignores_unknown_keys_and_coerces_numbers():
+    stats = ContainerStats.model_validate(_stats_payload(gpu_percent=99))
+    assert stats.memory_mb == 256.0
+    assert not hasattr(stats, "gpu_percent")
+
+
+def test_response_models_are_frozen():
+    stats = ContainerStats.from_dict(_stats_payload())
+    with pytest.raises(Exception):
+        stats.cpu_percent = 0.0
+
+
+def test_process_list_builds_nested_processes():
+    procs = ContainerProcessList.model_validate({
+        "container_id": "ctr_1",
+        "project_id": 42,
+        "process_count": 1,
+        "processes": [
+            {"pid": 1, "user": "root", "command": "node", "cpu_percent": 1, "memory_mb": 10},
+        ],
+    })
+    assert procs.project_id == 42
+    assert procs.processes[0].command == "node"
+
+
+def test_models_accept_null_metrics_and_wrap_validation_errors():
+    stats = ContainerStats.from_dict(_stats_payload(cpu_percent=None, process_count=None))
+    assert stats.cpu_percent is None and stats.process_count is None
+
+    with pytest.raises(FleeksValidationError) as exc_info:
+        ContainerStats.from_dict({"container_id": "ctr_1"})
+    assert isinstance(exc_info.value, FleeksException)
+    assert exc_info.value.status_code is None
+    with pytest.raises(FleeksValidationError):
+        HeartbeatResponse.model_validate({"container_id": "ctr_1"})
+    with pytest.raises(FleeksValidationError):
+        _json.decode(b'{"container_id": "ctr_1"}', ContainerStats)
+
+
+def test_lifecycle_models_keep_from_dict_defaults():
+    hb = HeartbeatResponse.from_dict({
+        "container_id": "ctr_1",
+        "last_heartbeat": "2026-05-13T12:00:00Z",
+        "next_timeout_at": "2026-05-13T12:30:00Z",
+    })
+    assert hb.status == "active"
+    assert hb.idle_timeout_seconds == 1800
+    assert hb.message == ""
+
+    status = LifecycleStatus.from_dict({
+        "container_id": "ctr_1",
+        "last_activity_at": "2026-05-13T12:00:00Z",
+    })
+    assert status.state == "running"
+    assert status.timeout_at is None
+
+
+def test_lifecycle_config_is_slotted_and_round_trips():
+    config = LifecycleConfig.agent_task()
+    assert not hasattr(config, "__dict__")
+    assert LifecycleConfig.from_dict(config.to_dict()) == config
+
+
+def test_lifecycle_config_is_frozen_and_serialized_once():
+    config = LifecycleConfig.development()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.idle_timeout_minutes = 5
+    body = _serialize_lifecycle(config)
+    assert _serialize_lifecycle(LifecycleConfig.development()) is body
+    assert json.loads(body) == config.to_dict()
+
+
+def test_lifecycle_types_are_immutable_and_pickle():
+    config = LifecycleConfig.development()
+    restored = pickle.loads(pickle.dumps(config))
+    assert restored == config and restored.idle_action is IdleAction.HIBERNATE
+
+    responses = [
+        HeartbeatResponse.from_dict({
+            "container_id": "ctr_1",
+            "last_heartbeat": "2026-05-13T12:00:00Z",
+            "next_timeout_at": "2026-05-13T12:30:00Z",
+        }),
+        TimeoutExtensionResponse.from_dict({
+            "container_id": "ctr_1",
+            "new_timeout_at": "2026-05-13T13:00:00Z",
+            "added_minutes": 30,
+        }),
+        KeepAliveResponse.from_dict({"container_id": "ctr_1", "keep_alive": True}),
+        HibernationResponse.from_dict({"container_id": "ctr_1"}),
+        LifecycleStatus.from_dict({
+            "container_id": "ctr_1",
+            "last_activity_at": "2026-05-13T12:00:00Z",
+        }),
+    ]
+    for response in responses:
+        restored = pickle.loads(pickle.dumps(response))
+        assert restored == response and type(restored) is type(response)
+        with pytest.raises(ValidationError):
+            response.container_id = "ctr_2"
+
+
+def test_tier_limits_are_read_only_mappings():
+    pro = TIER_LIMITS["PRO"]
+    assert pro.hibernate is True and pro["hibernate"] is True
+    assert pro.max_idle_timeout_minutes == pro["max_idle_timeout_minutes"] == 120
+    assert TIER_LIMITS["ENTERPRISE"]["max_extensions"] is None
+    assert "hibernate" in pro and "missing" not in pro
+    assert pro.get("keep_alive") is False and pro.get("missing", 1) == 1
+    assert list(pro) == ["max_idle_timeout_minutes", "max_extensions", "hibernate", "keep_alive"]
+    assert dict(pro) == pro == {
+        "max_idle_timeout_minutes": 120,
+        "max_extensions": 5,
+        "hibernate": True,
+        "keep_alive": False,
+    }
+    with pytest.raises(KeyError):
+        pro["missing"]
+    with pytest.raises(TypeError):
+        TIER_LIMITS["PRO"] = TIER_LIMITS["FREE"]
+    with pytest.raises(TypeError):
+        pro["hibernate"] = False
+    with pytest.raises(AttributeError):
+        pro.hibernate = False
+    assert pickle.loads(pickle.dumps(pro)) == pro
+
+
+@pytest.mark.parametrize("preset", ["quick_test", "development", "agent_task", "always_on"])
+def test_lifecycle_config_encodes_directly_like_to_dict(preset):
+    config = getattr(LifecycleConfig, preset)()
+    assert json.loads(_json.dumps(config)) == config.to_dict()
+
+
+def test_timeout_extension_minutes_extended_falls_back_to_added_minutes():
+    ext = TimeoutExtensionResponse.from_dict({
+        "container_id": "ctr_1",
+        "new_timeout_at": "2026-05-13T13:00:00Z",
+        "added_minutes": 45,
+    })
+    assert ext.minutes_extended == 45
+
+    ext = TimeoutExtensionResponse.from_dict({
+        "container_id": "ctr_1",
+        "new_timeout_at": "2026-05-13T13:00:00Z",
+        "added_minutes": 45,
+        "minutes_extended": 30,
+    })
+    assert ext.minutes_extended == 30
+
+
+# ---------------------------------------------------------------------------
+# ContainerManager
+# ---------------------------------------------------------------------------
+
+async def test_get_stats_parses_response():
+    client = _mock_client()
+    client._make_request.return_value = _json.dumps(_stats_payload())
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    stats = await mgr.get_stats()
+
+    assert isinstance(stats, ContainerStats)
+    assert stats.process_count == 3
+    client._make_request.assert_awaited_once_with("GET", "containers/ctr_1/stats", _raw=True)
+
+
+def test_manager_precomputes_paths_and_uses_slots():
+    mgr = ContainerManager(_mock_client(), "proj_1", "ctr_1")
+    assert mgr._p_ext == "containers/ctr_1/extend-timeout"
+    assert not hasattr(mgr, "__dict__")
+    assert mgr._req is mgr.client._make_request
+
+
+def test_for_containers_shares_one_client():
+    client = _mock_client()
+    managers = ContainerManager.for_containers(client, "proj_1", ["ctr_1", "ctr_2"])
+    assert list(managers) == ["ctr_1", "ctr_2"]
+    assert all(m.client is client for m in managers.values())
+    assert managers["ctr_2"]._p_stats == "containers/ctr_2/stats"
+
+
+async def test_exec_sends_pre_encoded_json_body():
+    client = _mock_client()
+    client._make_request.return_value = {
+        "container_id": "ctr_1",
+        "command": "ls",
+        "exit_code": 0,
+        "stdout": "",
+        "stderr": "",
+        "execution_time_ms": 3,
+        "timestamp": "2026-05-13T12:00:00Z",
+    }
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    await mgr.exec("ls", environment={"CI": "1"})
+
+    _, kwargs = client._make_request.call_args
+    assert "json" not in kwargs
+    assert json.loads(kwargs["content"]) == {
+        "command": "ls",
+        "working_dir": "/workspace",
+        "timeout_seconds": 30,
+        "environment": {"CI": "1"},
+    }
+
+
+@pytest.mark.parametrize("requested,sent", [(-5, 1), (0, 1), (1, 1), (90, 90), (480, 480), (600, 480)])
+async def test_extend_timeout_clamps_minutes(requested, sent):
+    client = _mock_client()
+    client._make_request.return_value = {
+        "container_id": "ctr_1",
+        "new_timeout_at": "2026-05-13T13:00:00Z",
+        "added_minutes": sent,
+    }
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    await mgr.extend_timeout(requested)
+
+    _, kwargs = client._make_request.call_args
+    assert json.loads(kwargs["content"]) == {"additional_minutes": sent}
+
+
+async def test_heartbeat_parses_response():
+    client = _mock_client()
+    client._make_request.return_value = {
+        "container_id": "ctr_1",
+        "last_heartbeat": "2026-05-13T12:00:00Z",
+        "next_timeout_at": "2026-05-13T12:30:00Z",
+    }
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    hb = await mgr.heartbeat()
+
+    assert hb.next_timeout_at == "2026-05-13T12:30:00Z"
+
+
+async def test_heartbeat_rate_limit_feeds_limiter():
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={
+            "container_id": "ctr_1",
+            "last_heartbeat": "2026-05-13T12:00:00Z",
+            "next_timeout_at": "2026-05-13T12:30:00Z",
+        }),
+    ])
+    client = FleeksClient(
+        api_key="fleeks_" + "x" * 40,
+        base_url="https://api.test",
+        transport=httpx.MockTransport(lambda request: next(responses)),
+        retry_policy=RetryPolicy(base_delay=0.0, jitter=0.0),
+    )
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    hb = await mgr.heartbeat()
+    await client.close()
+
+    # Both retried 429s halve the rate (5 -> 1.25); the success adds 0.5 back.
+    assert hb.container_id == "ctr_1"
+    assert client._limiter.get_rate("heartbeat", "ctr_1") == 1.75
+    assert client._limiter.get_rate("heartbeat", "ctr_2") == 5.0
+    assert client.get_stats("containers/ctr_1/heartbeat")["rate_limited"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Request coalescing
+# ---------------------------------------------------------------------------
+
+def _slow(payload, delay=0.01):
+    async def respond(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return payload
+    return respond
+
+
+async def test_concurrent_get_stats_share_one_request():
+    client = _mock_client()
+    client._make_request.side_effect = _slow(_json.dumps(_stats_payload()))
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    results = await asyncio.gather(*(mgr.get_stats() for _ in range(10)))
+
+    assert client._make_request.await_count == 1
+    assert all(r is results[0] for r in results)
+
+    # Stats are not cached once the request has completed.
+    await mgr.get_stats()
+    assert client._make_request.await_count == 2
+
+
+async def test_coalesced_error_reaches_every_caller():
+    client = _mock_client()
+
+    async def fail(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        raise FleeksAPIError("boom", status_code=500)
+
+    client._make_request.side_effect = fail
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    results = await asyncio.gather(
+        *(mgr.get_processes() for _ in range(3)), return_exceptions=True
+    )
+
+    assert client._make_request.await_count == 1
+    assert all(isinstance(r, FleeksAPIError) for r in results)
+
+
+async def test_read_racing_a_state_change_is_not_cached():
+    client = _mock_client()
+    release = asyncio.Event()
+    states = iter(["running", "hibernated"])
+
+    async def request(method, path, **kwargs):
+        if path.endswith("/hibernate"):
+            return {"container_id": "ctr_1", "status": "hibernated"}
+        state = next(states)
+        if state == "running":
+            await release.wait()
+        return {
+            "container_id": "ctr_1",
+            "last_activity_at": "2026-05-13T12:00:00Z",
+            "state": state,
+        }
+
+    client._make_request.side_effect = request
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    stale = asyncio.ensure_future(mgr.get_lifecycle_status())
+    await asyncio.sleep(0)
+    await mgr.hibernate()
+    fresh = asyncio.ensure_future(mgr.get_lifecycle_status())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await stale).state == "running"
+    assert (await fresh).state == "hibernated"
+    assert (await mgr.get_lifecycle_status()).state == "hibernated"
+
+
+async def test_get_info_reuses_model_when_client_returns_cached_body():
+    client = _mock_client()
+    body = {
+        "container_id": "ctr_1",
+        "project_id": 42,
+        "template": "python",
+        "status": "running",
+        "created_at": "2026-05-13T12:00:00Z",
+        "languages": ["python"],
+        "resource_limits": {},
+        "ports": {},
+    }
+    client._make_request.return_value = body
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    first = await mgr.get_info()
+    mgr._cache.invalidate()
+    second = await mgr.get_info()
+
+    assert second is first
+    client._make_request.assert_awaited_with("GET", "containers/ctr_1/info", _conditional=True)
+
+
+async def test_lifecycle_status_cached_until_state_changes():
+    client = _mock_client()
+    client._make_request.return_value = {
+        "container_id": "ctr_1",
+        "last_activity_at": "2026-05-13T12:00:00Z",
+    }
+    mgr = ContainerManager(client, "proj_1", "ctr_1")
+
+    first = await mgr.get_lifecycle_status()
+    second = await mgr.get_lifecycle_status()
+    assert first is second
+    assert client._make_request.await_count == 1
+
+    client._make_request.return_value = {"container_id": "ctr_1", "status": "hibernated"}
+    await mgr.hibernate()
+    client._make_request.return_value = {
+        "container_id": "ctr_1",
+        "state": "hibernated",
+        "last_activity_at": "2026-05-13T12:00:00Z",
+    }
+    status = await mgr.get_lifecycle_status()
+    assert status.state == "hibernated"
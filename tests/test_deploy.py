@@ -0,0 +1,162 @@
+"""
+Tests for DeployManager.
+
+Covers:
+- The SSE parser behind ``stream_logs``: payloads split across chunks,
+  CRLF line endings, non-JSON payloads, and a trailing line without a
+  final newline.
+- ``stream_logs`` goes through the client's streaming request path: SDK
+  base path, retries and SDK exceptions on error statuses.
+- ``list`` decodes raw response bytes, both a bare JSON array and the
+  ``{"deployments": [...]}`` wrapper.
+- ``status_many`` fans status lookups out concurrently, at most
+  ``concurrency`` at a time, and keeps input order.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from fleeks_sdk.client import FleeksClient
+from fleeks_sdk.deploy import DeployManager, _iter_sse_data
+from fleeks_sdk.exceptions import FleeksAPIError
+from fleeks_sdk.models import DeployListItem
+from fleeks_sdk.retry import RetryPolicy
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(*parts):
+    return [event async for event in _iter_sse_data(_chunks(*parts))]
+
+
+async def test_sse_parser_handles_split_chunks():
+    events = await _collect(
+        b'data: {"stage": "build", "per',
+        b'cent": 10}\n\n: keep-alive\n\ndata: {"stage": "push"}\n\n',
+    )
+    assert events == [{"stage": "build", "percent": 10}, {"stage": "push"}]
+
+
+async def test_sse_parser_handles_crlf_and_raw_payloads():
+    events = await _collect(b"event: log\r\ndata: not json\r\n\r\ndata: [1]\r\n\r\n")
+    assert events == [{"raw": "not json"}, [1]]
+
+
+async def test_sse_parser_flushes_final_line_without_newline():
+    events = await _collect(b'data: {"done": true}')
+    assert events == [{"done": True}]
+
+
+async def test_sse_parser_ignores_non_data_lines():
+    events = await _collect(b"\r\nid: 7\ndata:\ndatum: 1\ndata: 2\r\n")
+    assert events == [2]
+
+
+def _http_client(handler) -> FleeksClient:
+    client = FleeksClient(
+        api_key="fleeks_" + "x" * 40,
+        base_url="https://api.test",
+        transport=httpx.MockTransport(handler),
+    )
+    client.retry_policy = RetryPolicy(max_retries=2, base_delay=0.0, jitter=0.0)
+    return client
+
+
+async def test_stream_logs_uses_client_request_path():
+    seen = []
+    responses = [
+        httpx.Response(503),
+        httpx.Response(200, content=b'data: {"stage": "build"}\n\ndata: {"stage": "done"}\n\n'),
+    ]
+
+    def handler(request):
+        seen.append(request.url.path)
+        return responses.pop(0)
+
+    client = _http_client(handler)
+    events = [event async for event in client.deploy.stream_logs(42)]
+    await client.close()
+
+    assert events == [{"stage": "build"}, {"stage": "done"}]
+    assert seen == ["/api/v1/sdk/deploy/42/logs/stream"] * 2
+
+
+async def test_stream_logs_raises_sdk_errors():
+    client = _http_client(lambda request: httpx.Response(404, json={"detail": "no such deployment"}))
+    with pytest.raises(FleeksAPIError) as exc_info:
+        async for _ in client.deploy.stream_logs(42):
+            pass
+    await client.close()
+
+    assert exc_info.value.status_code == 404
+    assert str(exc_info.value) == "API request failed (404): no such deployment"
+
+
+def _status_client():
+    client = MagicMock()
+    in_flight = 0
+    peak = 0
+
+    async def get(endpoint, *args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        deployment_id = int(endpoint.rsplit("/", 1)[1])
+        await asyncio.sleep(0.01 * (4 - deployment_id))
+        in_flight -= 1
+        return {"deployment_id": deployment_id, "project_id": 1, "status": "succeeded"}
+
+    client.get = get
+    return client, lambda: peak
+
+
+async def test_status_many_runs_concurrently_and_preserves_order():
+    client, peak = _status_client()
+    statuses = await DeployManager(client).status_many([1, 2, 3])
+
+    assert [s.deployment_id for s in statuses] == [1, 2, 3]
+    assert peak() == 3
+
+
+async def test_status_many_bounds_requests_in_flight():
+    client, peak = _status_client()
+    statuses = await DeployManager(client).status_many([3, 1, 2, 3], concurrency=2)
+
+    assert [s.deployment_id for s in statuses] == [3, 1, 2, 3]
+    assert peak() == 2
+
+
+async def test_list_decodes_bare_array_from_bytes():
+    client = MagicMock()
+    client.get_bytes = AsyncMock(return_value=(
+        b' [{"deployment_id": 3, "project_id": 9, "status": "succeeded",'
+        b' "url": "https://x.fleeks.run", "extra": 1}]'
+    ))
+
+    items = await DeployManager(client).list(9, limit=5)
+
+    assert items == [DeployListItem(
+        deployment_id=3, project_id=9, status="succeeded", url="https://x.fleeks.run",
+    )]
+    assert items[0].environment == "production"
+    client.get_bytes.assert_awaited_once_with(
+        "deploy/list", params={"project_id": "9", "limit": "5"}
+    )
+
+
+async def test_list_handles_wrapped_and_empty_responses():
+    client = MagicMock()
+    client.get_bytes = AsyncMock(return_value=(
+        b'{"deployments": [{"deployment_id": 1, "project_id": "p", "status": "failed"}]}'
+    ))
+    items = await DeployManager(client).list("p")
+    assert [i.deployment_id for i in items] == [1]
+
+    client.get_bytes = AsyncMock(return_value=b"")
+    assert await DeployManager(client).list("p") == []
@@ -0,0 +1,780 @@
+"""
+Tests for the embed models and EmbedManager.
+
+Covers:
+- Embed enums are ``StrEnum`` members that compare and print as their value.
+- ``validate_template`` / ``validate_display_mode`` accept enum values and
+  raise ``FleeksValidationError`` for unknown strings.
+- ``iter_sessions`` decodes sessions lazily.
+- ``terminate_all_sessions`` uses the bulk endpoint when available and
+  falls back to concurrent per-session deletes.
+- ``refresh`` / ``get_analytics`` revalidate conditionally and reuse the
+  parsed result when the client reports 304 (same body object); concurrent
+  calls share one request.
+- ``refresh(fields=...)`` requests a sparse fieldset and keeps other fields.
+- ``update`` sends a pre-encoded JSON body with files shaped as ``{"code": ...}``;
+  ``update_file`` uses the per-file endpoint and falls back to ``update``.
+- ``embed_url`` / ``iframe_html`` / ``markdown_embed`` are computed once.
+- ``EmbedInfo.get_file`` / ``iter_files`` build ``EmbedFile`` objects lazily.
+- ``to_dict`` emits every serialized field.
+- ``EmbedManager`` response cache (opt-in): hits within the TTL, ``no_cache``,
+  coalesced misses and invalidation on writes; reads are conditional GETs
+  only when caching is on; searches differing only in whitespace share an
+  entry (case is kept).
+- With caching on, analytics are returned as copies and ``EmbedInfo`` copies
+  its containers, so mutating a result does not leak into later calls.
+- ``stale_on_error``: ``list`` / ``get`` fall back to the last good response
+  (marked ``stale``) on connection errors and 5xx, but not on 4xx.
+- ``create`` sends a pre-encoded body with plain enum values and reuses
+  serialized settings; unknown templates / display modes are rejected
+  before any request.
+- ``create`` clamps session timeout / max sessions to their allowed ranges.
+- ``create_*`` factories apply their presets, which keyword arguments override.
+- ``list_detailed`` / ``get_many`` fetch details concurrently (bounded) and
+  skip 404s.
+- ``delete_many`` uses the batch endpoint when available, otherwise deletes
+  concurrently; both drop the deleted embeds from the cache.
+- ``get_total_analytics_stream`` yields top-level pairs, stops once the
+  requested keys are seen, and goes through the client's request path:
+  base URL prefix, retries, ``FleeksAPIError`` / ``FleeksRateLimitError`` on
+  error statuses and ``FleeksConnectionError`` on transport errors.
+- Status changes return an ``EmbedStatusChangeResponse`` named tuple.
+- Embed records are slotted dataclasses that pickle as positional args; ``EmbedSettings`` coerces
+  layout/theme strings to enum members and serializes them back to plain
+  strings; ``from_dict`` falls back to defaults for unknown values.
+"""
+
+import asyncio
+import dataclasses
+import pickle
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from fleeks_sdk import _json
+from fleeks_sdk.client import FleeksClient
+from fleeks_sdk._compat import enum_lookup
+from fleeks_sdk.embeds import (
+    DisplayMode,
+    Embed,
+    EmbedAnalytics,
+    EmbedFile,
+    EmbedInfo,
+    EmbedLayoutPreset,
+    EmbedManager,
+    EmbedSession,
+    EmbedSettings,
+    EmbedStatusChangeResponse,
+    EmbedTemplate,
+    EmbedTheme,
+    validate_display_mode,
+    validate_template,
+)
+from fleeks_sdk.exceptions import (
+    FleeksAPIError,
+    FleeksConnectionError,
+    FleeksRateLimitError,
+    FleeksValidationError,
+)
+from fleeks_sdk.retry import RetryPolicy
+
+
+# ---------------------------------------------------------------------------
+# Enums
+# ---------------------------------------------------------------------------
+
+def test_embed_enums_behave_as_strings():
+    assert EmbedTemplate.REACT == "react"
+    assert str(EmbedTemplate.REACT_NATIVE) == "react_native"
+    assert f"{EmbedTheme.GITHUB_DARK}" == "github-dark"
+
+
+def test_enum_lookup_returns_member_and_rejects_unknown_values():
+    assert enum_lookup(EmbedTemplate, "jupyter") is EmbedTemplate.JUPYTER
+    assert enum_lookup(EmbedTemplate, EmbedTemplate.GO) is EmbedTemplate.GO
+    with pytest.raises(ValueError):
+        enum_lookup(EmbedTemplate, "cobol")
+
+
+def test_validate_template_and_display_mode():
+    assert validate_template("react_native") == "react_native"
+    assert validate_template(EmbedTemplate.GO) == "go"
+    assert validate_display_mode(DisplayMode.NOTEBOOK) == "notebook"
+    with pytest.raises(FleeksValidationError):
+        validate_template("cobol")
+    with pytest.raises(FleeksValidationError):
+        validate_display_mode("hologram")
+
+
+# ---------------------------------------------------------------------------
+# EmbedSettings
+# ---------------------------------------------------------------------------
+
+def test_settings_from_dict_coerces_enums():
+    settings = EmbedSettings.from_dict({"layout": "stacked", "theme": "nord"})
+    assert settings.layout is EmbedLayoutPreset.STACKED
+    assert settings.theme is EmbedTheme.NORD
+    assert settings.to_dict()["layout"] == "stacked"
+    assert not hasattr(settings, "__dict__")
+
+
+def test_settings_accept_plain_strings():
+    settings = EmbedSettings(layout="full-ide", theme="dracula", font_size=16)
+    assert settings.layout is EmbedLayoutPreset.FULL_IDE
+    data = settings.to_dict()
+    assert data["theme"] == "dracula"
+    assert type(data["layout"]) is str
+    assert data["font_size"] == 16
+
+
+def test_settings_from_dict_maps_values_to_members():
+    settings = EmbedSettings.from_dict({"layout": "stacked", "theme": "nord"})
+    assert settings.layout is EmbedLayoutPreset.STACKED
+    assert settings.theme is EmbedTheme.NORD
+
+    settings = EmbedSettings.from_dict({"layout": "holographic", "theme": "neon"})
+    assert settings.layout is EmbedLayoutPreset.SIDE_BY_SIDE
+    assert settings.theme is EmbedTheme.DARK
+
+
+def test_info_from_dict_normalizes_timestamps():
+    created = datetime(2026, 5, 13, 12, 0, tzinfo=timezone.utc)
+    info = EmbedInfo.from_dict({"id": "emb_1", "name": "demo", "created_at": created})
+    assert info.created_at == "2026-05-13T12:00:00+00:00"
+    assert info.updated_at == info.created_at
+    assert info.embed_url == "https://embed.fleeks.ai/emb_1"
+
+    info = EmbedInfo.from_dict({
+        "id": "emb_1", "name": "demo",
+        "created_at": "2026-05-13T12:00:00Z", "updated_at": "2026-05-14T08:00:00Z",
+    })
+    assert (info.created_at, info.updated_at) == ("2026-05-13T12:00:00Z", "2026-05-14T08:00:00Z")
+
+
+def test_info_files_decode_on_demand():
+    info = EmbedInfo.from_dict({"id": "emb_1", "name": "demo", "files": {
+        "src/App.js": {"code": "export default 1", "active": True},
+        "README.md": "# demo",
+    }})
+
+    app = info.get_file("src/App.js")
+    assert (app.path, app.code, app.active) == ("src/App.js", "export default 1", True)
+    assert info.get_file("missing.py") is None
+    assert [f.path for f in info.iter_files()] == ["src/App.js", "README.md"]
+    assert info.to_dict()["files"] is info.files
+
+
+def test_to_dict_covers_every_field():
+    info = EmbedInfo.from_dict({"id": "emb_1", "name": "demo", "total_views": 3})
+    data = info.to_dict()
+    assert set(data) == {f.name for f in dataclasses.fields(EmbedInfo)}
+    assert EmbedInfo.from_dict(data) == info
+
+    f = EmbedFile(path="a.py", code="print(1)", active=True)
+    assert f.to_dict() == {"code": "print(1)", "hidden": False, "active": True}
+
+
+def test_session_from_dict_timestamps():
+    started = datetime(2026, 5, 13, 12, 0, tzinfo=timezone.utc)
+    session = EmbedSession.from_dict({"session_id": "s1", "started_at": started, "last_activity_at": ""})
+    assert session.started_at == "2026-05-13T12:00:00+00:00"
+    assert session.last_activity_at is None
+
+    session = EmbedSession.from_dict({"session_id": "s1", "last_activity_at": "2026-05-13T12:05:00Z"})
+    assert (session.started_at, session.last_activity_at) == ("", "2026-05-13T12:05:00Z")
+
+
+def test_records_pickle_round_trip():
+    info = EmbedInfo.from_dict({"id": "emb_1", "name": "demo", "files": {"a.py": "x"}})
+    session = EmbedSession.from_dict({"session_id": "s1", "started_at": "2026-05-13T12:00:00Z"})
+    analytics = EmbedAnalytics.from_dict({"embed_id": "emb_1", "total_views": 3})
+
+    for record in (info, session, analytics):
+        assert pickle.loads(pickle.dumps(record)) == record
+    assert info.__reduce__()[1][:2] == ("emb_1", "demo")
+
+
+def test_embed_records_are_slotted():
+    info = EmbedInfo.from_dict({"id": "emb_1", "name": "demo"})
+    assert not hasattr(info, "__dict__")
+    assert not hasattr(EmbedFile(path="a.py", code=""), "__dict__")
+
+
+# ---------------------------------------------------------------------------
+# Embed
+# ---------------------------------------------------------------------------
+
+def _mock_client() -> MagicMock:
+    client = MagicMock()
+    client.get = AsyncMock()
+    client.post = AsyncMock()
+    client.patch = AsyncMock()
+    client.delete = AsyncMock()
+    client._make_request = AsyncMock()
+    return client
+
+
+def _embed(client) -> Embed:
+    return Embed(client, EmbedInfo.from_dict({"id": "emb_1", "name": "demo"}))
+
+
+def _sessions(*ids):
+    return {"sessions": [
+        {"session_id": i, "started_at": "2026-05-13T12:00:00Z"} for i in ids
+    ]}
+
+
+async def test_iter_sessions_stops_early():
+    client = _mock_client()
+    client.get.return_value = _sessions("s1", "s2", "s3")
+
+    seen = []
+    async for session in _embed(client).iter_sessions():
+        seen.append(session.session_id)
+        if session.session_id == "s2":
+            break
+
+    assert seen == ["s1", "s2"]
+    client.get.assert_awaited_once_with("embeds/emb_1/sessions")
+
+
+async def test_terminate_all_sessions_uses_bulk_endpoint():
+    client = _mock_client()
+    client.get.return_value = _sessions("s1", "s2", "s3")
+
+    assert await _embed(client).terminate_all_sessions() == 3
+    client.delete.assert_awaited_once_with("embeds/emb_1/sessions")
+
+
+async def test_terminate_all_sessions_falls_back_to_per_session_deletes():
+    client = _mock_client()
+    client.get.return_value = _sessions("s1", "s2", "s3")
+
+    async def delete(path):
+        if path == "embeds/emb_1/sessions":
+            raise FleeksAPIError("not allowed", status_code=405)
+        if path.endswith("/s2"):
+            raise FleeksAPIError("gone", status_code=404)
+        return {}
+
+    client.delete.side_effect = delete
+
+    assert await _embed(client).terminate_all_sessions() == 3
+    assert client.delete.await_count == 4
+
+
+async def test_terminate_all_sessions_skips_requests_when_idle():
+    client = _mock_client()
+    client.get.return_value = _sessions()
+
+    assert await _embed(client).terminate_all_sessions() == 0
+    client.delete.assert_not_awaited()
+
+
+async def test_refresh_reuses_info_when_not_modified():
+    client = _mock_client()
+    body = {"id": "emb_1", "name": "renamed"}
+    client._make_request.return_value = body
+    embed = _embed(client)
+
+    await embed.refresh()
+    info = embed.info
+    await embed.refresh()
+
+    assert info.name == "renamed"
+    assert embed.info is info
+    client._make_request.assert_awaited_with("GET", "embeds/emb_1", _conditional=True)
+
+
+async def test_concurrent_refreshes_share_one_request():
+    client = _mock_client()
+    release = asyncio.Event()
+
+    async def request(*args, **kwargs):
+        await release.wait()
+        return {"id": "emb_1", "name": "renamed"}
+
+    client._make_request.side_effect = request
+    embed = _embed(client)
+
+    tasks = [asyncio.ensure_future(embed.refresh()) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert client._make_request.await_count == 1
+    assert embed.info.name == "renamed"
+
+
+async def test_refresh_with_fields_merges_partial_response():
+    client = _mock_client()
+    client.get.return_value = {"active_sessions": 4}
+    embed = _embed(client)
+
+    await embed.refresh(fields=["active_sessions"])
+
+    client.get.assert_awaited_once_with("embeds/emb_1", params={"fields": "active_sessions"})
+    assert (embed.info.name, embed.info.active_sessions) == ("demo", 4)
+
+
+async def test_get_analytics_revalidates_per_period():
+    client = _mock_client()
+    bodies = {
+        "7d": {"embed_id": "emb_1", "total_views": 7},
+        "30d": {"embed_id": "emb_1", "total_views": 30},
+    }
+
+    async def request(method, path, _conditional, params):
+        return bodies[params["period"]]
+
+    client._make_request.side_effect = request
+    embed = _embed(client)
+
+    week = await embed.get_analytics("7d")
+    month = await embed.get_analytics("30d")
+
+    assert (week.total_views, month.total_views) == (7, 30)
+    assert await embed.get_analytics("7d") is week
+
+
+def test_embed_snippets_are_built_once():
+    embed = _embed(_mock_client())
+
+    assert embed.embed_url == "https://embed.fleeks.ai/emb_1"
+    assert embed.iframe_html.startswith('<iframe src="https://embed.fleeks.ai/emb_1" width="100%"')
+    assert embed.iframe_html.endswith('allow-popups"></iframe>')
+    assert embed.iframe_html is embed.iframe_html
+    assert embed.markdown_embed == '<FleeksEmbed id="emb_1" />'
+    assert {"embed_url", "iframe_html", "markdown_embed"} <= vars(embed).keys()
+
+
+async def test_update_sends_encoded_body():
+    client = _mock_client()
+    client.patch.return_value = {"id": "emb_1", "name": "v2"}
+    embed = _embed(client)
+
+    await embed.update(name="v2", files={"src/App.js": "export default 2"})
+
+    body = _json.loads(client.patch.await_args.kwargs["content"])
+    assert body == {"name": "v2", "files": {"src/App.js": {"code": "export default 2"}}}
+    assert embed.info.name == "v2"
+
+
+async def test_update_file_uses_per_file_endpoint():
+    client = _mock_client()
+    client.patch.return_value = {"id": "emb_1", "name": "demo", "files": {"src/App.js": "v2"}}
+    embed = _embed(client)
+
+    await embed.update_file("src/App.js", "v2")
+
+    client.patch.assert_awaited_once_with("embeds/emb_1/files/src/App.js", content=b'{"code":"v2"}')
+    assert embed.info.files == {"src/App.js": "v2"}
+
+
+async def test_update_file_falls_back_to_full_update():
+    client = _mock_client()
+    client.patch.side_effect = [
+        FleeksAPIError("no such route", status_code=405),
+        {"id": "emb_1", "name": "demo"},
+    ]
+
+    await _embed(client).update_file("src/App.js", "v2")
+
+    assert client.patch.await_args.args == ("embeds/emb_1",)
+    body = _json.loads(client.patch.await_args.kwargs["content"])
+    assert body == {"files": {"src/App.js": {"code": "v2"}}}
+
+
+async def test_status_change_returns_named_tuple():
+    client = _mock_client()
+    client.post.return_value = {"id": "emb_1", "status": "paused", "previous_status": "active"}
+
+    result = await _embed(client).pause()
+
+    assert result == EmbedStatusChangeResponse("emb_1", "paused", "active", "")
+    assert result.status == "paused"
+    client.post.assert_awaited_once_with("embeds/emb_1/pause")
+
+
+# ---------------------------------------------------------------------------
+# EmbedManager response cache
+# ---------------------------------------------------------------------------
+
+def _manager(response_cache: bool = True, stale_on_error: bool = False) -> EmbedManager:
+    client = _mock_client()
+    client.config.response_cache = response_cache
+    client.config.stale_on_error = stale_on_error
+    client.config.stale_grace = 300.0
+    manager = client._embeds = EmbedManager(client)
+    return manager
+
+
+async def test_get_is_cached_when_enabled():
+    manager = _manager()
+    manager.client.get.return_value = {"id": "emb_1", "name": "demo"}
+
+    first = await manager.get("emb_1")
+    second = await manager.get("emb_1")
+    await manager.get("emb_1", no_cache=True)
+
+    assert first is not second
+    assert second.info == first.info
+    assert manager.client.get.await_count == 2
+
+
+@pytest.mark.parametrize("stale_on_error", [False, True])
+async def test_cached_analytics_are_copies(stale_on_error):
+    manager = _manager(response_cache=not stale_on_error, stale_on_error=stale_on_error)
+    # A 304 hands back the very same parsed body, as the client's ETag store does.
+    body = {"total_views": 10, "by_day": [1, 2]}
+    manager.client.get.return_value = body
+
+    first = await manager.get_total_analytics()
+    first["total_views"] = 999
+    first["by_day"].append(3)
+    second = await manager.get_total_analytics()
+
+    assert second == {"total_views": 10, "by_day": [1, 2]}
+    assert body == second
+
+
+async def test_cached_embed_info_does_not_alias_response():
+    manager = _manager()
+    body = {
+        "id": "emb_1",
+        "name": "demo",
+        "files": {"a.py": {"code": "x = 1"}, "b.py": "y = 2"},
+        "allowed_origins": ["https://a.test"],
+    }
+    manager.client.get.return_value = body
+
+    first = await manager.get("emb_1")
+    first.info.files["a.py"]["code"] = "changed"
+    first.info.files["c.py"] = "z = 3"
+    first.info.allowed_origins.append("https://b.test")
+    second = await manager.get("emb_1")
+
+    assert manager.client.get.await_count == 1
+    assert second.info.files == {"a.py": {"code": "x = 1"}, "b.py": "y = 2"}
+    assert second.info.allowed_origins == ["https://a.test"]
+
+
+@pytest.mark.parametrize("response_cache", [True, False])
+async def test_manager_reads_are_conditional_only_when_caching(response_cache):
+    manager = _manager(response_cache=response_cache)
+    manager.client.get.return_value = {"id": "emb_1", "name": "demo"}
+
+    await manager.get("emb_1")
+
+    if response_cache:
+        manager.client.get.assert_awaited_once_with("embeds/emb_1", conditional=True)
+    else:
+        manager.client.get.assert_awaited_once_with("embeds/emb_1")
+
+
+async def test_cache_is_off_by_default():
+    manager = _manager(response_cache=False)
+    manager.client.get.return_value = {"embeds": []}
+
+    await manager.list()
+    await manager.list()
+
+    assert manager.client.get.await_count == 2
+
+
+async def test_list_cache_keys_on_params_and_coalesces_misses():
+    manager = _manager()
+    release = asyncio.Event()
+
+    async def get(path, params=None, conditional=False):
+        await release.wait()
+        return {"embeds": [{"id": "emb_1", "name": "demo"}]}
+
+    manager.client.get.side_effect = get
+    tasks = [asyncio.ensure_future(manager.list(page=1)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+    await manager.list(page=2)
+
+    assert [len(r) for r in results] == [1, 1, 1]
+    assert manager.client.get.await_count == 2
+
+
+async def test_equivalent_searches_share_a_cache_entry():
+    manager = _manager()
+    manager.client.get.return_value = {"embeds": []}
+
+    await manager.list(search="  React   demo ")
+    await manager.list(search="React demo")
+    await manager.list(search="react demo")
+
+    sent = [c.kwargs["params"]["search"] for c in manager.client.get.await_args_list]
+    assert sent == ["React demo", "react demo"]
+
+
+async def test_writes_invalidate_cached_entries():
+    manager = _manager()
+    manager.client.get.return_value = {"id": "emb_1", "name": "demo"}
+    manager.client.post.return_value = {"id": "emb_1", "status": "paused"}
+
+    embed = await manager.get("emb_1")
+    await embed.pause()
+    await manager.get("emb_1")
+    await manager.delete("emb_1")
+    await manager.get("emb_1")
+
+    assert manager.client.get.await_count == 3
+
+
+async def test_list_detailed_fetches_concurrently_with_a_bound():
+    manager = _manager(response_cache=False)
+    in_flight = peak = 0
+
+    async def get(path, params=None, conditional=False):
+        nonlocal in_flight, peak
+        if path == "embeds":
+            return {"embeds": [{"id": f"emb_{i}", "name": "x"} for i in range(6)]}
+        if path == "embeds/emb_3":
+            raise FleeksAPIError("gone", status_code=404)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"id": path.rsplit("/", 1)[-1], "name": "detailed"}
+
+    manager.client.get.side_effect = get
+    embeds = await manager.list_detailed(concurrency=2)
+
+    assert [e.id for e in embeds] == ["emb_0", "emb_1", "emb_2", "emb_4", "emb_5"]
+    assert {e.info.name for e in embeds} == {"detailed"}
+    assert peak == 2
+
+
+async def test_delete_many_uses_batch_endpoint():
+    manager = _manager()
+    manager.client.get.return_value = {"id": "emb_1", "name": "demo"}
+    await manager.get("emb_1")
+
+    assert await manager.delete_many(["emb_1", "emb_2", "emb_1"]) == 2
+
+    manager.client.post.assert_awaited_once()
+    call = manager.client.post.await_args
+    assert call.args == ("embeds/batch-delete",)
+    assert _json.loads(call.kwargs["content"]) == {"ids": ["emb_1", "emb_2"]}
+    manager.client.delete.assert_not_awaited()
+    await manager.get("emb_1")
+    assert manager.client.get.await_count == 2
+
+
+async def test_delete_many_falls_back_to_concurrent_deletes():
+    manager = _manager()
+    manager.client.post.side_effect = FleeksAPIError("no batch", status_code=405)
+
+    async def delete(path):
+        if path == "embeds/emb_2":
+            raise FleeksAPIError("gone", status_code=404)
+
+    manager.client.delete.side_effect = delete
+
+    assert await manager.delete_many(["emb_1", "emb_2", "emb_3"], concurrency=2) == 3
+    assert sorted(c.args[0] for c in manager.client.delete.await_args_list) == [
+        "embeds/emb_1", "embeds/emb_2", "embeds/emb_3"
+    ]
+
+    manager.client.delete.side_effect = FleeksAPIError("boom", status_code=500)
+    with pytest.raises(FleeksAPIError):
+        await manager.delete_many(["emb_4"])
+
+
+async def test_create_sends_encoded_body_and_reuses_settings():
+    manager = _manager(response_cache=False)
+    manager.client.post.return_value = {"id": "emb_1", "name": "demo"}
+
+    await manager.create("demo", template=EmbedTemplate.PYTHON, theme="nord")
+    await manager.create("demo", template="python", theme=EmbedTheme.NORD)
+
+    first, second = (_json.loads(c.kwargs["content"]) for c in manager.client.post.await_args_list)
+    assert first == second
+    assert first["template"] == "python"
+    assert first["display_mode"] == "web_preview"
+    assert first["settings"]["theme"] == "nord"
+    assert first["settings"]["layout"] == "side-by-side"
+
+
+async def test_create_rejects_unknown_template_before_request():
+    manager = _manager(response_cache=False)
+
+    with pytest.raises(FleeksValidationError, match="embed template"):
+        await manager.create("demo", template="cobol")
+    with pytest.raises(FleeksValidationError, match="display mode"):
+        await manager.create("demo", display_mode="hologram")
+    manager.client.post.assert_not_awaited()
+
+
+async def test_create_clamps_session_limits():
+    manager = _manager(response_cache=False)
+    manager.client.post.return_value = {"id": "emb_1", "name": "demo"}
+
+    await manager.create("demo", session_timeout_minutes=1, max_sessions=5000)
+    await manager.create("demo", session_timeout_minutes=90, max_sessions=0)
+    await manager.create("demo", session_timeout_minutes=45, max_sessions=10)
+
+    bodies = [_json.loads(c.kwargs["content"]) for c in manager.client.post.await_args_list]
+    assert [(b["session_timeout_minutes"], b["max_sessions"]) for b in bodies] == [
+        (5, 1000), (60, 1), (45, 10)
+    ]
+
+
+async def test_create_factories_apply_overridable_presets():
+    manager = _manager(response_cache=False)
+    manager.client.post.return_value = {"id": "emb_1", "name": "demo"}
+
+    embed = await manager.create_python("demo", {"main.py": "print(1)"})
+    await manager.create_python("demo", {"main.py": ""}, display_mode=DisplayMode.TERMINAL_ONLY)
+    await manager.create_jupyter("nb")
+
+    first, second, third = (_json.loads(c.kwargs["content"]) for c in manager.client.post.await_args_list)
+    assert embed.id == "emb_1"
+    assert first["template"] == "python"
+    assert first["display_mode"] == "split_view"
+    assert first["settings"]["layout"] == "stacked"
+    assert second["display_mode"] == "terminal_only"
+    assert third["template"] == "jupyter"
+    assert third["settings"]["show_terminal"] is False
+
+
+async def test_stale_on_error_serves_last_good_response():
+    manager = _manager(response_cache=False, stale_on_error=True)
+    manager.client.get.side_effect = [
+        {"id": "emb_1", "name": "demo"},
+        {"embeds": [{"id": "emb_1", "name": "demo"}]},
+        FleeksConnectionError("unreachable"),
+        FleeksAPIError("bad gateway", status_code=502),
+    ]
+
+    fresh = await manager.get("emb_1")
+    listed = await manager.list()
+    stale = await manager.get("emb_1")
+    stale_list = await manager.list()
+
+    assert not fresh.stale and not listed[0].stale
+    assert stale.stale and stale.info.name == "demo"
+    assert [e.stale for e in stale_list] == [True]
+    assert manager.client.get.await_count == 4
+
+
+async def test_stale_on_error_raises_without_entry_or_on_client_errors():
+    manager = _manager(response_cache=False, stale_on_error=True)
+    manager.client.get.side_effect = [
+        FleeksConnectionError("unreachable"),
+        {"id": "emb_1", "name": "demo"},
+        FleeksAPIError("gone", status_code=404),
+    ]
+
+    with pytest.raises(FleeksConnectionError):
+        await manager.get("emb_1")
+    await manager.get("emb_1")
+    with pytest.raises(FleeksAPIError):
+        await manager.get("emb_1")
+
+
+async def test_errors_propagate_without_stale_on_error():
+    manager = _manager(response_cache=True)
+    manager.client.get.side_effect = [
+        {"id": "emb_1", "name": "demo"},
+        FleeksConnectionError("unreachable"),
+    ]
+
+    await manager.get("emb_1")
+    with pytest.raises(FleeksConnectionError):
+        await manager.get("emb_1", no_cache=True)
+
+
+# ---------------------------------------------------------------------------
+# Streamed total analytics
+# ---------------------------------------------------------------------------
+
+_TOTALS = {"total_views": 12, "embed_count": 3, "daily": [{"day": i} for i in range(50)]}
+
+
+def _http_manager(handler) -> EmbedManager:
+    client = FleeksClient(
+        api_key="fleeks_" + "x" * 40,
+        base_url="https://api.test",
+        transport=httpx.MockTransport(handler),
+    )
+    client.retry_policy = RetryPolicy(max_retries=2, base_delay=0.0, jitter=0.0)
+    return client.embeds
+
+
+async def test_total_analytics_stream_yields_all_pairs():
+    seen = []
+
+    def handler(request):
+        seen.append((request.url.path, request.url.params["period"]))
+        return httpx.Response(200, json=_TOTALS)
+
+    manager = _http_manager(handler)
+    pairs = [p async for p in manager.get_total_analytics_stream("7d")]
+    await manager.client.close()
+
+    assert dict(pairs) == _TOTALS
+    assert seen == [("/api/v1/sdk/embeds/analytics/total", "7d")]
+
+
+async def test_total_analytics_stream_filters_keys():
+    manager = _http_manager(lambda request: httpx.Response(200, json=_TOTALS))
+    pairs = [p async for p in manager.get_total_analytics_stream(keys=["embed_count", "missing"])]
+    first = [p async for p in manager.get_total_analytics_stream(keys=["total_views"])]
+    await manager.client.close()
+
+    assert pairs == [("embed_count", 3)]
+    assert first == [("total_views", 12)]
+
+
+async def test_total_analytics_stream_raises_api_error():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, json={"detail": "busy"})
+
+    manager = _http_manager(handler)
+    with pytest.raises(FleeksAPIError) as exc_info:
+        async for _ in manager.get_total_analytics_stream():
+            pass
+    await manager.client.close()
+
+    assert exc_info.value.status_code == 503
+    assert str(exc_info.value) == "API request failed (503): busy"
+    assert len(calls) == 3  # retried like any other GET
+
+
+async def test_total_analytics_stream_retries_then_succeeds():
+    responses = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json=_TOTALS)]
+    manager = _http_manager(lambda request: responses.pop(0))
+    pairs = [p async for p in manager.get_total_analytics_stream()]
+    await manager.client.close()
+
+    assert dict(pairs) == _TOTALS
+    assert manager.client.get_stats("embeds/analytics/total")["rate_limited"] == 1
+
+
+async def test_total_analytics_stream_maps_rate_limit_and_transport_errors():
+    manager = _http_manager(lambda request: httpx.Response(429, headers={"Retry-After": "0"}))
+    with pytest.raises(FleeksRateLimitError):
+        async for _ in manager.get_total_analytics_stream():
+            pass
+    await manager.client.close()
+
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    manager = _http_manager(refuse)
+    with pytest.raises(FleeksConnectionError):
+        async for _ in manager.get_total_analytics_stream():
+            pass
+    await manager.client.close()
@@ -2,6 +2,9 @@
 Tests for SDK initialization.
 """
 
+import subprocess
+import sys
+
 import fleeks_sdk
 
 
@@ -17,4 +20,18 @@ def test_imports():
     
     assert FleeksClient is not None
     assert FleeksException is not None
-    assert FleeksAPIError is not None
\ No newline at end of file
+    assert FleeksAPIError is not None
+
+
+def test_all_exports_resolve():
+    """Every name in __all__ resolves through the lazy loader."""
+    for name in fleeks_sdk.__all__:
+        assert getattr(fleeks_sdk, name) is not None
+    assert set(fleeks_sdk.__all__) <= set(dir(fleeks_sdk))
+
+
+def test_import_is_lazy():
+    """Importing the package does not import the HTTP stack."""
+    code = "import sys, fleeks_sdk; print('httpx' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
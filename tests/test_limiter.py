@@ -0,0 +1,89 @@
+"""
+Tests for the client-side AdaptiveLimiter.
+
+Covers:
+- Burst capacity is available immediately.
+- AIMD: 429 feedback halves the rate (down to a floor), successes add it back
+  up to the configured maximum.
+- A 429 blocks the bucket for ``Retry-After`` before the next acquire.
+- Disabled limiters never wait.
+- Telemetry keys endpoints by normalized path and derives a backoff floor
+  from smoothed RTT and the 429 ratio, which the limiter honours.
+"""
+
+import time
+
+import pytest
+
+from fleeks_sdk._limiter import AdaptiveLimiter
+from fleeks_sdk._telemetry import Telemetry, endpoint_key
+
+
+async def test_burst_is_available_immediately():
+    limiter = AdaptiveLimiter(rate=1.0, burst=5)
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire("heartbeat", "ctr_1")
+    assert time.monotonic() - start < 0.05
+
+
+def test_aimd_rate_adjustment():
+    limiter = AdaptiveLimiter(rate=4.0, min_rate=1.0, increase=0.5, jitter=0.0)
+    limiter.on_rate_limited("heartbeat", "ctr_1")
+    assert limiter.get_rate("heartbeat", "ctr_1") == 2.0
+    limiter.on_rate_limited("heartbeat", "ctr_1")
+    limiter.on_rate_limited("heartbeat", "ctr_1")
+    assert limiter.get_rate("heartbeat", "ctr_1") == 1.0
+
+    for _ in range(10):
+        limiter.on_success("heartbeat", "ctr_1")
+    assert limiter.get_rate("heartbeat", "ctr_1") == 4.0
+
+
+async def test_rate_limited_bucket_waits_for_retry_after():
+    limiter = AdaptiveLimiter(rate=100.0, burst=1, jitter=0.0)
+    limiter.on_rate_limited("heartbeat", "ctr_1", retry_after=0.05)
+
+    start = time.monotonic()
+    await limiter.acquire("heartbeat", "ctr_1")
+    assert time.monotonic() - start >= 0.05
+
+    # Other containers are unaffected.
+    start = time.monotonic()
+    await limiter.acquire("heartbeat", "ctr_2")
+    assert time.monotonic() - start < 0.05
+
+
+async def test_disabled_limiter_never_waits():
+    limiter = AdaptiveLimiter(enabled=False)
+    limiter.on_rate_limited("heartbeat", "ctr_1", retry_after=60)
+    start = time.monotonic()
+    await limiter.acquire("heartbeat", "ctr_1")
+    assert time.monotonic() - start < 0.05
+
+
+def test_endpoint_key_collapses_ids():
+    assert endpoint_key("/api/v1/sdk/containers/ctr_1a/heartbeat") == "containers/{id}/heartbeat"
+    assert endpoint_key("deploy/42/logs?x=1") == "deploy/{id}/logs"
+    assert endpoint_key("deploy/list") == "deploy/list"
+
+
+def test_telemetry_backoff_floor_grows_with_429_ratio():
+    telemetry = Telemetry(alpha=0.5, contention_factor=10.0)
+    telemetry.record("containers/ctr_1/heartbeat", 0.2, 200)
+    telemetry.record("containers/ctr_2/heartbeat", 0.4, 200)
+    assert telemetry.backoff_floor("containers/x9/heartbeat") == pytest.approx(0.3)
+
+    telemetry.record("containers/ctr_1/heartbeat", 0.3, 429)
+    telemetry.record("containers/ctr_1/heartbeat", 0.3, None)
+    stats = telemetry.get("containers/ctr_1/heartbeat")
+    assert (stats.requests, stats.rate_limited, stats.errors) == (4, 1, 1)
+    assert telemetry.backoff_floor("containers/ctr_1/heartbeat") == pytest.approx(0.3 * 3.5)
+    assert telemetry.backoff_floor("deploy/list") == 0.0
+
+
+def test_rate_limited_honours_min_delay_floor():
+    limiter = AdaptiveLimiter(jitter=0.0)
+    limiter.on_rate_limited("heartbeat", "ctr_1", retry_after=0.0, min_delay=5.0)
+    bucket = limiter._buckets[("heartbeat", "ctr_1")]
+    assert bucket.blocked_until - time.monotonic() > 4.5
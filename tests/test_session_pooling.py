@@ -0,0 +1,108 @@
+"""
+Tests for HTTP session reuse across manager calls.
+
+Covers:
+- ``async with FleeksClient(...)`` opens one ``httpx.AsyncClient`` that every
+  manager call reuses, and closes it on exit.
+- Concurrent requests (``asyncio.gather``) share that single pooled client.
+- A closed client lazily opens a fresh session on its next request.
+- ``prewarm()`` opens the connection once (best-effort), and runs on
+  context-manager entry with ``prewarm=True``.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from fleeks_sdk import client as client_module
+from fleeks_sdk.client import FleeksClient
+
+
+API_KEY = "fleeks_" + "x" * 40
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/embeds"):
+        return httpx.Response(200, json={"embeds": [{"id": "emb_1", "name": "demo"}]})
+    embed_id = request.url.path.rsplit("/", 1)[-1]
+    return httpx.Response(200, json={"id": embed_id, "name": "demo"})
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Record every httpx.AsyncClient the SDK creates."""
+    created = []
+    real = httpx.AsyncClient
+
+    def factory(*args, **kwargs):
+        session = real(*args, **kwargs)
+        created.append(session)
+        return session
+
+    monkeypatch.setattr(client_module.httpx, "AsyncClient", factory)
+    return created
+
+
+def _client(handler=_handler, **kwargs) -> FleeksClient:
+    return FleeksClient(
+        api_key=API_KEY,
+        base_url="https://api.test",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+async def test_context_manager_reuses_one_session(sessions):
+    async with _client() as client:
+        await client.embeds.list()
+        await client.embeds.get("emb_1")
+        await client.embeds.delete("emb_1")
+        assert len(sessions) == 1
+        assert client._client is sessions[0]
+
+    assert client._client is None
+    assert sessions[0].is_closed
+
+
+async def test_concurrent_requests_share_the_session(sessions):
+    async with _client() as client:
+        embeds = await asyncio.gather(*(client.embeds.get(f"emb_{i}") for i in range(20)))
+
+    assert [e.id for e in embeds] == [f"emb_{i}" for i in range(20)]
+    assert len(sessions) == 1
+
+
+async def test_session_reopens_after_close(sessions):
+    client = _client()
+    await client.embeds.get("emb_1")
+    await client.close()
+    await client.embeds.get("emb_1")
+
+    assert len(sessions) == 2
+    assert sessions[0].is_closed and not sessions[1].is_closed
+    await client.close()
+
+
+async def test_prewarm_is_idempotent_and_runs_on_entry():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path))
+        return _handler(request)
+
+    async with _client(handler, prewarm=True) as client:
+        await client.prewarm()
+        await client.embeds.get("emb_1")
+
+    assert seen == [("HEAD", "/health"), ("GET", "/api/v1/sdk/embeds/emb_1")]
+
+
+async def test_prewarm_ignores_connection_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("unreachable", request=request)
+
+    client = _client(handler)
+    await client.prewarm()
+    assert client._prewarmed is False
+    await client.close()